@@ -0,0 +1,399 @@
+import abc
+import os
+import select
+import socket
+import ssl
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+from urllib.parse import unquote, urlparse
+
+
+MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 300.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        if self.max_size <= 0:
+            return
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class AbstractCache(abc.ABC):
+    @abc.abstractmethod
+    def get(self, scope: str, field: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, scope: str, field: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate(self, scope: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def stats(self) -> dict:
+        raise NotImplementedError
+
+
+class InMemoryCache(AbstractCache):
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 300.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.entries = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds, clock=clock)
+
+    def get(self, scope: str, field: str) -> Optional[bytes]:
+        value = self.entries.get((scope, field))
+        return None if value is MISSING else value
+
+    def set(self, scope: str, field: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        self.entries.set((scope, field), value, ttl_seconds)
+
+    def invalidate(self, scope: str) -> None:
+        self.entries.invalidate(lambda key: key[0] == scope)
+
+    def stats(self) -> dict:
+        return {"backend": "memory", **self.entries.stats()}
+
+
+class RespError(Exception):
+    pass
+
+
+class RespConnection:
+    def __init__(self, host: str, port: int = 6379, password: Optional[str] = None, username: Optional[str] = None,
+                 db: int = 0, use_ssl: bool = False, timeout: float = 1.0) -> None:
+        self.host = host
+        self.port = port
+        self.password = password
+        self.username = username
+        self.db = db
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self._socket = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 1.0) -> "RespConnection":
+        parsed = urlparse(url)
+        db = parsed.path.lstrip('/')
+        return cls(
+            host=parsed.hostname or 'localhost',
+            port=parsed.port or 6379,
+            password=unquote(parsed.password) if parsed.password else None,
+            username=unquote(parsed.username) if parsed.username else None,
+            db=int(db) if db else 0,
+            use_ssl=parsed.scheme == 'rediss',
+            timeout=timeout
+        )
+
+    def _connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        if self.use_ssl:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=self.host)
+        self._socket = sock
+        self._reader = sock.makefile('rb')
+        if self.password:
+            auth = ('AUTH', self.username, self.password) if self.username else ('AUTH', self.password)
+            self._roundtrip([auth])
+        if self.db:
+            self._roundtrip([('SELECT', self.db)])
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._socket is not None:
+            try:
+                self._reader.close()
+                self._socket.close()
+            except OSError:
+                pass
+        self._socket = None
+        self._reader = None
+
+    @staticmethod
+    def _encode_command(args) -> bytes:
+        parts = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            if isinstance(arg, bytes):
+                data = arg
+            elif isinstance(arg, (int, float)):
+                data = str(arg).encode('ascii')
+            else:
+                data = str(arg).encode('utf-8')
+            parts.append(b'$%d\r\n%s\r\n' % (len(data), data))
+        return b''.join(parts)
+
+    def read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by cache server")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b'+':
+            return body.decode('utf-8')
+        if prefix == b'-':
+            return RespError(body.decode('utf-8'))
+        if prefix == b':':
+            return int(body)
+        if prefix == b'$':
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if prefix == b'*':
+            length = int(body)
+            if length < 0:
+                return None
+            return [self.read_reply() for _ in range(length)]
+        raise ConnectionError(f"Unexpected reply from cache server: {line!r}")
+
+    def _roundtrip(self, commands) -> list:
+        self._socket.sendall(b''.join(self._encode_command(command) for command in commands))
+        replies = [self.read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+    def _closed_by_server(self) -> bool:
+        readable, _, _ = select.select([self._socket], [], [], 0)
+        return bool(readable)
+
+    def execute_many(self, *commands) -> list:
+        with self._lock:
+            for attempt in range(2):
+                sent = False
+                try:
+                    if self._socket is not None and self._closed_by_server():
+                        self._close()
+                    if self._socket is None:
+                        self._connect()
+                    sent = True
+                    return self._roundtrip(commands)
+                except (OSError, ConnectionError):
+                    self._close()
+                    if attempt or sent:
+                        raise
+
+    def execute(self, *args) -> Any:
+        return self.execute_many(args)[0]
+
+    def subscribe(self, channel: str) -> None:
+        with self._lock:
+            if self._socket is None:
+                self._connect()
+            self._socket.settimeout(None)
+            self._socket.sendall(self._encode_command(('SUBSCRIBE', channel)))
+            self.read_reply()
+
+
+class RespCache(AbstractCache):
+    KEY_PREFIX = 'equityalchemy:cache:'
+    INVALIDATION_CHANNEL = 'equityalchemy:invalidate'
+    RETRY_AFTER_SECONDS = 5.0
+
+    _EXPIRY_HEADER = struct.Struct('<d')
+
+    def __init__(self, connection: RespConnection, ttl_seconds: float = 300.0, clock: Callable[[], float] = time.time) -> None:
+        self.connection = connection
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._unavailable_until = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _key(self, scope: str) -> str:
+        return f"{self.KEY_PREFIX}{scope}"
+
+    def _call(self, *commands) -> Optional[list]:
+        if time.monotonic() < self._unavailable_until:
+            return None
+        try:
+            return self.connection.execute_many(*commands)
+        except (OSError, ConnectionError, RespError) as e:
+            self.errors += 1
+            self._unavailable_until = time.monotonic() + self.RETRY_AFTER_SECONDS
+            print(f"Shared cache unavailable, falling back to local reads: {e}")
+            return None
+
+    def get(self, scope: str, field: str) -> Optional[bytes]:
+        replies = self._call(('HGET', self._key(scope), field))
+        value = replies[0] if replies else None
+        if value is not None and len(value) >= self._EXPIRY_HEADER.size:
+            (expires_at,) = self._EXPIRY_HEADER.unpack_from(value)
+            if expires_at > self._clock():
+                self.hits += 1
+                return value[self._EXPIRY_HEADER.size:]
+        self.misses += 1
+        return None
+
+    def set(self, scope: str, field: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        key = self._key(scope)
+        self._call(
+            ('HSET', key, field, self._EXPIRY_HEADER.pack(self._clock() + ttl_seconds) + value),
+            ('EXPIRE', key, int(self.ttl_seconds))
+        )
+
+    def invalidate(self, scope: str) -> None:
+        self._call(
+            ('DEL', self._key(scope)),
+            ('PUBLISH', self.INVALIDATION_CHANNEL, scope)
+        )
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "resp",
+            "host": self.connection.host,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class TieredCache(AbstractCache):
+    def __init__(self, local: InMemoryCache, shared: RespCache) -> None:
+        self.local = local
+        self.shared = shared
+        self._listener = None
+        self._stopped = threading.Event()
+
+    def get(self, scope: str, field: str) -> Optional[bytes]:
+        value = self.local.get(scope, field)
+        if value is not None:
+            return value
+        value = self.shared.get(scope, field)
+        if value is not None:
+            self.local.set(scope, field, value)
+        return value
+
+    def set(self, scope: str, field: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        self.local.set(scope, field, value, ttl_seconds)
+        self.shared.set(scope, field, value, ttl_seconds)
+
+    def invalidate(self, scope: str) -> None:
+        self.local.invalidate(scope)
+        self.shared.invalidate(scope)
+
+    def stats(self) -> dict:
+        return {"backend": "tiered", "local": self.local.stats(), "shared": self.shared.stats()}
+
+    def start_invalidation_listener(self, connection_factory: Callable[[], RespConnection]) -> None:
+        if self._listener is not None:
+            return
+        self._listener = threading.Thread(
+            target=self._listen_for_invalidations,
+            args=(connection_factory,),
+            name="cache-invalidation-listener",
+            daemon=True
+        )
+        self._listener.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _listen_for_invalidations(self, connection_factory: Callable[[], RespConnection]) -> None:
+        while not self._stopped.is_set():
+            connection = connection_factory()
+            try:
+                connection.subscribe(RespCache.INVALIDATION_CHANNEL)
+                while not self._stopped.is_set():
+                    message = connection.read_reply()
+                    if isinstance(message, list) and len(message) == 3 and message[0] == b'message':
+                        self.local.invalidate(message[2].decode('utf-8'))
+            except (OSError, ConnectionError, RespError) as e:
+                print(f"Cache invalidation listener disconnected: {e}")
+                self.local.entries.clear()
+                self._stopped.wait(RespCache.RETRY_AFTER_SECONDS)
+            finally:
+                connection.close()
+
+
+def build_cache(url: Optional[str] = None) -> AbstractCache:
+    local = InMemoryCache(
+        max_size=int(os.getenv("CACHE_MAX_SIZE", "256")),
+        ttl_seconds=float(os.getenv("CACHE_TTL_SECONDS", "300"))
+    )
+    if not url:
+        return local
+
+    shared = RespCache(RespConnection.from_url(url), ttl_seconds=float(os.getenv("SHARED_CACHE_TTL_SECONDS", "3600")))
+    cache = TieredCache(local, shared)
+    cache.start_invalidation_listener(lambda: RespConnection.from_url(url))
+    return cache
+
+
+_shared_cache: Optional[AbstractCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> AbstractCache:
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = build_cache(os.getenv("CACHE_URL"))
+    return _shared_cache
@@ -0,0 +1,60 @@
+import csv
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from domain.company_directory import CompanyDirectory, CompanyEntry
+
+
+class CsvCompanyDirectorySource:
+    def __init__(self, csv_path: str, reload_interval_seconds: float = 30.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.csv_path = csv_path
+        self.reload_interval_seconds = reload_interval_seconds
+        self._clock = clock
+        self._directory: Optional[CompanyDirectory] = None
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _read_entries(self) -> list[CompanyEntry]:
+        with open(self.csv_path, 'r', encoding='utf-8') as file:
+            return [
+                CompanyEntry(name=row.get('name', '').strip(), ticker=row.get('ticker', '').strip())
+                for row in csv.DictReader(file)
+            ]
+
+    def _current_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.csv_path).st_mtime
+        except OSError:
+            return None
+
+    def get(self) -> CompanyDirectory:
+        directory = self._directory
+        if directory is not None and self._clock() - self._checked_at < self.reload_interval_seconds:
+            return directory
+
+        with self._lock:
+            if self._directory is not None and self._clock() - self._checked_at < self.reload_interval_seconds:
+                return self._directory
+            self._checked_at = self._clock()
+            mtime = self._current_mtime()
+            if self._directory is not None and mtime == self._mtime:
+                return self._directory
+
+            popularity = self._directory.popularity if self._directory is not None else None
+            try:
+                entries = self._read_entries() if mtime is not None else []
+            except (OSError, csv.Error, UnicodeDecodeError) as e:
+                print(f"Error reading CSV file: {e}")
+                if self._directory is not None:
+                    return self._directory
+                entries = []
+            if mtime is None:
+                print(f"CSV file not found at: {self.csv_path}")
+
+            self._directory = CompanyDirectory(entries, popularity)
+            self._mtime = mtime
+            print(f"Loaded {len(self._directory)} companies from {self.csv_path}")
+            return self._directory
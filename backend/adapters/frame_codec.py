@@ -0,0 +1,103 @@
+import json
+import struct
+from io import StringIO
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+MAGIC = b'EQF1'
+LABEL_SEPARATOR = '\x1f'
+
+_HEADER = struct.Struct('<4sIII')
+_VALUE_DTYPE = np.dtype('<f8')
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _VALUE_DTYPE.itemsize - 1) // _VALUE_DTYPE.itemsize * _VALUE_DTYPE.itemsize
+
+
+def _encodable_labels(labels) -> bool:
+    return all(isinstance(label, str) and LABEL_SEPARATOR not in label for label in labels)
+
+
+def encode_frame(df: pd.DataFrame) -> Optional[bytes]:
+    if df is None:
+        return None
+    if not _encodable_labels(df.index) or not _encodable_labels(df.columns):
+        return None
+    if not all(pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype) for dtype in df.dtypes):
+        return None
+    try:
+        values = df.to_numpy(dtype=_VALUE_DTYPE, na_value=np.nan)
+    except (TypeError, ValueError):
+        return None
+
+    labels = LABEL_SEPARATOR.join(list(df.index) + list(df.columns)).encode('utf-8')
+    header = _HEADER.pack(MAGIC, len(df.index), len(df.columns), len(labels))
+    padding = b'\x00' * (_aligned(len(header) + len(labels)) - len(header) - len(labels))
+    return header + labels + padding + np.asfortranarray(values).tobytes(order='F')
+
+
+def is_encoded_frame(blob) -> bool:
+    return blob is not None and len(blob) >= _HEADER.size and bytes(blob[:len(MAGIC)]) == MAGIC
+
+
+def decode_frame(blob) -> pd.DataFrame:
+    if not is_encoded_frame(blob):
+        raise ValueError("Not an encoded frame")
+
+    buffer = memoryview(blob)
+    _, n_rows, n_cols, labels_size = _HEADER.unpack_from(buffer)
+    labels_start = _HEADER.size
+    labels = bytes(buffer[labels_start:labels_start + labels_size]).decode('utf-8')
+    labels = labels.split(LABEL_SEPARATOR) if n_rows + n_cols else []
+
+    values = np.frombuffer(
+        buffer,
+        dtype=_VALUE_DTYPE,
+        count=n_rows * n_cols,
+        offset=_aligned(labels_start + labels_size)
+    ).reshape((n_cols, n_rows)).T
+
+    return pd.DataFrame(values, index=labels[:n_rows], columns=labels[n_rows:], copy=False)
+
+
+_PAYLOAD_HEADER = struct.Struct('<I')
+
+
+def pack_frames(metadata: dict, frames: dict[str, Optional[pd.DataFrame]]) -> bytes:
+    chunks = []
+    frame_entries = []
+    for name, frame in frames.items():
+        if frame is None:
+            continue
+        blob = encode_frame(frame)
+        frame_format = 'binary'
+        if blob is None:
+            blob = frame.to_json(orient="split", date_format="iso").encode('utf-8')
+            frame_format = 'json'
+        frame_entries.append([name, frame_format, len(blob)])
+        chunks.append(blob)
+
+    header = json.dumps({'metadata': metadata, 'frames': frame_entries}).encode('utf-8')
+    return _PAYLOAD_HEADER.pack(len(header)) + header + b''.join(chunks)
+
+
+def unpack_frames(payload) -> tuple[dict, dict[str, pd.DataFrame]]:
+    buffer = memoryview(payload)
+    (header_size,) = _PAYLOAD_HEADER.unpack_from(buffer)
+    offset = _PAYLOAD_HEADER.size
+    header = json.loads(bytes(buffer[offset:offset + header_size]))
+    offset += header_size
+
+    frames = {}
+    for name, frame_format, size in header['frames']:
+        chunk = buffer[offset:offset + size]
+        offset += size
+        if frame_format == 'binary':
+            frames[name] = decode_frame(bytearray(chunk))
+        else:
+            frames[name] = pd.read_json(StringIO(bytes(chunk).decode('utf-8')), orient="split")
+    return header['metadata'], frames
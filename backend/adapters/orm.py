@@ -12,13 +12,17 @@ from sqlalchemy import (
     Boolean,
     BigInteger,
     Text,
+    LargeBinary,
     Numeric,
+    Float,
     Index,
+    UniqueConstraint,
     func,
+    text,
     create_engine,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import declarative_base, deferred, sessionmaker
 from sqlalchemy.types import TypeDecorator, CHAR
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
 
@@ -101,15 +105,24 @@ class CombinedFinancialStatementsORM(Base):
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     ticker = Column(String, index=True, nullable=False)
     company_name = Column(String, nullable=True)
-    form_type = Column(String, nullable=True)
-    data = Column(JSONType, nullable=False)
-    balance_sheet_data = Column(JSONType, nullable=True)
+    form_type = Column(String, nullable=False, default='')
+    data = deferred(Column(JSONType, nullable=False))
+    balance_sheet_data = deferred(Column(JSONType, nullable=True))
+    data_blob = deferred(Column(LargeBinary, nullable=True))
+    balance_sheet_blob = deferred(Column(LargeBinary, nullable=True))
+    frames_encoded_at = Column(DateTime(timezone=True), nullable=True)
+    balance_sheet_row_count = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     has_more_than_one_continuous_period = Column(Boolean, nullable=True)
     sec_filings_url = Column(String, nullable=True)
+    needs_refinement = Column(Boolean, nullable=True, default=False)
+    refinement_claimed_at = Column(DateTime(timezone=True), nullable=True)
 
     __table_args__ = (
+        UniqueConstraint('ticker', 'form_type', name='uq_combined_financial_statements_ticker_form_type'),
+        Index('ix_combined_financial_statements_ticker_pattern', 'ticker', postgresql_ops={'ticker': 'text_pattern_ops'}),
+        Index('ix_combined_financial_statements_balance_sheet_row_count', 'balance_sheet_row_count', 'ticker'),
         {"schema": None},  # Don't use schema for SQLite compatibility
     )
 
@@ -144,6 +157,94 @@ class CompanyORM(Base):
     )
 
 
+class IndexMappingORM(Base):
+    __tablename__ = 'index_mappings'
+
+    cache_key = Column(String(64), primary_key=True)
+    mapping = Column(JSONType, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        {"schema": None},
+    )
+
+
+class TagEquivalenceORM(Base):
+    __tablename__ = 'tag_equivalences'
+
+    source_tag = Column(String, primary_key=True)
+    target_tag = Column(String, primary_key=True)
+    occurrences = Column(Integer, nullable=False, default=1)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index('ix_tag_equivalences_target_tag', 'target_tag'),
+        {"schema": None},
+    )
+
+
+class ReadableNameORM(Base):
+    __tablename__ = 'readable_names'
+
+    tag = Column(String, primary_key=True)
+    readable_name = Column(String, nullable=True)
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        {"schema": None},
+    )
+
+
+class BuildJobORM(Base):
+    __tablename__ = 'build_jobs'
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    ticker = Column(String, nullable=False)
+    form_type = Column(String, nullable=False, default='')
+    status = Column(String, nullable=False, default='queued')
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index(
+            'uq_build_jobs_active_ticker_form_type', 'ticker', 'form_type',
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+            sqlite_where=text("status IN ('queued', 'running')")
+        ),
+        Index('ix_build_jobs_status_created_at', 'status', 'created_at'),
+        {"schema": None},
+    )
+
+
+class FinancialFactORM(Base):
+    __tablename__ = 'financial_facts'
+
+    ticker = Column(String, primary_key=True)
+    form_type = Column(String, primary_key=True)
+    statement_type = Column(String, primary_key=True)
+    metric = Column(String, primary_key=True)
+    period_start = Column(Date, primary_key=True)
+    period_end = Column(Date, primary_key=True)
+    value = Column(Float, nullable=False)
+    source_accession = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index('ix_financial_facts_metric_period_end', 'metric', 'period_end'),
+        Index('ix_financial_facts_ticker_metric_period_end', 'ticker', 'metric', 'period_end'),
+        {"schema": None},
+    )
+
+
 def get_session_factory(database_url: str):
     engine = create_engine(database_url, pool_pre_ping=True)
     return sessionmaker(bind=engine)
@@ -2,24 +2,30 @@ import abc
 import requests
 
 from dotenv import load_dotenv
-import yfinance as yf
 from domain import model
 from adapters.filing_mapper import FilingMapper
-from sec_api import XbrlApi, QueryApi
+from adapters import metrics
+from adapters.cache import AbstractCache, get_shared_cache
+from adapters.frame_codec import decode_frame, encode_frame, is_encoded_frame, pack_frames, unpack_frames
 import os
+import csv
+import io
 import json
-import google.generativeai as genai
+import hashlib
+import uuid
+import time
 import traceback
 import pandas as pd
-from typing import Optional, Iterable
-from sqlalchemy import select, and_
-from sqlalchemy.orm import Session
-from adapters.orm import CombinedFinancialStatementsORM, CompanyORM
+from typing import Optional, Iterable, Iterator
+from sqlalchemy import Engine, select, and_, or_, delete, case, event, func, text, tuple_
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.dialects import postgresql, sqlite
+from adapters.orm import CombinedFinancialStatementsORM, CompanyORM, FinancialFactORM, IndexMappingORM, TagEquivalenceORM, ReadableNameORM, BuildJobORM
 from typing import Protocol
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from domain import (
-    StockTicker, PricePoint, Company
+    StockTicker, PricePoint, Company, BuildJob
 )
 from typing import List
 
@@ -30,8 +36,10 @@ class YFinanceMarketDataProvider(model.MarketDataProvider):
     def __init__(self):
         pass
 
+    @metrics.track("market_data")
     def fetch_prices(self, ticker: str, start_date: date, end_date: date) -> List[PricePoint]:
         try:
+            import yfinance as yf
             stock = yf.Ticker(ticker)
             stock_data = stock.history(start=start_date, end=end_date)
 
@@ -54,6 +62,34 @@ class YFinanceMarketDataProvider(model.MarketDataProvider):
             print(f"Error fetching data for {ticker}: {e}")
             return []
 
+    @metrics.track("market_data")
+    def fetch_prices_many(self, tickers: Iterable[str], start_date: date, end_date: date) -> dict[str, List[PricePoint]]:
+        tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        if not tickers:
+            return {}
+        try:
+            import yfinance as yf
+            data = yf.download(
+                tickers, start=start_date, end=end_date, group_by='ticker',
+                auto_adjust=True, progress=False, threads=True
+            )
+        except Exception as e:
+            print(f"Error fetching data for {', '.join(tickers)}: {e}")
+            return {ticker: [] for ticker in tickers}
+
+        prices = {}
+        for ticker in tickers:
+            if isinstance(data.columns, pd.MultiIndex):
+                frame = data[ticker] if ticker in data.columns.get_level_values(0) else pd.DataFrame()
+            else:
+                frame = data
+            closes = frame['Close'].dropna() if 'Close' in frame.columns else pd.Series(dtype=float)
+            prices[ticker] = [
+                PricePoint(date=pd.to_datetime(day).to_pydatetime(), price=Decimal(str(round(close, 2))))
+                for day, close in closes.items()
+            ]
+        return prices
+
 
 
 
@@ -80,6 +116,7 @@ class FakeMarketDataProvider(model.MarketDataProvider):
 class SECFilingRepository():
     def __init__(self):
         self.headers = {"User-Agent": os.getenv("USER_AGENT")}
+        from sec_api import QueryApi
         self.queryApi = QueryApi(os.getenv("SEC_API_KEY"))
 
     def get_cik_by_ticker(self, ticker):
@@ -164,6 +201,7 @@ class SECFilingRepository():
         log_file.close()
         return url_strings, cik_list
 
+    @metrics.track("sec_submissions")
     def get_filings(self, cik):
         submissions_url = f"https://data.sec.gov/submissions/CIK{cik}.json"
         data = self._make_request(submissions_url)
@@ -206,9 +244,11 @@ class SECFilingRepository():
         return filing.data.get('CoverPage', {})
 
     def get_filing_data(self, cik, accession_number, primary_document):
+        from sec_api import XbrlApi
         xbrlApi = XbrlApi(os.getenv("SEC_API_KEY"))
         try:
-            data = xbrlApi.xbrl_to_json(htm_url=self.get_filing_url(cik, accession_number, primary_document))
+            with metrics.track("sec_xbrl_fetch"):
+                data = xbrlApi.xbrl_to_json(htm_url=self.get_filing_url(cik, accession_number, primary_document))
             cover_page = FilingMapper.map_cover_page_from_api(data) if data else None
             return data, cover_page
         except Exception as e:
@@ -308,6 +348,10 @@ class CompanyRepository(Protocol):
     def get_by_ticker(self, ticker: str) -> Optional[Company]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def get_by_tickers(self, tickers: Iterable[str]) -> dict[str, Company]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def update(self, company: Company) -> None:
         raise NotImplementedError
@@ -364,33 +408,46 @@ class PostgresCompanyRepository(CompanyRepository):
             orm_company.location = company.location
             orm_company.sec_api_id = company.sec_api_id
 
+    @staticmethod
+    def _to_domain(orm_company: CompanyORM) -> Company:
+        return Company(
+            name=orm_company.name,
+            ticker=orm_company.ticker,
+            shares_outstanding=orm_company.shares_outstanding,
+            cik=orm_company.cik,
+            cusip=orm_company.cusip,
+            exchange=orm_company.exchange,
+            is_delisted=orm_company.is_delisted,
+            category=orm_company.category,
+            sector=orm_company.sector,
+            industry=orm_company.industry,
+            sic=orm_company.sic,
+            sic_sector=orm_company.sic_sector,
+            sic_industry=orm_company.sic_industry,
+            fama_sector=orm_company.fama_sector,
+            fama_industry=orm_company.fama_industry,
+            currency=orm_company.currency,
+            location=orm_company.location,
+            sec_api_id=orm_company.sec_api_id
+        )
+
     def get_by_ticker(self, ticker: str) -> Optional[Company]:
         orm_company = self.session.execute(
             select(CompanyORM).where(CompanyORM.ticker == ticker)
         ).scalar_one_or_none()
         if orm_company:
-            return Company(
-                name=orm_company.name,
-                ticker=orm_company.ticker,
-                shares_outstanding=orm_company.shares_outstanding,
-                cik=orm_company.cik,
-                cusip=orm_company.cusip,
-                exchange=orm_company.exchange,
-                is_delisted=orm_company.is_delisted,
-                category=orm_company.category,
-                sector=orm_company.sector,
-                industry=orm_company.industry,
-                sic=orm_company.sic,
-                sic_sector=orm_company.sic_sector,
-                sic_industry=orm_company.sic_industry,
-                fama_sector=orm_company.fama_sector,
-                fama_industry=orm_company.fama_industry,
-                currency=orm_company.currency,
-                location=orm_company.location,
-                sec_api_id=orm_company.sec_api_id
-            )
+            return self._to_domain(orm_company)
         return None
 
+    def get_by_tickers(self, tickers: Iterable[str]) -> dict[str, Company]:
+        tickers = list(set(tickers))
+        if not tickers:
+            return {}
+        orm_companies = self.session.execute(
+            select(CompanyORM).where(CompanyORM.ticker.in_(tickers))
+        ).scalars().all()
+        return {orm_company.ticker: self._to_domain(orm_company) for orm_company in orm_companies}
+
 
 class LLMRepository:
     def __init__(self):
@@ -408,6 +465,7 @@ class LLMRepository:
         genai.configure(api_key=self.gemini_api_key)
         return genai.GenerativeModel('gemini-1.5-flash')
 
+    @metrics.track("llm_index_mapping")
     def map_dataframes(self, df1, df2, client=None, max_retries=2):
         import pandas as pd
         import traceback
@@ -520,6 +578,7 @@ class LLMRepository:
 
         return {}
 
+    @metrics.track("llm_readable_names")
     def make_index_readable(self, index_names: list[str], client=None, max_retries=2):
 
 
@@ -601,6 +660,350 @@ class LLMRepository:
 
         return {name: name for name in index_names}
 
+def _dialect_insert(session: Session, orm_class):
+    if session.get_bind().dialect.name == 'postgresql':
+        return postgresql.insert(orm_class)
+    return sqlite.insert(orm_class)
+
+
+def build_mapping_cache_key(base_indices: Iterable[str], current_indices: Iterable[str]) -> str:
+    payload = json.dumps([sorted(str(i) for i in base_indices), sorted(str(i) for i in current_indices)])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class IndexMappingRepository(Protocol):
+    @abc.abstractmethod
+    def get(self, base_indices: Iterable[str], current_indices: Iterable[str]) -> Optional[dict]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def add(self, base_indices: Iterable[str], current_indices: Iterable[str], mapping: dict) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def record_equivalences(self, mapping: dict) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_equivalences(self, tags: Iterable[str]) -> dict[str, set[str]]:
+        raise NotImplementedError
+
+
+class PostgresIndexMappingRepository(IndexMappingRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(self, base_indices: Iterable[str], current_indices: Iterable[str]) -> Optional[dict]:
+        cache_key = build_mapping_cache_key(base_indices, current_indices)
+        orm_obj = self.session.get(IndexMappingORM, cache_key)
+        if orm_obj is None:
+            return None
+        return dict(orm_obj.mapping)
+
+    def add(self, base_indices: Iterable[str], current_indices: Iterable[str], mapping: dict) -> None:
+        cache_key = build_mapping_cache_key(base_indices, current_indices)
+        stmt = _dialect_insert(self.session, IndexMappingORM).values(
+            cache_key=cache_key,
+            mapping=mapping
+        ).on_conflict_do_nothing(index_elements=['cache_key'])
+        self.session.execute(stmt)
+
+    def record_equivalences(self, mapping: dict) -> None:
+        for source_tag, target_tag in mapping.items():
+            if source_tag == target_tag:
+                continue
+            insert_stmt = _dialect_insert(self.session, TagEquivalenceORM).values(
+                source_tag=source_tag,
+                target_tag=target_tag,
+                occurrences=1
+            )
+            stmt = insert_stmt.on_conflict_do_update(
+                index_elements=['source_tag', 'target_tag'],
+                set_={'occurrences': TagEquivalenceORM.occurrences + 1}
+            )
+            self.session.execute(stmt)
+
+    def get_equivalences(self, tags: Iterable[str]) -> dict[str, set[str]]:
+        tags = list(tags)
+        if not tags:
+            return {}
+        rows = self.session.execute(
+            select(TagEquivalenceORM.source_tag, TagEquivalenceORM.target_tag).where(
+                (TagEquivalenceORM.source_tag.in_(tags)) | (TagEquivalenceORM.target_tag.in_(tags))
+            )
+        ).fetchall()
+        equivalences: dict[str, set[str]] = {}
+        for source_tag, target_tag in rows:
+            equivalences.setdefault(source_tag, set()).add(target_tag)
+            equivalences.setdefault(target_tag, set()).add(source_tag)
+        return equivalences
+
+
+class FakeIndexMappingRepository(IndexMappingRepository):
+    def __init__(self):
+        self.mappings = {}
+        self.equivalences = {}
+
+    def get(self, base_indices: Iterable[str], current_indices: Iterable[str]) -> Optional[dict]:
+        mapping = self.mappings.get(build_mapping_cache_key(base_indices, current_indices))
+        return dict(mapping) if mapping is not None else None
+
+    def add(self, base_indices: Iterable[str], current_indices: Iterable[str], mapping: dict) -> None:
+        self.mappings.setdefault(build_mapping_cache_key(base_indices, current_indices), dict(mapping))
+
+    def record_equivalences(self, mapping: dict) -> None:
+        for source_tag, target_tag in mapping.items():
+            if source_tag == target_tag:
+                continue
+            key = (source_tag, target_tag)
+            self.equivalences[key] = self.equivalences.get(key, 0) + 1
+
+    def get_equivalences(self, tags: Iterable[str]) -> dict[str, set[str]]:
+        tags = set(tags)
+        equivalences: dict[str, set[str]] = {}
+        for source_tag, target_tag in self.equivalences:
+            if source_tag in tags or target_tag in tags:
+                equivalences.setdefault(source_tag, set()).add(target_tag)
+                equivalences.setdefault(target_tag, set()).add(source_tag)
+        return equivalences
+
+
+class ReadableNameRepository(Protocol):
+    @abc.abstractmethod
+    def get_many(self, tags: Iterable[str]) -> dict[str, str]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def enqueue(self, tags: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def claim_pending(self, limit: int) -> list[str]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def add_many(self, readable_names: dict[str, str]) -> None:
+        raise NotImplementedError
+
+
+class PostgresReadableNameRepository(ReadableNameRepository):
+    CLAIM_TIMEOUT = timedelta(minutes=10)
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_many(self, tags: Iterable[str]) -> dict[str, str]:
+        tags = list(set(tags))
+        if not tags:
+            return {}
+        rows = self.session.execute(
+            select(ReadableNameORM.tag, ReadableNameORM.readable_name).where(
+                ReadableNameORM.tag.in_(tags),
+                ReadableNameORM.readable_name.is_not(None)
+            )
+        ).fetchall()
+        return {tag: readable_name for tag, readable_name in rows}
+
+    def enqueue(self, tags: Iterable[str]) -> None:
+        tags = list(set(tags))
+        if not tags:
+            return
+        stmt = _dialect_insert(self.session, ReadableNameORM).values(
+            [{'tag': tag} for tag in tags]
+        ).on_conflict_do_nothing(index_elements=['tag'])
+        self.session.execute(stmt)
+
+    def claim_pending(self, limit: int) -> list[str]:
+        now = datetime.now(timezone.utc)
+        rows = self.session.execute(
+            select(ReadableNameORM).where(
+                ReadableNameORM.readable_name.is_(None),
+                (ReadableNameORM.claimed_at.is_(None)) | (ReadableNameORM.claimed_at < now - self.CLAIM_TIMEOUT)
+            ).limit(limit).with_for_update(skip_locked=True)
+        ).scalars().all()
+        for row in rows:
+            row.claimed_at = now
+        return [row.tag for row in rows]
+
+    def add_many(self, readable_names: dict[str, str]) -> None:
+        if not readable_names:
+            return
+        insert_stmt = _dialect_insert(self.session, ReadableNameORM).values(
+            [{'tag': tag, 'readable_name': name} for tag, name in readable_names.items()]
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=['tag'],
+            set_={'readable_name': insert_stmt.excluded.readable_name, 'claimed_at': None}
+        )
+        self.session.execute(stmt)
+
+
+class FakeReadableNameRepository(ReadableNameRepository):
+    def __init__(self):
+        self.readable_names = {}
+        self.pending = []
+
+    def get_many(self, tags: Iterable[str]) -> dict[str, str]:
+        return {tag: self.readable_names[tag] for tag in set(tags) if tag in self.readable_names}
+
+    def enqueue(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            if tag not in self.readable_names and tag not in self.pending:
+                self.pending.append(tag)
+
+    def claim_pending(self, limit: int) -> list[str]:
+        claimed, self.pending = self.pending[:limit], self.pending[limit:]
+        return claimed
+
+    def add_many(self, readable_names: dict[str, str]) -> None:
+        self.readable_names.update(readable_names)
+        self.pending = [tag for tag in self.pending if tag not in readable_names]
+
+
+class BuildJobRepository(Protocol):
+    @abc.abstractmethod
+    def enqueue(self, ticker: str, form_type: Optional[str]) -> BuildJob:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get(self, job_id: str) -> Optional[BuildJob]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def claim_next(self, limit: int, max_running: int) -> list[BuildJob]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def heartbeat(self, jobs: Iterable[BuildJob]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def mark_succeeded(self, job_id: str, attempts: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def mark_failed(self, job_id: str, error: str, attempts: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+
+class PostgresBuildJobRepository(BuildJobRepository):
+    CLAIM_TIMEOUT = timedelta(minutes=10)
+    MAX_ATTEMPTS = 3
+    ACTIVE_STATUSES = (BuildJob.QUEUED, BuildJob.RUNNING)
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @staticmethod
+    def _to_domain(row: BuildJobORM) -> BuildJob:
+        return BuildJob(
+            id=str(row.id),
+            ticker=row.ticker,
+            form_type=row.form_type or None,
+            status=row.status,
+            error=row.error,
+            created_at=row.created_at,
+            finished_at=row.finished_at,
+            attempts=row.attempts or 0
+        )
+
+    def _get_orm(self, job_id: str) -> Optional[BuildJobORM]:
+        try:
+            job_uuid = uuid.UUID(str(job_id))
+        except ValueError:
+            return None
+        return self.session.get(BuildJobORM, job_uuid)
+
+    def enqueue(self, ticker: str, form_type: Optional[str]) -> BuildJob:
+        ticker = ticker.upper()
+        form_type = form_type or ''
+        stmt = _dialect_insert(self.session, BuildJobORM).values(
+            id=uuid.uuid4(), ticker=ticker, form_type=form_type, status=BuildJob.QUEUED, attempts=0
+        ).on_conflict_do_nothing(
+            index_elements=['ticker', 'form_type'],
+            index_where=BuildJobORM.status.in_(self.ACTIVE_STATUSES)
+        )
+        active = select(BuildJobORM).where(
+            BuildJobORM.ticker == ticker,
+            BuildJobORM.form_type == form_type,
+            BuildJobORM.status.in_(self.ACTIVE_STATUSES)
+        )
+        while True:
+            row = self.session.execute(stmt.returning(*BuildJobORM.__table__.c)).first()
+            if row is None:
+                row = self.session.execute(active).scalars().first()
+            if row is not None:
+                return self._to_domain(row)
+
+    def get(self, job_id: str) -> Optional[BuildJob]:
+        row = self._get_orm(job_id)
+        return self._to_domain(row) if row else None
+
+    def claim_next(self, limit: int, max_running: int) -> list[BuildJob]:
+        if self.session.get_bind().dialect.name == 'postgresql':
+            self.session.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"),
+                {'key': _advisory_lock_key('build_jobs:claim')}
+            )
+
+        now = datetime.now(timezone.utc)
+        last_seen = func.coalesce(BuildJobORM.heartbeat_at, BuildJobORM.started_at)
+        stale = and_(BuildJobORM.status == BuildJob.RUNNING, last_seen < now - self.CLAIM_TIMEOUT)
+        for row in self.session.execute(
+            select(BuildJobORM).where(stale, BuildJobORM.attempts >= self.MAX_ATTEMPTS)
+        ).scalars().all():
+            row.status = BuildJob.FAILED
+            row.error = f"Gave up after {row.attempts} attempts"
+            row.finished_at = now
+
+        running = self.session.execute(
+            select(func.count()).select_from(BuildJobORM).where(
+                BuildJobORM.status == BuildJob.RUNNING,
+                last_seen >= now - self.CLAIM_TIMEOUT
+            )
+        ).scalar_one()
+        limit = min(limit, max_running - running)
+        if limit <= 0:
+            return []
+
+        rows = self.session.execute(
+            select(BuildJobORM).where(
+                (BuildJobORM.status == BuildJob.QUEUED) | and_(stale, BuildJobORM.attempts < self.MAX_ATTEMPTS)
+            ).order_by(BuildJobORM.created_at).limit(limit).with_for_update(skip_locked=True)
+        ).scalars().all()
+        for row in rows:
+            row.status = BuildJob.RUNNING
+            row.started_at = now
+            row.heartbeat_at = now
+            row.attempts = (row.attempts or 0) + 1
+        self.session.flush()
+        return [self._to_domain(row) for row in rows]
+
+    def heartbeat(self, jobs: Iterable[BuildJob]) -> None:
+        now = datetime.now(timezone.utc)
+        for job in jobs:
+            row = self._get_orm(job.id)
+            if row is not None and row.status == BuildJob.RUNNING and row.attempts == job.attempts:
+                row.heartbeat_at = now
+
+    def _finish(self, job_id: str, status: str, error: Optional[str] = None, attempts: Optional[int] = None) -> None:
+        row = self._get_orm(job_id)
+        if row is None:
+            return
+        if attempts is not None and row.attempts != attempts:
+            print(f"Ignoring result of superseded attempt {attempts} for build job {job_id}")
+            return
+        row.status = status
+        row.error = error
+        row.finished_at = datetime.now(timezone.utc)
+
+    def mark_succeeded(self, job_id: str, attempts: Optional[int] = None) -> None:
+        self._finish(job_id, BuildJob.SUCCEEDED, attempts=attempts)
+
+    def mark_failed(self, job_id: str, error: str, attempts: Optional[int] = None) -> None:
+        self._finish(job_id, BuildJob.FAILED, error, attempts)
+
+
 class CombinedFinancialStatementsRepository(Protocol):
     @abc.abstractmethod
     def add(self, stmt: model.CombinedFinancialStatements) -> None:
@@ -610,10 +1013,38 @@ class CombinedFinancialStatementsRepository(Protocol):
     def add_many(self, stmts: Iterable[model.CombinedFinancialStatements]) -> None:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def upsert(self, stmt: model.CombinedFinancialStatements) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def bulk_upsert(self, stmts: Iterable[model.CombinedFinancialStatements]) -> int:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get(self, ticker: str, form_type: str) -> Optional[model.CombinedFinancialStatements]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def get_many(self, tickers: Iterable[str], form_type: str) -> dict[str, model.CombinedFinancialStatements]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def lock_statement_build(self, ticker: str, form_type: Optional[str]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_version(self, ticker: str, form_type: str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_income_statement(self, ticker: str, form_type: str) -> Optional[model.CombinedFinancialStatements]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_balance_sheet(self, ticker: str, form_type: str) -> Optional[model.CombinedFinancialStatements]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_by_ticker(self, ticker: str) -> list[model.CombinedFinancialStatements]:
         raise NotImplementedError
@@ -630,10 +1061,190 @@ class CombinedFinancialStatementsRepository(Protocol):
     def get_all_tickers(self) -> list[str]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def get_facts(self, ticker: str, metrics: Optional[Iterable[str]] = None, form_type: Optional[str] = None,
+                  statement_type: Optional[str] = None, period_end_from: Optional[date] = None,
+                  period_end_to: Optional[date] = None) -> list[model.FinancialFact]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_facts_for_tickers(self, tickers: Iterable[str], metrics: Optional[Iterable[str]] = None,
+                              statement_type: Optional[str] = None) -> list[model.FinancialFact]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_metric_facts(self, metric: str, form_type: Optional[str] = None, tickers: Optional[Iterable[str]] = None,
+                         period_end_from: Optional[date] = None, period_end_to: Optional[date] = None) -> list[model.FinancialFact]:
+        raise NotImplementedError
+
+
+_PENDING_CACHE_INVALIDATIONS = 'pending_statement_cache_invalidations'
+_PENDING_CACHE_FILLS = 'pending_statement_cache_fills'
+MIN_BALANCE_SHEET_ROWS = 4
+STATEMENT_COLUMNS = (
+    'ticker', 'company_name', 'form_type', 'data', 'balance_sheet_data', 'data_blob', 'balance_sheet_blob',
+    'balance_sheet_row_count', 'has_more_than_one_continuous_period', 'sec_filings_url', 'needs_refinement',
+    'frames_encoded_at'
+)
+BALANCE_SHEET_COLUMNS = ('balance_sheet_data', 'balance_sheet_blob', 'balance_sheet_row_count')
+FACT_COLUMNS = ('ticker', 'form_type', 'statement_type', 'metric', 'period_start', 'period_end', 'value', 'source_accession')
+COPY_NULL = '\\N'
+
+
+def _advisory_lock_key(name: str) -> int:
+    return int.from_bytes(hashlib.sha256(name.encode('utf-8')).digest()[:8], 'big', signed=True)
+
+
+def _copy_value(value) -> str:
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\x' + bytes(value).hex()
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _copy_lines(columns: list[str], rows: Iterable[dict]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(row.get(column)) for column in columns])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+class _CopySource(io.TextIOBase):
+    def __init__(self, lines: Iterator[str]) -> None:
+        self._lines = lines
+        self._pending = ''
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        chunks = [self._pending]
+        pending = len(self._pending)
+        while size is None or size < 0 or pending < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            pending += len(line)
+        data = ''.join(chunks)
+        if size is None or size < 0:
+            size = len(data)
+        self._pending = data[size:]
+        return data[:size]
+
+
+def _copy_rows(session: Session, table_name: str, columns: Iterable[str], rows: Iterable[dict]) -> None:
+    columns = list(columns)
+    lines = _copy_lines(columns, rows)
+    sql = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+    cursor = session.connection().connection.cursor()
+    try:
+        if hasattr(cursor, 'copy_expert'):
+            cursor.copy_expert(sql, _CopySource(lines))
+        else:
+            with cursor.copy(sql) as copy:
+                for line in lines:
+                    copy.write(line)
+    finally:
+        cursor.close()
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_statements(session: Session) -> None:
+    for cache, ticker in session.info.pop(_PENDING_CACHE_INVALIDATIONS, []):
+        cache.invalidate(ticker)
+    for cache, ticker, field, payload in session.info.pop(_PENDING_CACHE_FILLS, []):
+        cache.set(ticker, field, payload)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_CACHE_INVALIDATIONS, None)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_pending_fills(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_CACHE_FILLS, None)
+
+
+_QUERY_STARTED_AT = 'query_started_at'
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_QUERY_STARTED_AT, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _record_query_duration(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.get(_QUERY_STARTED_AT)
+    if started:
+        metrics.STAGE_DURATION.observe(time.perf_counter() - started.pop(), stage='db_query')
+
+
+@event.listens_for(Engine, 'handle_error')
+def _record_query_error(exception_context) -> None:
+    started = exception_context.connection.info.get(_QUERY_STARTED_AT) if exception_context.connection is not None else None
+    if started:
+        started.pop()
+    metrics.record_failure('db_query')
+
 
 class PostgresCombinedFinancialStatementsRepository(CombinedFinancialStatementsRepository):
-    def __init__(self, session: Session):
+    REFINEMENT_CLAIM_TIMEOUT = timedelta(minutes=10)
+
+    def __init__(self, session: Session, cache: Optional[AbstractCache] = None):
         self.session = session
+        self.cache = cache if cache is not None else get_shared_cache()
+
+    def _invalidate_cache(self, ticker: str) -> None:
+        self.cache.invalidate(ticker)
+        self.session.info.setdefault(_PENDING_CACHE_INVALIDATIONS, []).append((self.cache, ticker))
+
+    def _fill_cache(self, ticker: str, field: str, payload: bytes) -> None:
+        pending = self.session.info.get(_PENDING_CACHE_INVALIDATIONS, [])
+        if any(cache is self.cache and pending_ticker == ticker for cache, pending_ticker in pending):
+            self.session.info.setdefault(_PENDING_CACHE_FILLS, []).append((self.cache, ticker, field, payload))
+        else:
+            self.cache.set(ticker, field, payload)
+
+    @staticmethod
+    def _statement_cache_field(form_type: Optional[str], frames: str = 'statements') -> str:
+        return f"{frames}:{form_type}"
+
+    def _get_cached_statement(self, ticker: str, form_type: Optional[str],
+                              frames: str = 'statements') -> Optional[model.CombinedFinancialStatements]:
+        payload = self.cache.get(ticker, self._statement_cache_field(form_type, frames))
+        if payload is None:
+            return None
+        metadata, frames = unpack_frames(payload)
+        stmt = model.CombinedFinancialStatements([], [], metadata['ticker'], metadata['company_name'], metadata['form_type'])
+        stmt.df = frames.get('df', pd.DataFrame())
+        stmt.balance_sheet_df = frames.get('balance_sheet_df')
+        stmt.needs_refinement = metadata['needs_refinement']
+        return stmt
+
+    def _cache_statement(self, stmt: model.CombinedFinancialStatements,
+                         frames: str = 'statements') -> model.CombinedFinancialStatements:
+        metadata = {
+            'ticker': stmt.ticker,
+            'company_name': stmt.company_name,
+            'form_type': stmt.form_type,
+            'needs_refinement': stmt.needs_refinement,
+        }
+        payload = pack_frames(metadata, {'df': stmt.df, 'balance_sheet_df': stmt.balance_sheet_df})
+        self._fill_cache(stmt.ticker, self._statement_cache_field(stmt.form_type, frames), payload)
+        return stmt
 
     def _serialize(self, stmt: model.CombinedFinancialStatements) -> dict:
         result = {}
@@ -645,10 +1256,14 @@ class PostgresCombinedFinancialStatementsRepository(CombinedFinancialStatementsR
             if attr_name == 'df':
                 json_str = attr_value.to_json(orient="split", date_format="iso")
                 result['data'] = json.loads(json_str)
+                result['data_blob'] = encode_frame(attr_value)
+                result['frames_encoded_at'] = datetime.now(timezone.utc)
             elif attr_name == 'balance_sheet_df':
                 if attr_value is not None:
                     json_str = attr_value.to_json(orient="split", date_format="iso")
                     result['balance_sheet_data'] = json.loads(json_str)
+                    result['balance_sheet_blob'] = encode_frame(attr_value)
+                    result['balance_sheet_row_count'] = len(attr_value.index)
                 continue
             elif attr_name in ['financial_statements', 'source_filings']:
                 continue
@@ -661,14 +1276,34 @@ class PostgresCombinedFinancialStatementsRepository(CombinedFinancialStatementsR
 
         if not hasattr(stmt, 'sec_filings_url'):
             result['sec_filings_url'] = None
+        result['form_type'] = stmt.form_type or ''
 
         return result
 
-    def _deserialize_to_domain(self, orm_obj: CombinedFinancialStatementsORM) -> model.CombinedFinancialStatements:
+    @staticmethod
+    def _frame_loading(include_income: bool = True, include_balance_sheet: bool = True) -> tuple:
+        options = []
+        if include_income:
+            options.append(undefer(CombinedFinancialStatementsORM.data_blob))
+        if include_balance_sheet:
+            options.append(undefer(CombinedFinancialStatementsORM.balance_sheet_blob))
+        return tuple(options)
+
+    @staticmethod
+    def _load_frame(orm_obj: CombinedFinancialStatementsORM, blob_attr: str, json_attr: str) -> Optional[pd.DataFrame]:
         from io import StringIO
-        if getattr(orm_obj, 'data', None):
-            df = pd.read_json(StringIO(json.dumps(orm_obj.data)), orient="split")
-        else:
+        blob = getattr(orm_obj, blob_attr, None)
+        if is_encoded_frame(blob):
+            return decode_frame(bytearray(blob))
+        json_data = getattr(orm_obj, json_attr, None)
+        if json_data:
+            return pd.read_json(StringIO(json.dumps(json_data)), orient="split")
+        return None
+
+    def _deserialize_to_domain(self, orm_obj: CombinedFinancialStatementsORM, include_income: bool = True,
+                               include_balance_sheet: bool = True) -> model.CombinedFinancialStatements:
+        df = self._load_frame(orm_obj, 'data_blob', 'data') if include_income else None
+        if df is None:
             df = pd.DataFrame()
 
         stmt = model.CombinedFinancialStatements(
@@ -676,69 +1311,291 @@ class PostgresCombinedFinancialStatementsRepository(CombinedFinancialStatementsR
             source_filings=[],
             ticker=orm_obj.ticker,
             company_name=orm_obj.company_name,
-            form_type=orm_obj.form_type
+            form_type=orm_obj.form_type or None
         )
         stmt.df = df
-        if getattr(orm_obj, 'balance_sheet_data', None):
-            bs_df = pd.read_json(StringIO(json.dumps(orm_obj.balance_sheet_data)), orient="split")
+        bs_df = self._load_frame(orm_obj, 'balance_sheet_blob', 'balance_sheet_data') if include_balance_sheet else None
+        if bs_df is not None:
             stmt.balance_sheet_df = bs_df
+        stmt.needs_refinement = bool(getattr(orm_obj, 'needs_refinement', False))
         return stmt
 
-    def add(self, stmt: model.CombinedFinancialStatements) -> None:
-        data = self._serialize(stmt)
-        data['company_name'] = stmt.company_name
-        orm_obj = CombinedFinancialStatementsORM(**data)
-        self.session.add(orm_obj)
-
-    def add_or_update_balance_sheet(self, stmt: model.CombinedFinancialStatements) -> None:
-        existing = self.session.execute(
-            select(CombinedFinancialStatementsORM).where(
-                CombinedFinancialStatementsORM.ticker == stmt.ticker,
-                CombinedFinancialStatementsORM.form_type == '10-K'
+    def _replace_facts(self, ticker: str, form_type: Optional[str], statement_types: list[str],
+                       facts: list[model.FinancialFact]) -> None:
+        self.session.execute(
+            delete(FinancialFactORM).where(
+                FinancialFactORM.ticker == ticker,
+                FinancialFactORM.form_type == (form_type or ''),
+                FinancialFactORM.statement_type.in_(statement_types)
             )
-        ).scalar_one_or_none()
+        )
+        rows = self._fact_rows(statement_types, facts)
+        if rows:
+            self.session.execute(FinancialFactORM.__table__.insert(), rows)
+
+    @staticmethod
+    def _fact_rows(statement_types: list[str], facts: list[model.FinancialFact]) -> list[dict]:
+        return [
+            {
+                'ticker': fact.ticker,
+                'form_type': fact.form_type or '',
+                'statement_type': fact.statement_type,
+                'metric': fact.metric,
+                'period_start': fact.period_start,
+                'period_end': fact.period_end,
+                'value': fact.value,
+                'source_accession': fact.source_accession,
+            }
+            for fact in facts if fact.statement_type in statement_types
+        ]
+
+    @staticmethod
+    def _statement_types(stmt: model.CombinedFinancialStatements) -> list[str]:
+        statement_types = [model.FinancialFact.INCOME_STATEMENT]
+        if stmt.balance_sheet_df is not None:
+            statement_types.append(model.FinancialFact.BALANCE_SHEET)
+        return statement_types
 
+    def _statement_row(self, stmt: model.CombinedFinancialStatements) -> dict:
         serialized = self._serialize(stmt)
-        if 'balance_sheet_data' not in serialized and 'data' in serialized:
-            serialized['balance_sheet_data'] = serialized['data']
-            del serialized['data']
-        if existing is None:
-            serialized['company_name'] = stmt.company_name
-            orm_obj = CombinedFinancialStatementsORM(**serialized)
-            self.session.add(orm_obj)
-        else:
-            if 'balance_sheet_data' in serialized:
-                existing.balance_sheet_data = serialized['balance_sheet_data']
-            existing.company_name = stmt.company_name
+        serialized['company_name'] = stmt.company_name
+        return {column: serialized.get(column) for column in STATEMENT_COLUMNS}
+
+    @staticmethod
+    def _upsert_assignments(excluded, table) -> dict:
+        assignments = {
+            column: excluded[column] for column in STATEMENT_COLUMNS
+            if column not in ('ticker', 'form_type')
+        }
+        for column in BALANCE_SHEET_COLUMNS:
+            assignments[column] = case(
+                (excluded.balance_sheet_row_count.is_(None), table.c[column]), else_=excluded[column]
+            )
+        assignments['updated_at'] = func.now()
+        return assignments
+
+    @staticmethod
+    def _fact_to_domain(orm_obj: FinancialFactORM) -> model.FinancialFact:
+        return model.FinancialFact(
+            ticker=orm_obj.ticker,
+            form_type=orm_obj.form_type or None,
+            statement_type=orm_obj.statement_type,
+            metric=orm_obj.metric,
+            period_start=orm_obj.period_start,
+            period_end=orm_obj.period_end,
+            value=orm_obj.value,
+            source_accession=orm_obj.source_accession
+        )
+
+    def add(self, stmt: model.CombinedFinancialStatements) -> None:
+        self.upsert(stmt)
+
+    def add_or_update_balance_sheet(self, stmt: model.CombinedFinancialStatements) -> None:
+        balance_sheet = model.CombinedFinancialStatements([], stmt.source_filings, stmt.ticker, stmt.company_name, stmt.form_type)
+        balance_sheet.df = stmt.df
+        balance_sheet.balance_sheet_df = stmt.balance_sheet_df if stmt.balance_sheet_df is not None else stmt.df
+
+        insert_stmt = _dialect_insert(self.session, CombinedFinancialStatementsORM).values(**self._statement_row(balance_sheet))
+        assignments = {column: insert_stmt.excluded[column] for column in BALANCE_SHEET_COLUMNS + ('company_name',)}
+        self.session.execute(insert_stmt.on_conflict_do_update(
+            index_elements=['ticker', 'form_type'],
+            set_={**assignments, 'updated_at': func.now()}
+        ))
+        self._invalidate_cache(stmt.ticker)
+        self._replace_facts(stmt.ticker, stmt.form_type, [model.FinancialFact.BALANCE_SHEET], balance_sheet.to_financial_facts())
 
     def add_many(self, stmts: Iterable[model.CombinedFinancialStatements]) -> None:
-        mappings = [self._serialize(stmt) for stmt in stmts]
-        self.session.bulk_insert_mappings(CombinedFinancialStatementsORM, mappings)
+        self.bulk_upsert(stmts)
+
+    @metrics.track("db_statements_write")
+    def upsert(self, stmt: model.CombinedFinancialStatements) -> None:
+        table = CombinedFinancialStatementsORM.__table__
+        insert_stmt = _dialect_insert(self.session, CombinedFinancialStatementsORM).values(**self._statement_row(stmt))
+        self.session.execute(insert_stmt.on_conflict_do_update(
+            index_elements=['ticker', 'form_type'],
+            set_=self._upsert_assignments(insert_stmt.excluded, table)
+        ))
+        self._invalidate_cache(stmt.ticker)
+        self._replace_facts(stmt.ticker, stmt.form_type, self._statement_types(stmt), stmt.to_financial_facts())
+
+    @metrics.track("db_statements_write")
+    def bulk_upsert(self, stmts: Iterable[model.CombinedFinancialStatements]) -> int:
+        latest = {(stmt.ticker, stmt.form_type or ''): stmt for stmt in stmts}
+        if not latest:
+            return 0
+
+        rows = [self._statement_row(stmt) for stmt in latest.values()]
+        fact_keys = []
+        fact_rows = []
+        for stmt in latest.values():
+            statement_types = self._statement_types(stmt)
+            fact_keys.extend((stmt.ticker, stmt.form_type or '', statement_type) for statement_type in statement_types)
+            fact_rows.extend(self._fact_rows(statement_types, stmt.to_financial_facts()))
+
+        if self.session.get_bind().dialect.name == 'postgresql':
+            self._copy_upsert_statements(rows)
+        else:
+            table = CombinedFinancialStatementsORM.__table__
+            insert_stmt = _dialect_insert(self.session, CombinedFinancialStatementsORM).values(rows)
+            self.session.execute(insert_stmt.on_conflict_do_update(
+                index_elements=['ticker', 'form_type'],
+                set_=self._upsert_assignments(insert_stmt.excluded, table)
+            ))
+
+        self.session.execute(
+            delete(FinancialFactORM).where(
+                tuple_(FinancialFactORM.ticker, FinancialFactORM.form_type, FinancialFactORM.statement_type).in_(fact_keys)
+            )
+        )
+        if fact_rows:
+            if self.session.get_bind().dialect.name == 'postgresql':
+                _copy_rows(self.session, FinancialFactORM.__tablename__, FACT_COLUMNS, fact_rows)
+            else:
+                self.session.execute(FinancialFactORM.__table__.insert(), fact_rows)
+
+        for ticker in {ticker for ticker, _ in latest}:
+            self._invalidate_cache(ticker)
+        return len(rows)
+
+    def _copy_upsert_statements(self, rows: list[dict]) -> None:
+        staging = 'combined_financial_statements_staging'
+        columns = ('id',) + STATEMENT_COLUMNS
+        column_list = ', '.join(columns)
+        assignments = ', '.join(
+            f"{column} = CASE WHEN EXCLUDED.balance_sheet_row_count IS NULL "
+            f"THEN combined_financial_statements.{column} ELSE EXCLUDED.{column} END"
+            if column in BALANCE_SHEET_COLUMNS else f"{column} = EXCLUDED.{column}"
+            for column in STATEMENT_COLUMNS if column not in ('ticker', 'form_type')
+        )
 
+        self.session.execute(text(f"DROP TABLE IF EXISTS {staging}"))
+        self.session.execute(text(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM combined_financial_statements WITH NO DATA"
+        ))
+        _copy_rows(self.session, staging, columns, ({'id': uuid.uuid4(), **row} for row in rows))
+        self.session.execute(text(
+            f"INSERT INTO combined_financial_statements ({column_list}) SELECT {column_list} FROM {staging} "
+            f"ON CONFLICT (ticker, form_type) DO UPDATE SET {assignments}, updated_at = now()"
+        ))
+
+    @metrics.track("db_statements_read")
     def get(self, ticker: str, form_type: str) -> Optional[model.CombinedFinancialStatements]:
-        stmt = select(CombinedFinancialStatementsORM).where(
-            CombinedFinancialStatementsORM.ticker == ticker,
-            CombinedFinancialStatementsORM.form_type == form_type
-        )
-        orm_obj = self.session.execute(stmt).scalar_one_or_none()
+        cached = self._get_cached_statement(ticker, form_type)
+        if cached is not None:
+            return cached
 
+        orm_obj = self._get_orm(ticker, form_type, *self._frame_loading())
         if orm_obj is None:
             return None
 
-        return self._deserialize_to_domain(orm_obj)
+        return self._cache_statement(self._deserialize_to_domain(orm_obj))
 
-    def get_balance_sheet(self, ticker: str, form_type: str) -> Optional[model.CombinedFinancialStatements]:
-        stmt = select(CombinedFinancialStatementsORM).where(
+    @metrics.track("db_statements_read")
+    def get_many(self, tickers: Iterable[str], form_type: str) -> dict[str, model.CombinedFinancialStatements]:
+        statements = {}
+        missing = []
+        for ticker in dict.fromkeys(tickers):
+            cached = self._get_cached_statement(ticker, form_type)
+            if cached is not None:
+                statements[ticker] = cached
+            else:
+                missing.append(ticker)
+        if not missing:
+            return statements
+
+        query = select(CombinedFinancialStatementsORM).options(*self._frame_loading()).where(
+            CombinedFinancialStatementsORM.ticker.in_(missing),
+            CombinedFinancialStatementsORM.form_type == (form_type or '')
+        )
+        for orm_obj in self.session.execute(query).scalars():
+            statements[orm_obj.ticker] = self._cache_statement(self._deserialize_to_domain(orm_obj))
+        return statements
+
+    def _get_orm(self, ticker: str, form_type: str, *options) -> Optional[CombinedFinancialStatementsORM]:
+        stmt = select(CombinedFinancialStatementsORM).options(*options).where(
             CombinedFinancialStatementsORM.ticker == ticker,
-            CombinedFinancialStatementsORM.form_type == form_type
+            CombinedFinancialStatementsORM.form_type == (form_type or '')
         )
-        orm_obj = self.session.execute(stmt).scalar_one_or_none()
-        if orm_obj is None or getattr(orm_obj, 'balance_sheet_data', None) is None:
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    def lock_statement_build(self, ticker: str, form_type: Optional[str]) -> None:
+        if self.session.get_bind().dialect.name != 'postgresql':
+            return
+        self.session.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"),
+            {'key': _advisory_lock_key(f"statement-build:{ticker}:{form_type}")}
+        )
+
+    def get_version(self, ticker: str, form_type: str) -> Optional[str]:
+        field = f"version:{form_type}"
+        cached = self.cache.get(ticker, field)
+        if cached is not None:
+            return cached.decode()
+
+        row = self.session.execute(
+            select(CombinedFinancialStatementsORM.updated_at).where(
+                CombinedFinancialStatementsORM.ticker == ticker,
+                CombinedFinancialStatementsORM.form_type == (form_type or '')
+            )
+        ).first()
+        if row is None:
+            return None
+        version = row.updated_at.isoformat() if row.updated_at else 'initial'
+        self._fill_cache(ticker, field, version.encode())
+        return version
+
+    def get_income_statement(self, ticker: str, form_type: str) -> Optional[model.CombinedFinancialStatements]:
+        cached = self._get_cached_statement(ticker, form_type) or self._get_cached_statement(ticker, form_type, 'income')
+        if cached is not None:
+            return cached
+
+        orm_obj = self._get_orm(ticker, form_type, *self._frame_loading(include_balance_sheet=False))
+        if orm_obj is None:
+            return None
+        return self._cache_statement(self._deserialize_to_domain(orm_obj, include_balance_sheet=False), 'income')
+
+    def get_balance_sheet(self, ticker: str, form_type: str) -> Optional[model.CombinedFinancialStatements]:
+        cached = self._get_cached_statement(ticker, form_type)
+        if cached is not None:
+            return cached if cached.balance_sheet_df is not None else None
+
+        orm_obj = self._get_orm(ticker, form_type, *self._frame_loading(include_income=False))
+        if orm_obj is None:
+            return None
+        stmt = self._deserialize_to_domain(orm_obj, include_income=False)
+        if stmt.balance_sheet_df is None:
             return None
-        return self._deserialize_to_domain(orm_obj)
+        return stmt
+
+    def get_preferred_balance_sheet(self, ticker: str, preferred_form_type: str) -> Optional[pd.DataFrame]:
+        blob = CombinedFinancialStatementsORM.balance_sheet_blob
+        json_data = CombinedFinancialStatementsORM.balance_sheet_data
+        form_preference = case(
+            (CombinedFinancialStatementsORM.form_type == (preferred_form_type or ''), 0),
+            (CombinedFinancialStatementsORM.form_type == '10-K', 1),
+            (CombinedFinancialStatementsORM.form_type == '10-Q', 2),
+            else_=3
+        )
+        query = (
+            select(
+                blob.label('balance_sheet_blob'),
+                case((blob.is_(None), json_data), else_=None).label('balance_sheet_data')
+            )
+            .where(
+                CombinedFinancialStatementsORM.ticker == ticker,
+                (blob.is_not(None)) | (json_data.is_not(None))
+            )
+            .order_by(form_preference)
+        )
+        for row in self.session.execute(query):
+            balance_df = self._load_frame(row, 'balance_sheet_blob', 'balance_sheet_data')
+            if balance_df is not None and not balance_df.empty:
+                return balance_df
+        return None
 
     def get_by_ticker(self, ticker: str) -> list[model.CombinedFinancialStatements]:
-        stmt = select(CombinedFinancialStatementsORM).where(
+        stmt = select(CombinedFinancialStatementsORM).options(*self._frame_loading()).where(
             CombinedFinancialStatementsORM.ticker == ticker
         )
         orm_objs = self.session.execute(stmt).scalars().all()
@@ -748,18 +1605,70 @@ class PostgresCombinedFinancialStatementsRepository(CombinedFinancialStatementsR
     def delete(self, ticker: str, form_type: str) -> None:
         stmt = select(CombinedFinancialStatementsORM).where(
             CombinedFinancialStatementsORM.ticker == ticker,
-            CombinedFinancialStatementsORM.form_type == form_type
+            CombinedFinancialStatementsORM.form_type == (form_type or '')
         )
         orm_obj = self.session.execute(stmt).scalar_one_or_none()
 
         if orm_obj:
             self.session.delete(orm_obj)
+        self._invalidate_cache(ticker)
+        self.session.execute(
+            delete(FinancialFactORM).where(
+                FinancialFactORM.ticker == ticker,
+                FinancialFactORM.form_type == (form_type or '')
+            )
+        )
+
+    def get_facts(self, ticker: str, metrics: Optional[Iterable[str]] = None, form_type: Optional[str] = None,
+                  statement_type: Optional[str] = None, period_end_from: Optional[date] = None,
+                  period_end_to: Optional[date] = None) -> list[model.FinancialFact]:
+        query = select(FinancialFactORM).where(FinancialFactORM.ticker == ticker)
+        if metrics is not None:
+            query = query.where(FinancialFactORM.metric.in_(list(metrics)))
+        query = self._filter_facts(query, form_type, statement_type, period_end_from, period_end_to)
+        orm_objs = self.session.execute(query.order_by(FinancialFactORM.metric, FinancialFactORM.period_end)).scalars().all()
+        return [self._fact_to_domain(orm_obj) for orm_obj in orm_objs]
+
+    def get_facts_for_tickers(self, tickers: Iterable[str], metrics: Optional[Iterable[str]] = None,
+                              statement_type: Optional[str] = None) -> list[model.FinancialFact]:
+        tickers = list(set(tickers))
+        if not tickers:
+            return []
+        query = select(FinancialFactORM).where(FinancialFactORM.ticker.in_(tickers))
+        if metrics is not None:
+            query = query.where(FinancialFactORM.metric.in_(list(metrics)))
+        query = self._filter_facts(query, None, statement_type, None, None)
+        orm_objs = self.session.execute(
+            query.order_by(FinancialFactORM.ticker, FinancialFactORM.metric, FinancialFactORM.period_end)
+        ).scalars().all()
+        return [self._fact_to_domain(orm_obj) for orm_obj in orm_objs]
+
+    def get_metric_facts(self, metric: str, form_type: Optional[str] = None, tickers: Optional[Iterable[str]] = None,
+                         period_end_from: Optional[date] = None, period_end_to: Optional[date] = None) -> list[model.FinancialFact]:
+        query = select(FinancialFactORM).where(FinancialFactORM.metric == metric)
+        if tickers is not None:
+            query = query.where(FinancialFactORM.ticker.in_(list(tickers)))
+        query = self._filter_facts(query, form_type, None, period_end_from, period_end_to)
+        orm_objs = self.session.execute(query.order_by(FinancialFactORM.ticker, FinancialFactORM.period_end)).scalars().all()
+        return [self._fact_to_domain(orm_obj) for orm_obj in orm_objs]
+
+    @staticmethod
+    def _filter_facts(query, form_type: Optional[str], statement_type: Optional[str],
+                      period_end_from: Optional[date], period_end_to: Optional[date]):
+        if form_type is not None:
+            query = query.where(FinancialFactORM.form_type == form_type)
+        if statement_type is not None:
+            query = query.where(FinancialFactORM.statement_type == statement_type)
+        if period_end_from is not None:
+            query = query.where(FinancialFactORM.period_end >= period_end_from)
+        if period_end_to is not None:
+            query = query.where(FinancialFactORM.period_end <= period_end_to)
+        return query
 
     def search_tickers(self, term: str) -> list[str]:
-        search_term = f"%{term}%"
         query = (
             select(CombinedFinancialStatementsORM.ticker)
-            .where(CombinedFinancialStatementsORM.ticker.ilike(search_term))
+            .where(CombinedFinancialStatementsORM.ticker.startswith(term.strip().upper(), autoescape=True))
             .distinct()
             .limit(10)
         )
@@ -771,19 +1680,52 @@ class PostgresCombinedFinancialStatementsRepository(CombinedFinancialStatementsR
         result = self.session.execute(query).fetchall()
         return [row[0] for row in result]
 
+    def backfill_binary_frames(self, limit: int) -> int:
+        query = (
+            select(CombinedFinancialStatementsORM)
+            .options(undefer(CombinedFinancialStatementsORM.data), undefer(CombinedFinancialStatementsORM.balance_sheet_data),
+                     *self._frame_loading())
+            .where(CombinedFinancialStatementsORM.frames_encoded_at.is_(None))
+            .limit(limit)
+        )
+        orm_objs = self.session.execute(query).scalars().all()
+        now = datetime.now(timezone.utc)
+        for orm_obj in orm_objs:
+            df = self._load_frame(orm_obj, 'data_blob', 'data')
+            orm_obj.data_blob = encode_frame(df if df is not None else pd.DataFrame())
+            orm_obj.frames_encoded_at = now
+            bs_df = self._load_frame(orm_obj, 'balance_sheet_blob', 'balance_sheet_data')
+            if bs_df is not None:
+                orm_obj.balance_sheet_blob = encode_frame(bs_df)
+                orm_obj.balance_sheet_row_count = len(bs_df.index)
+        return len(orm_objs)
+
+    def claim_statements_needing_refinement(self, limit: int) -> list[tuple[str, str]]:
+        now = datetime.now(timezone.utc)
+        claimed_at = CombinedFinancialStatementsORM.refinement_claimed_at
+        query = (
+            select(CombinedFinancialStatementsORM)
+            .where(
+                CombinedFinancialStatementsORM.needs_refinement.is_(True),
+                claimed_at.is_(None) | (claimed_at < now - self.REFINEMENT_CLAIM_TIMEOUT)
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        orm_objs = self.session.execute(query).scalars().all()
+        for orm_obj in orm_objs:
+            orm_obj.refinement_claimed_at = now
+        return [(orm_obj.ticker, orm_obj.form_type or None) for orm_obj in orm_objs]
+
+    def clear_refinement(self, ticker: str, form_type: str) -> None:
+        orm_obj = self._get_orm(ticker, form_type)
+        if orm_obj is not None:
+            orm_obj.needs_refinement = False
+            orm_obj.refinement_claimed_at = None
+
     def get_tickers_with_insufficient_balance_sheet_data(self) -> list[str]:
-        query = select(CombinedFinancialStatementsORM.ticker, CombinedFinancialStatementsORM.balance_sheet_data).distinct()
-        result = self.session.execute(query).fetchall()
-        
-        insufficient_tickers = []
-        for ticker, balance_sheet_data in result:
-            if balance_sheet_data is None:
-                insufficient_tickers.append(ticker)
-            else:
-                try:
-                    if 'index' in balance_sheet_data and len(balance_sheet_data['index']) < 4:
-                        insufficient_tickers.append(ticker)
-                except (KeyError, TypeError):
-                    insufficient_tickers.append(ticker)
-        
-        return insufficient_tickers
+        row_count = CombinedFinancialStatementsORM.balance_sheet_row_count
+        query = select(CombinedFinancialStatementsORM.ticker).where(
+            or_(row_count.is_(None), row_count < MIN_BALANCE_SHEET_ROWS)
+        ).distinct()
+        return list(self.session.execute(query).scalars().all())
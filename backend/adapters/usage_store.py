@@ -0,0 +1,146 @@
+import abc
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from adapters.cache import RespConnection, RespError
+
+
+class AbstractUsageStore(abc.ABC):
+    @abc.abstractmethod
+    def get(self, key: str) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def increment(self, key: str, amount: int = 1) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def stats(self) -> dict:
+        raise NotImplementedError
+
+
+class InMemoryUsageStore(AbstractUsageStore):
+    def __init__(self, max_keys: int = 10000, window_seconds: float = 86400.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_keys = max_keys
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._counters: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def _current(self, key: str, now: float) -> Optional[tuple[float, int]]:
+        entry = self._counters.get(key)
+        if entry is not None and entry[0] <= now:
+            del self._counters[key]
+            return None
+        return entry
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            entry = self._current(key, self._clock())
+            return 0 if entry is None else entry[1]
+
+    def increment(self, key: str, amount: int = 1) -> int:
+        with self._lock:
+            now = self._clock()
+            entry = self._current(key, now)
+            if entry is None:
+                if amount <= 0:
+                    return 0
+                entry = (now + self.window_seconds, 0)
+            count = max(0, entry[1] + amount)
+            self._counters[key] = (entry[0], count)
+            self._counters.move_to_end(key)
+            while len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+                self.evictions += 1
+            return count
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "size": len(self._counters),
+                "max_keys": self.max_keys,
+                "window_seconds": self.window_seconds,
+                "evictions": self.evictions,
+            }
+
+
+class RespUsageStore(AbstractUsageStore):
+    KEY_PREFIX = 'equityalchemy:usage:'
+    RETRY_AFTER_SECONDS = 5.0
+
+    def __init__(self, connection: RespConnection, fallback: InMemoryUsageStore) -> None:
+        self.connection = connection
+        self.fallback = fallback
+        self._unavailable_until = 0.0
+        self.errors = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}{key}"
+
+    def _call(self, *commands) -> Optional[list]:
+        if time.monotonic() < self._unavailable_until:
+            return None
+        try:
+            return self.connection.execute_many(*commands)
+        except (OSError, ConnectionError, RespError) as e:
+            self.errors += 1
+            self._unavailable_until = time.monotonic() + self.RETRY_AFTER_SECONDS
+            print(f"Shared usage store unavailable, counting locally: {e}")
+            return None
+
+    def get(self, key: str) -> int:
+        replies = self._call(('GET', self._key(key)))
+        if replies is None:
+            return self.fallback.get(key)
+        return max(0, int(replies[0] or 0))
+
+    def increment(self, key: str, amount: int = 1) -> int:
+        shared_key = self._key(key)
+        replies = self._call(
+            ('SET', shared_key, 0, 'EX', int(self.fallback.window_seconds), 'NX'),
+            ('INCRBY', shared_key, amount)
+        )
+        if replies is None:
+            return self.fallback.increment(key, amount)
+        count = replies[1]
+        if count < 0:
+            self._call(('SET', shared_key, 0, 'KEEPTTL'))
+        return max(0, count)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "resp",
+            "host": self.connection.host,
+            "window_seconds": self.fallback.window_seconds,
+            "errors": self.errors,
+            "fallback": self.fallback.stats(),
+        }
+
+
+def build_usage_store(url: Optional[str] = None) -> AbstractUsageStore:
+    local = InMemoryUsageStore(
+        max_keys=int(os.getenv("USAGE_STORE_MAX_KEYS", "10000")),
+        window_seconds=float(os.getenv("FREE_QUERY_WINDOW_SECONDS", "86400"))
+    )
+    if not url:
+        return local
+    return RespUsageStore(RespConnection.from_url(url), local)
+
+
+_usage_store: Optional[AbstractUsageStore] = None
+_usage_store_lock = threading.Lock()
+
+
+def get_usage_store() -> AbstractUsageStore:
+    global _usage_store
+    if _usage_store is None:
+        with _usage_store_lock:
+            if _usage_store is None:
+                _usage_store = build_usage_store(os.getenv("USAGE_STORE_URL") or os.getenv("CACHE_URL"))
+    return _usage_store
@@ -0,0 +1,50 @@
+"""add_index_mapping_cache_tables
+
+Revision ID: 27944f64bff9
+Revises: c12f34a5b678
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = '27944f64bff9' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = 'c12f34a5b678' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        json_type = sa.dialects.postgresql.JSONB
+    else:
+        json_type = sa.Text
+
+    op.create_table('index_mappings',
+    sa.Column('cache_key', sa.String(length=64), nullable=False),
+    sa.Column('mapping', json_type(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_table('tag_equivalences',
+    sa.Column('source_tag', sa.String(), nullable=False),
+    sa.Column('target_tag', sa.String(), nullable=False),
+    sa.Column('occurrences', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('source_tag', 'target_tag')
+    )
+    op.create_index('ix_tag_equivalences_target_tag', 'tag_equivalences', ['target_tag'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tag_equivalences_target_tag', table_name='tag_equivalences')
+    op.drop_table('tag_equivalences')
+    op.drop_table('index_mappings')
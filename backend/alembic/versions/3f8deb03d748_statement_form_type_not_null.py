@@ -0,0 +1,46 @@
+"""statement_form_type_not_null
+
+Revision ID: 3f8deb03d748
+Revises: 8683a795f872
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = '3f8deb03d748' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = '8683a795f872' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DEDUPE_SQL = """
+DELETE FROM combined_financial_statements
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY ticker, COALESCE(form_type, '')
+            ORDER BY COALESCE(updated_at, created_at) DESC NULLS LAST, id DESC
+        ) AS duplicate_rank
+        FROM combined_financial_statements
+    ) ranked
+    WHERE duplicate_rank > 1
+)
+"""
+
+
+def upgrade() -> None:
+    op.execute(DEDUPE_SQL)
+    op.execute("UPDATE combined_financial_statements SET form_type = '' WHERE form_type IS NULL")
+    op.alter_column('combined_financial_statements', 'form_type', existing_type=sa.String(), nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('combined_financial_statements', 'form_type', existing_type=sa.String(), nullable=True)
+    op.execute("UPDATE combined_financial_statements SET form_type = NULL WHERE form_type = ''")
@@ -0,0 +1,30 @@
+"""add_binary_frame_columns
+
+Revision ID: 6974c0a8ca00
+Revises: ec8310c7c3ff
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = '6974c0a8ca00' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = 'ec8310c7c3ff' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('combined_financial_statements', sa.Column('data_blob', sa.LargeBinary(), nullable=True))
+    op.add_column('combined_financial_statements', sa.Column('balance_sheet_blob', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('combined_financial_statements', 'balance_sheet_blob')
+    op.drop_column('combined_financial_statements', 'data_blob')
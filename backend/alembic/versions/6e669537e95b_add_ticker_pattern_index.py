@@ -0,0 +1,34 @@
+"""add_ticker_pattern_index
+
+Revision ID: 6e669537e95b
+Revises: d8dde217c63e
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = '6e669537e95b' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = 'd8dde217c63e' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_combined_financial_statements_ticker_pattern',
+        'combined_financial_statements',
+        ['ticker'],
+        unique=False,
+        postgresql_ops={'ticker': 'text_pattern_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_combined_financial_statements_ticker_pattern', table_name='combined_financial_statements')
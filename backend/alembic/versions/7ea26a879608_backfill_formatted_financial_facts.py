@@ -0,0 +1,48 @@
+"""backfill_formatted_financial_facts
+
+Revision ID: 7ea26a879608
+Revises: 904a60a53bbf
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = '7ea26a879608' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = '904a60a53bbf' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_SQL = """
+INSERT INTO financial_facts (ticker, form_type, statement_type, metric, period_start, period_end, value)
+SELECT s.ticker, COALESCE(s.form_type, ''), '{statement_type}', idx.metric,
+       split_part(col.label, ':', 1)::date, split_part(col.label, ':', 2)::date,
+       cell.value::double precision
+FROM combined_financial_statements s
+CROSS JOIN LATERAL jsonb_array_elements_text(s.{column}->'index') WITH ORDINALITY AS idx(metric, position)
+CROSS JOIN LATERAL jsonb_array_elements_text(s.{column}->'columns') WITH ORDINALITY AS col(label, position)
+CROSS JOIN LATERAL (
+    SELECT replace(replace(btrim(s.{column}->'data'->(idx.position::int - 1)->>(col.position::int - 1)), ',', ''), '$', '') AS value
+) AS cell
+WHERE s.{column} IS NOT NULL
+  AND col.label ~ '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}:[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}$'
+  AND jsonb_typeof(s.{column}->'data'->(idx.position::int - 1)->(col.position::int - 1)) = 'string'
+  AND cell.value ~ '^-?[0-9]+([.][0-9]+)?$'
+ON CONFLICT DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(BACKFILL_SQL.format(statement_type='income_statement', column='data'))
+        op.execute(BACKFILL_SQL.format(statement_type='balance_sheet', column='balance_sheet_data'))
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,62 @@
+"""add_financial_facts_table
+
+Revision ID: 82a6bff53b3d
+Revises: 6974c0a8ca00
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = '82a6bff53b3d' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = '6974c0a8ca00' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_SQL = """
+INSERT INTO financial_facts (ticker, form_type, statement_type, metric, period_start, period_end, value)
+SELECT s.ticker, COALESCE(s.form_type, ''), '{statement_type}', idx.metric,
+       split_part(col.label, ':', 1)::date, split_part(col.label, ':', 2)::date,
+       (s.{column}->'data'->(idx.position::int - 1)->>(col.position::int - 1))::double precision
+FROM combined_financial_statements s
+CROSS JOIN LATERAL jsonb_array_elements_text(s.{column}->'index') WITH ORDINALITY AS idx(metric, position)
+CROSS JOIN LATERAL jsonb_array_elements_text(s.{column}->'columns') WITH ORDINALITY AS col(label, position)
+WHERE s.{column} IS NOT NULL
+  AND col.label ~ '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}:[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}$'
+  AND jsonb_typeof(s.{column}->'data'->(idx.position::int - 1)->(col.position::int - 1)) = 'number'
+ON CONFLICT DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    op.create_table('financial_facts',
+    sa.Column('ticker', sa.String(), nullable=False),
+    sa.Column('form_type', sa.String(), nullable=False),
+    sa.Column('statement_type', sa.String(), nullable=False),
+    sa.Column('metric', sa.String(), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('period_end', sa.Date(), nullable=False),
+    sa.Column('value', sa.Float(), nullable=False),
+    sa.Column('source_accession', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('ticker', 'form_type', 'statement_type', 'metric', 'period_start', 'period_end')
+    )
+    op.create_index('ix_financial_facts_metric_period_end', 'financial_facts', ['metric', 'period_end'], unique=False)
+    op.create_index('ix_financial_facts_ticker_metric_period_end', 'financial_facts', ['ticker', 'metric', 'period_end'], unique=False)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(BACKFILL_SQL.format(statement_type='income_statement', column='data'))
+        op.execute(BACKFILL_SQL.format(statement_type='balance_sheet', column='balance_sheet_data'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_financial_facts_ticker_metric_period_end', table_name='financial_facts')
+    op.drop_index('ix_financial_facts_metric_period_end', table_name='financial_facts')
+    op.drop_table('financial_facts')
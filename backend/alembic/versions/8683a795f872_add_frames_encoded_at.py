@@ -0,0 +1,40 @@
+"""add_frames_encoded_at
+
+Revision ID: 8683a795f872
+Revises: da817d5a85bb
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = '8683a795f872' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = 'da817d5a85bb' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('combined_financial_statements', sa.Column('frames_encoded_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute(
+        "UPDATE combined_financial_statements SET frames_encoded_at = updated_at "
+        "WHERE data_blob IS NOT NULL"
+    )
+    op.execute(
+        "UPDATE combined_financial_statements SET data_blob = NULL "
+        "WHERE data_blob IS NOT NULL AND length(data_blob) = 0"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE combined_financial_statements SET data_blob = ''::bytea "
+        "WHERE data_blob IS NULL AND frames_encoded_at IS NOT NULL"
+    )
+    op.drop_column('combined_financial_statements', 'frames_encoded_at')
@@ -0,0 +1,50 @@
+"""add_build_jobs_table
+
+Revision ID: 904a60a53bbf
+Revises: ed91cac7a577
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import adapters.orm
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = '904a60a53bbf' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = 'ed91cac7a577' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('build_jobs',
+    sa.Column('id', adapters.orm.GUID(), nullable=False),
+    sa.Column('ticker', sa.String(), nullable=False),
+    sa.Column('form_type', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'uq_build_jobs_active_ticker_form_type', 'build_jobs', ['ticker', 'form_type'],
+        unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+        sqlite_where=sa.text("status IN ('queued', 'running')")
+    )
+    op.create_index('ix_build_jobs_status_created_at', 'build_jobs', ['status', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_build_jobs_status_created_at', table_name='build_jobs')
+    op.drop_index('uq_build_jobs_active_ticker_form_type', table_name='build_jobs')
+    op.drop_table('build_jobs')
@@ -0,0 +1,35 @@
+"""add_readable_names_table
+
+Revision ID: 9329b936e112
+Revises: 27944f64bff9
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = '9329b936e112' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = '27944f64bff9' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('readable_names',
+    sa.Column('tag', sa.String(), nullable=False),
+    sa.Column('readable_name', sa.String(), nullable=True),
+    sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('tag')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('readable_names')
@@ -0,0 +1,47 @@
+"""add_balance_sheet_row_count
+
+Revision ID: 95df53d82aa7
+Revises: 6e669537e95b
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = '95df53d82aa7' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = '6e669537e95b' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_SQL = """
+UPDATE combined_financial_statements
+SET balance_sheet_row_count = jsonb_array_length(balance_sheet_data->'index')
+WHERE balance_sheet_data IS NOT NULL
+  AND jsonb_typeof(balance_sheet_data->'index') = 'array'
+"""
+
+
+def upgrade() -> None:
+    op.add_column('combined_financial_statements', sa.Column('balance_sheet_row_count', sa.Integer(), nullable=True))
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(BACKFILL_SQL)
+
+    op.create_index(
+        'ix_combined_financial_statements_balance_sheet_row_count',
+        'combined_financial_statements',
+        ['balance_sheet_row_count', 'ticker'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_combined_financial_statements_balance_sheet_row_count', table_name='combined_financial_statements')
+    op.drop_column('combined_financial_statements', 'balance_sheet_row_count')
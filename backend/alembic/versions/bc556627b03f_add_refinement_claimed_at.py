@@ -0,0 +1,28 @@
+"""add_refinement_claimed_at
+
+Revision ID: bc556627b03f
+Revises: 7ea26a879608
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = 'bc556627b03f' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = '7ea26a879608' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('combined_financial_statements', sa.Column('refinement_claimed_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('combined_financial_statements', 'refinement_claimed_at')
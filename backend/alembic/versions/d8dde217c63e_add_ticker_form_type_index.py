@@ -0,0 +1,28 @@
+"""add_ticker_form_type_index
+
+Revision ID: d8dde217c63e
+Revises: 82a6bff53b3d
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = 'd8dde217c63e' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = '82a6bff53b3d' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_combined_financial_statements_ticker_form_type', 'combined_financial_statements', ['ticker', 'form_type'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_combined_financial_statements_ticker_form_type', table_name='combined_financial_statements')
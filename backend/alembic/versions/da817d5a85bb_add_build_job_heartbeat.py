@@ -0,0 +1,28 @@
+"""add_build_job_heartbeat
+
+Revision ID: da817d5a85bb
+Revises: bc556627b03f
+Create Date: 2026-10-19 20:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = 'da817d5a85bb' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = 'bc556627b03f' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('build_jobs', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('build_jobs', 'heartbeat_at')
@@ -0,0 +1,28 @@
+"""add_needs_refinement_to_statements
+
+Revision ID: ec8310c7c3ff
+Revises: 9329b936e112
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = 'ec8310c7c3ff' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = '9329b936e112' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('combined_financial_statements', sa.Column('needs_refinement', sa.Boolean(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('combined_financial_statements', 'needs_refinement')
@@ -0,0 +1,51 @@
+"""unique_ticker_form_type
+
+Revision ID: ed91cac7a577
+Revises: 95df53d82aa7
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+# gitleaks:disable
+revision: str = 'ed91cac7a577' #pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = '95df53d82aa7' #pragma: allowlist secret
+# gitleaks:enable
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DEDUPE_SQL = """
+DELETE FROM combined_financial_statements
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY ticker, form_type
+            ORDER BY COALESCE(updated_at, created_at) DESC NULLS LAST, id DESC
+        ) AS duplicate_rank
+        FROM combined_financial_statements
+        WHERE form_type IS NOT NULL
+    ) ranked
+    WHERE duplicate_rank > 1
+)
+"""
+
+
+def upgrade() -> None:
+    op.execute(DEDUPE_SQL)
+    op.drop_index('ix_combined_financial_statements_ticker_form_type', table_name='combined_financial_statements')
+    op.create_unique_constraint(
+        'uq_combined_financial_statements_ticker_form_type',
+        'combined_financial_statements',
+        ['ticker', 'form_type']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_combined_financial_statements_ticker_form_type', 'combined_financial_statements', type_='unique')
+    op.create_index('ix_combined_financial_statements_ticker_form_type', 'combined_financial_statements', ['ticker', 'form_type'], unique=False)
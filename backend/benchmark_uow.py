@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of SqlAlchemyUnitOfWork enter/exit cost.
+
+Compares the current unit of work, which shares the external adapters
+process-wide, against building the SEC, LLM and market data adapters on
+every entry the way the unit of work used to.
+"""
+
+import time
+from typing import Callable
+
+from adapters import repository
+from service_layer import uow
+
+
+def time_per_call(fn: Callable[[], None], iterations: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def enter_exit(uow_instance: uow.SqlAlchemyUnitOfWork) -> None:
+    with uow_instance as uowx:
+        uowx.sec_filings
+        uowx.llm
+        uowx.market_data
+
+
+def enter_exit_with_fresh_adapters(uow_instance: uow.SqlAlchemyUnitOfWork) -> None:
+    with uow_instance as uowx:
+        uowx.sec_filings = repository.SECFilingRepository()
+        uowx.llm = repository.LLMRepository()
+        uowx.market_data = repository.YFinanceMarketDataProvider()
+
+
+def run(iterations: int) -> dict:
+    shared = uow.SqlAlchemyUnitOfWork()
+    fresh = uow.SqlAlchemyUnitOfWork()
+    results = {'shared_adapters_us': time_per_call(lambda: enter_exit(shared), iterations) * 1e6}
+    try:
+        results['fresh_adapters_us'] = time_per_call(lambda: enter_exit_with_fresh_adapters(fresh), iterations) * 1e6
+    except Exception as e:
+        print(f"Could not build adapters per entry: {e}")
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Measure unit of work enter/exit cost')
+    parser.add_argument('--iterations', type=int, default=200, help='Number of enter/exit cycles to time')
+
+    args = parser.parse_args()
+
+    for name, value in run(args.iterations).items():
+        print(f"{name}: {value:.1f}")
@@ -9,6 +9,8 @@ from .model import (
     Filing,
     IncomeStatement,
     CombinedFinancialStatements,
+    FinancialFact,
+    BuildJob,
     AbstractFinancialStatement,
     CoverPage,
     FilingType,
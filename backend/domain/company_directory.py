@@ -0,0 +1,141 @@
+import heapq
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+
+NGRAM_SIZE = 2
+MAX_PREFIX_CANDIDATES = 500
+
+
+@dataclass(frozen=True)
+class CompanyEntry:
+    name: str
+    ticker: str
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class _TrieNode:
+    __slots__ = ('children', 'entry_ids')
+
+    def __init__(self) -> None:
+        self.children: dict[str, '_TrieNode'] = {}
+        self.entry_ids: list[int] = []
+
+
+class CompanyDirectory:
+    EXACT_TICKER = 0
+    EXACT_NAME = 1
+    TICKER_PREFIX = 2
+    NAME_PREFIX = 3
+    SUBSTRING = 4
+
+    def __init__(self, entries: Iterable[CompanyEntry], popularity: Optional[Counter] = None) -> None:
+        self.entries: list[CompanyEntry] = []
+        self.popularity: Counter = popularity if popularity is not None else Counter()
+        self._by_ticker: dict[str, int] = {}
+        self._by_name: dict[str, int] = {}
+        self._search_text: list[str] = []
+        self._tickers: list[str] = []
+        self._ticker_lengths: list[int] = []
+        self._ticker_trie = _TrieNode()
+        self._name_trie = _TrieNode()
+        self._ngram_index: dict[str, set[int]] = {}
+
+        for entry in entries:
+            if not entry.ticker:
+                continue
+            entry_id = len(self.entries)
+            self.entries.append(entry)
+            ticker_key = entry.ticker.upper()
+            name_key = entry.name.upper()
+            self._by_ticker.setdefault(ticker_key, entry_id)
+            self._by_name.setdefault(name_key, entry_id)
+            self._insert(self._ticker_trie, ticker_key.lower(), entry_id)
+            self._insert(self._name_trie, name_key.lower(), entry_id)
+
+            search_text = f"{entry.name.lower()}\x00{entry.ticker.lower()}"
+            self._search_text.append(search_text)
+            self._tickers.append(ticker_key)
+            self._ticker_lengths.append(len(entry.ticker))
+            for gram in _ngrams(search_text):
+                self._ngram_index.setdefault(gram, set()).add(entry_id)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _insert(root: _TrieNode, key: str, entry_id: int) -> None:
+        node = root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        node.entry_ids.append(entry_id)
+
+    @staticmethod
+    def _prefix_matches(root: _TrieNode, prefix: str) -> list[int]:
+        node = root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        matches = []
+        stack = [node]
+        while stack and len(matches) < MAX_PREFIX_CANDIDATES:
+            current = stack.pop()
+            matches.extend(current.entry_ids)
+            stack.extend(current.children.values())
+        return matches
+
+    def _substring_matches(self, term: str) -> list[int]:
+        grams = sorted(_ngrams(term), key=lambda gram: len(self._ngram_index.get(gram, ())))
+        if not grams:
+            return []
+        candidates = set(self._ngram_index.get(grams[0], ()))
+        for gram in grams[1:]:
+            candidates &= self._ngram_index.get(gram, set())
+            if not candidates:
+                return []
+        return [entry_id for entry_id in candidates if term in self._search_text[entry_id]]
+
+    def lookup(self, ticker_or_name: str) -> Optional[CompanyEntry]:
+        key = ticker_or_name.strip().upper()
+        entry_id = self._by_ticker.get(key)
+        if entry_id is None:
+            entry_id = self._by_name.get(key)
+        return self.entries[entry_id] if entry_id is not None else None
+
+    def search(self, term: str, limit: int = 10) -> list[CompanyEntry]:
+        term_lower = term.strip().lower()
+        if not term_lower:
+            return []
+
+        tiers: dict[int, int] = {}
+
+        def rank(entry_ids: Iterable[int], tier: int) -> None:
+            for entry_id in entry_ids:
+                if entry_id not in tiers:
+                    tiers[entry_id] = tier
+
+        term_upper = term_lower.upper()
+        if term_upper in self._by_ticker:
+            rank([self._by_ticker[term_upper]], self.EXACT_TICKER)
+        if term_upper in self._by_name:
+            rank([self._by_name[term_upper]], self.EXACT_NAME)
+        rank(self._prefix_matches(self._ticker_trie, term_lower), self.TICKER_PREFIX)
+        rank(self._prefix_matches(self._name_trie, term_lower), self.NAME_PREFIX)
+        rank(self._substring_matches(term_lower), self.SUBSTRING)
+
+        popularity = self.popularity
+        ranked = heapq.nsmallest(
+            limit,
+            ((tier, -popularity[self._tickers[entry_id]] if popularity else 0, self._ticker_lengths[entry_id], entry_id)
+             for entry_id, tier in tiers.items())
+        )
+        return [self.entries[item[3]] for item in ranked]
+
+    def record_lookup(self, ticker: str) -> None:
+        self.popularity[ticker.upper()] += 1
@@ -0,0 +1,148 @@
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from domain.model import load_xbrl_mappings
+
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.85
+
+_TOKEN_PATTERN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+')
+
+
+@dataclass
+class IndexMatchResult:
+    mapping: dict[str, str] = field(default_factory=dict)
+    unresolved_base: list[str] = field(default_factory=list)
+    unresolved_current: list[str] = field(default_factory=list)
+    stage_counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.unresolved_base or not self.unresolved_current
+
+
+def normalize_tag(tag) -> str:
+    name = str(tag).split(':')[-1]
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+def tokenize_tag(tag) -> frozenset[str]:
+    name = str(tag).split(':')[-1]
+    return frozenset(token.lower() for token in _TOKEN_PATTERN.findall(name))
+
+
+def humanize_tag(tag) -> str:
+    name = str(tag).split(':')[-1]
+    words = _TOKEN_PATTERN.findall(name)
+    if not words:
+        return str(tag)
+    return ' '.join(word if word.isupper() else word.capitalize() for word in words)
+
+
+def token_similarity(left, right) -> float:
+    left_tokens = tokenize_tag(left)
+    right_tokens = tokenize_tag(right)
+    if not left_tokens or not right_tokens:
+        return 0.0
+    return len(left_tokens & right_tokens) / len(left_tokens | right_tokens)
+
+
+def build_synonym_index(xbrl_mappings: dict) -> dict[str, frozenset[str]]:
+    groups: dict[str, set[str]] = {}
+    for standard_name, mapping in xbrl_mappings.items():
+        groups.setdefault(normalize_tag(standard_name), set()).add(standard_name)
+        for tag in mapping.get('primary', []) + mapping.get('secondary', []):
+            groups.setdefault(normalize_tag(tag), set()).add(standard_name)
+    return {tag: frozenset(names) for tag, names in groups.items()}
+
+
+@lru_cache(maxsize=1)
+def _default_synonym_index() -> dict[str, frozenset[str]]:
+    return build_synonym_index(load_xbrl_mappings())
+
+
+class IndexMatcher:
+    def __init__(self, synonym_index: Optional[dict[str, frozenset[str]]] = None,
+                 similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> None:
+        self.synonym_index = synonym_index if synonym_index is not None else _default_synonym_index()
+        self.similarity_threshold = similarity_threshold
+
+    def match(self, base_indices: Iterable[str], current_indices: Iterable[str],
+              equivalences: Optional[dict[str, set[str]]] = None) -> IndexMatchResult:
+        base = list(dict.fromkeys(base_indices))
+        current = list(dict.fromkeys(current_indices))
+        equivalences = equivalences or {}
+        result = IndexMatchResult()
+
+        remaining_current = set(current)
+        matched = {idx: idx for idx in base if idx in remaining_current}
+        remaining_current -= set(matched.values())
+        result.stage_counts['exact'] = len(matched)
+        result.mapping.update(matched)
+
+        stages = [
+            ('normalized', lambda b, c: normalize_tag(b) == normalize_tag(c)),
+            ('equivalence', lambda b, c: self._are_equivalent(b, c, equivalences)),
+        ]
+        for stage_name, predicate in stages:
+            matched = self._match_unique(
+                [b for b in base if b not in result.mapping],
+                [c for c in current if c in remaining_current],
+                predicate
+            )
+            result.stage_counts[stage_name] = len(matched)
+            result.mapping.update(matched)
+            remaining_current -= set(matched.values())
+
+        matched = self._match_by_similarity(
+            [b for b in base if b not in result.mapping],
+            [c for c in current if c in remaining_current]
+        )
+        result.stage_counts['similarity'] = len(matched)
+        result.mapping.update(matched)
+        remaining_current -= set(matched.values())
+
+        result.unresolved_base = [b for b in base if b not in result.mapping]
+        result.unresolved_current = [c for c in current if c in remaining_current]
+        return result
+
+    def _are_equivalent(self, base_tag, current_tag, equivalences: dict[str, set[str]]) -> bool:
+        if current_tag in equivalences.get(base_tag, set()):
+            return True
+        base_groups = self.synonym_index.get(normalize_tag(base_tag), frozenset())
+        current_groups = self.synonym_index.get(normalize_tag(current_tag), frozenset())
+        return bool(base_groups & current_groups)
+
+    @staticmethod
+    def _match_unique(base: list[str], current: list[str], predicate) -> dict[str, str]:
+        candidates = {b: [c for c in current if predicate(b, c)] for b in base}
+        reverse_counts: dict[str, int] = {}
+        for matches in candidates.values():
+            for c in matches:
+                reverse_counts[c] = reverse_counts.get(c, 0) + 1
+
+        matched = {}
+        for b, matches in candidates.items():
+            if len(matches) == 1 and reverse_counts[matches[0]] == 1:
+                matched[b] = matches[0]
+        return matched
+
+    def _match_by_similarity(self, base: list[str], current: list[str]) -> dict[str, str]:
+        scored = []
+        for b in base:
+            for c in current:
+                score = token_similarity(b, c)
+                if score >= self.similarity_threshold:
+                    scored.append((score, b, c))
+        scored.sort(key=lambda item: item[0], reverse=True)
+
+        matched = {}
+        used_current = set()
+        for score, b, c in scored:
+            if b in matched or c in used_current:
+                continue
+            matched[b] = c
+            used_current.add(c)
+        return matched
@@ -852,6 +852,76 @@ class IncomeStatement(AbstractFinancialStatement):
         return self.df[self.df['metric'] == metric_name]
 
 
+@dataclass(frozen=True)
+class FinancialFact:
+    INCOME_STATEMENT = 'income_statement'
+    BALANCE_SHEET = 'balance_sheet'
+
+    ticker: str
+    form_type: Optional[str]
+    statement_type: str
+    metric: str
+    period_start: date
+    period_end: date
+    value: float
+    source_accession: Optional[str] = None
+
+    @property
+    def period(self) -> str:
+        return f"{self.period_start.isoformat()}:{self.period_end.isoformat()}"
+
+    @staticmethod
+    def parse_period(label) -> Optional[tuple[date, date]]:
+        try:
+            start_str, end_str = str(label).split(':')
+            return date.fromisoformat(start_str), date.fromisoformat(end_str)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_value(value) -> Optional[float]:
+        try:
+            if value is None:
+                return None
+            if hasattr(value, 'dtype'):
+                try:
+                    return float(value)
+                except Exception:
+                    pass
+            if isinstance(value, str):
+                cleaned = value.replace(",", "").replace("$", "").strip()
+                return float(cleaned) if cleaned not in ("", "-") else None
+            if isinstance(value, (int, float)) or hasattr(value, '__float__'):
+                return float(value)
+            if hasattr(value, "iloc"):
+                if not value.empty and pd.notna(value.iloc[0]):
+                    return float(value.iloc[0])
+            return None
+        except Exception:
+            return None
+
+
+@dataclass(frozen=True)
+class BuildJob:
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+
+    id: str
+    ticker: str
+    form_type: Optional[str]
+    status: str
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    attempts: int = 0
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.SUCCEEDED, self.FAILED)
+
+
 class CombinedFinancialStatements:
     def __init__(self, financial_statements: list[AbstractFinancialStatement], source_filings: list[Filing], ticker: str, company_name: str, form_type: str = None) -> None:
         self.financial_statements = financial_statements
@@ -863,6 +933,50 @@ class CombinedFinancialStatements:
         self.sec_filings_url = None
         self.has_more_than_one_continuous_period = None
         self.balance_sheet_df = None
+        self.needs_refinement = False
+
+    def to_financial_facts(self) -> list[FinancialFact]:
+        accession_by_period_end = {}
+        for filing in self.source_filings or []:
+            cover_page = getattr(filing, 'cover_page', None)
+            period_end = getattr(cover_page, 'document_period_end_date', None)
+            if period_end:
+                accession_by_period_end.setdefault(str(period_end), filing.accession_number)
+
+        facts = []
+        frames = [
+            (FinancialFact.INCOME_STATEMENT, self.df),
+            (FinancialFact.BALANCE_SHEET, self.balance_sheet_df),
+        ]
+        for statement_type, frame in frames:
+            if frame is None or frame.empty:
+                continue
+            if all(pd.api.types.is_numeric_dtype(dtype) for dtype in frame.dtypes):
+                values = frame.to_numpy(dtype=float)
+            else:
+                values = frame.map(FinancialFact.parse_value).astype(float).to_numpy()
+            seen = set()
+            for column_position, column in enumerate(frame.columns):
+                period = FinancialFact.parse_period(column)
+                if period is None:
+                    continue
+                for row_position, metric in enumerate(frame.index):
+                    value = values[row_position, column_position]
+                    key = (str(metric), period)
+                    if pd.isna(value) or key in seen:
+                        continue
+                    seen.add(key)
+                    facts.append(FinancialFact(
+                        ticker=self.ticker,
+                        form_type=self.form_type,
+                        statement_type=statement_type,
+                        metric=str(metric),
+                        period_start=period[0],
+                        period_end=period[1],
+                        value=float(value),
+                        source_accession=accession_by_period_end.get(period[1].isoformat())
+                    ))
+        return facts
 
     def _combine_statements(self) -> pd.DataFrame:
         if not self.financial_statements:
@@ -1268,3 +1382,6 @@ class MarketDataProvider(Protocol):
     @abstractmethod
     def fetch_prices(self, ticker: str, start_date: date, end_date: date) -> List[PricePoint]:
         pass
+
+    def fetch_prices_many(self, tickers: List[str], start_date: date, end_date: date) -> dict[str, List[PricePoint]]:
+        return {ticker.upper(): self.fetch_prices(ticker, start_date, end_date) for ticker in tickers}
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Optional
 
+import pandas as pd
+
 
 @dataclass
 class ValuationInputs:
@@ -65,3 +67,33 @@ def compute_valuation(inputs: ValuationInputs) -> ValuationResult:
     )
 
 
+def compute_valuations(inputs: pd.DataFrame) -> pd.DataFrame:
+    amounts = inputs.reindex(columns=[
+        "cash_and_cash_equivalents",
+        "short_term_investments",
+        "short_term_debt_and_current_maturities",
+        "long_term_debt",
+        "lease_liabilities_current",
+        "lease_liabilities_noncurrent",
+        "preferred_stock",
+        "noncontrolling_interest",
+    ]).astype(float).fillna(0.0)
+
+    total_debt = (
+        amounts["short_term_debt_and_current_maturities"]
+        + amounts["long_term_debt"]
+        + amounts["lease_liabilities_current"]
+        + amounts["lease_liabilities_noncurrent"]
+    )
+    net_cash = amounts["cash_and_cash_equivalents"] + amounts["short_term_investments"]
+    net_debt = total_debt - net_cash
+    market_cap = inputs["price"].astype(float) * inputs["shares_outstanding"].astype(float)
+    enterprise_value = market_cap + net_debt + amounts["preferred_stock"] + amounts["noncontrolling_interest"]
+
+    return pd.DataFrame({
+        "market_cap": market_cap,
+        "enterprise_value": enterprise_value,
+        "total_debt": total_debt,
+        "net_cash": net_cash,
+        "net_debt": net_debt,
+    }, index=inputs.index)
@@ -1,19 +1,71 @@
 import os
-from fastapi import FastAPI, Request, Response, HTTPException
+import asyncio
+import gzip
+import hashlib
+import orjson
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from fastapi import Depends, FastAPI, Query, Request, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import Dict, Optional, List
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Dict, Literal, Optional, List
+from datetime import datetime
+from urllib.parse import urlencode
 from service_layer import service
 from service_layer import uow
-from service_layer import forecasting
+from adapters import metrics, usage_store
 # from service_layer import forecast
 import pandas as pd
 import numpy as np
 import traceback
 
-free_query_usage: Dict[str, int] = {}
+READABLE_NAME_BATCH_INTERVAL_SECONDS = float(os.getenv("READABLE_NAME_BATCH_INTERVAL_SECONDS", "60"))
+API_WORKER_THREADS = int(os.getenv("API_WORKER_THREADS", "16"))
+BUILD_JOB_CONCURRENCY = int(os.getenv("BUILD_JOB_CONCURRENCY", "4"))
+BUILD_JOB_POLL_INTERVAL_SECONDS = float(os.getenv("BUILD_JOB_POLL_INTERVAL_SECONDS", "2"))
+RESPONSE_CACHE_CONTROL = os.getenv("RESPONSE_CACHE_CONTROL", "public, no-cache")
+BATCH_MAX_TICKERS = int(os.getenv("BATCH_MAX_TICKERS", "50"))
+VALUATION_PRICE_DAYS = 30
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1000"))
+GZIP_COMPRESS_LEVEL = int(os.getenv("GZIP_COMPRESS_LEVEL", "6"))
+FREE_QUERY_LIMIT = int(os.getenv("FREE_QUERY_LIMIT", "1"))
+FREE_QUERY_PATH_PREFIXES = ("/api/financial/income/",)
+
+HTTP_REQUESTS = metrics.REGISTRY.counter(
+    "equityalchemy_http_requests_total", "HTTP requests handled by the API.", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = metrics.REGISTRY.histogram(
+    "equityalchemy_http_request_duration_seconds", "Time until the API started sending a response.", ("method", "route")
+)
+HTTP_REQUESTS_IN_FLIGHT = metrics.REGISTRY.gauge(
+    "equityalchemy_http_requests_in_flight", "HTTP requests currently being handled by the API."
+)
+
+blocking_executor = ThreadPoolExecutor(max_workers=API_WORKER_THREADS, thread_name_prefix="api-blocking")
+build_job_executor = ThreadPoolExecutor(max_workers=BUILD_JOB_CONCURRENCY, thread_name_prefix="build-job")
+build_job_wakeup = asyncio.Event()
+build_slots = asyncio.Semaphore(BUILD_JOB_CONCURRENCY)
+
+
+async def run_blocking(fn, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(blocking_executor, partial(fn, *args, **kwargs))
+
+
+async def run_build(fn, *args, **kwargs):
+    async with build_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(build_job_executor, partial(fn, *args, **kwargs))
+
+
+def get_request_uow():
+    with uow.SqlAlchemyUnitOfWork() as uow_instance:
+        yield uow_instance
 
 class FinancialMetric(BaseModel):
     name: str
@@ -63,6 +115,26 @@ class PriceDataResponse(BaseModel):
     price_changes: List[Optional[float]]
 
 
+class BuildJobResponse(BaseModel):
+    job_id: str
+    ticker: str
+    form_type: Optional[str] = None
+    status: str
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    status_url: str
+    result_url: Optional[str] = None
+
+
+class BatchRequest(BaseModel):
+    tickers: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_TICKERS)
+    resources: List[Literal["income", "prices", "valuation"]] = ["income", "prices", "valuation"]
+    form_type: Optional[str] = None
+    days: int = 30
+    format: Literal["records", "columnar"] = "records"
+
+
 class ValuationResponse(BaseModel):
     ticker: str
     as_of_period: Optional[str] = None
@@ -88,6 +160,112 @@ async def generic_exception_handler(request: Request, exc: Exception):
         },
     )
 
+async def readable_name_batch_loop():
+    while True:
+        await asyncio.sleep(READABLE_NAME_BATCH_INTERVAL_SECONDS)
+        try:
+            refreshed = await asyncio.to_thread(service.refresh_readable_names, uow.SqlAlchemyUnitOfWork())
+            if refreshed:
+                print(f"Stored {refreshed} readable index names")
+            refined = await asyncio.to_thread(service.refine_degraded_statements, uow.SqlAlchemyUnitOfWork())
+            if refined:
+                print(f"Refined {refined} stored statements")
+            converted = await asyncio.to_thread(service.backfill_binary_frames, uow.SqlAlchemyUnitOfWork())
+            if converted:
+                print(f"Stored binary frames for {converted} statements")
+        except Exception:
+            traceback.print_exc()
+
+async def build_job_loop():
+    loop = asyncio.get_running_loop()
+    running = {}
+
+    def finished(future):
+        running.pop(future, None)
+        build_slots.release()
+        build_job_wakeup.set()
+
+    while True:
+        free_workers = 0
+        started = 0
+        try:
+            if running:
+                await run_blocking(service.heartbeat_build_jobs, list(running.values()), uow.SqlAlchemyUnitOfWork())
+            while free_workers < BUILD_JOB_CONCURRENCY and not build_slots.locked():
+                await build_slots.acquire()
+                free_workers += 1
+            if free_workers > 0:
+                jobs = await run_blocking(service.claim_build_jobs, uow.SqlAlchemyUnitOfWork(), free_workers, BUILD_JOB_CONCURRENCY)
+                for job in jobs:
+                    future = loop.run_in_executor(build_job_executor, service.run_build_job, job, uow.SqlAlchemyUnitOfWork())
+                    running[future] = job
+                    future.add_done_callback(finished)
+                    started += 1
+        except Exception:
+            traceback.print_exc()
+        finally:
+            for _ in range(free_workers - started):
+                build_slots.release()
+
+        try:
+            await asyncio.wait_for(build_job_wakeup.wait(), BUILD_JOB_POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        build_job_wakeup.clear()
+
+@app.on_event("startup")
+async def start_background_tasks():
+    service.COMPANY_DIRECTORY.get()
+    app.state.readable_name_task = asyncio.create_task(readable_name_batch_loop())
+    app.state.build_job_task = asyncio.create_task(build_job_loop())
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    app.state.readable_name_task.cancel()
+    app.state.build_job_task.cancel()
+    blocking_executor.shutdown(wait=False)
+    build_job_executor.shutdown(wait=False)
+
+async def refund_free_query(request: Request) -> None:
+    client_ip = getattr(request.state, "free_query_client", None)
+    if client_ip is None:
+        return
+    request.state.free_query_client = None
+    await run_blocking(usage_store.get_usage_store().increment, client_ip, -1)
+
+class FreeQueryMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        if (request.method == "OPTIONS" or not request.url.path.startswith(FREE_QUERY_PATH_PREFIXES)
+                or is_authenticated(request)):
+            return await call_next(request)
+
+        store = usage_store.get_usage_store()
+        client_ip = get_client_ip(request)
+        used = await run_blocking(store.increment, client_ip)
+        if used > FREE_QUERY_LIMIT:
+            return JSONResponse(
+                status_code=401,
+                content={"detail": "Free query limit exceeded. Please sign in to continue accessing financial data."},
+                headers={"X-Free-Limit-Exceeded": "true"}
+            )
+
+        request.state.free_query_client = client_ip
+        try:
+            response = await call_next(request)
+        except Exception:
+            await refund_free_query(request)
+            raise
+        if response.status_code != 200:
+            await refund_free_query(request)
+            return response
+        response.headers["X-Free-Query-Used"] = "true"
+        response.headers["X-Remaining-Free-Queries"] = str(FREE_QUERY_LIMIT - used)
+        return response
+
+app.add_middleware(FreeQueryMiddleware)
+
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESS_LEVEL)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -106,21 +284,30 @@ app.add_middleware(
     max_age=600,
 )
 
+class RequestMetricsMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, method=request.method, route=route_path)
+            HTTP_REQUESTS.inc(method=request.method, route=route_path, status=str(status_code))
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+
+app.add_middleware(RequestMetricsMiddleware)
+
 def get_client_ip(request: Request) -> str:
     forwarded = request.headers.get("X-Forwarded-For")
     if forwarded:
         return forwarded.split(",")[0].strip()
     return request.client.host
 
-def check_free_query_limit(request: Request) -> bool:
-    client_ip = get_client_ip(request)
-    usage_count = free_query_usage.get(client_ip, 0)
-    return usage_count < 1
-
-def increment_free_query_usage(request: Request):
-    client_ip = get_client_ip(request)
-    free_query_usage[client_ip] = free_query_usage.get(client_ip, 0) + 1
-
 def is_authenticated(request: Request) -> bool:
     """Simple check for authentication - look for auth headers or session cookies"""
     # Check for Authorization header (from Clerk frontend)
@@ -140,55 +327,20 @@ def is_authenticated(request: Request) -> bool:
 async def root():
     return {"message": "Financial Data API powered by Clerk Authentication"}
 
+@app.get("/metrics")
+async def get_metrics():
+    return Response(content=metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+@app.get("/api/debug/cache-stats")
+async def debug_cache_stats():
+    """Hit and miss counters for the statement, valuation and forecast cache."""
+    return await run_blocking(service.get_cache_stats)
+
 @app.get("/api/debug/db-info")
-async def debug_db_info():
+async def debug_db_info(uow_instance: uow.AbstractUnitOfWork = Depends(get_request_uow)):
     """Debug endpoint to check database connection info."""
     try:
-        from sqlalchemy import text
-        with uow.SqlAlchemyUnitOfWork() as uow_instance:
-            # Get database name
-            result = uow_instance.session.execute(text("SELECT current_database()"))
-            db_name = result.scalar()
-            
-            # Get current schema
-            result = uow_instance.session.execute(text("SELECT current_schema()"))
-            schema = result.scalar()
-            
-            # Get search path
-            result = uow_instance.session.execute(text("SHOW search_path"))
-            search_path = result.scalar()
-            
-            # Check if table exists
-            result = uow_instance.session.execute(
-                text("""
-                    SELECT schemaname, tablename 
-                    FROM pg_tables 
-                    WHERE tablename = 'combined_financial_statements'
-                """)
-            )
-            table_info = result.fetchall()
-            
-            # Get all tables in public schema
-            result = uow_instance.session.execute(
-                text("""
-                    SELECT tablename 
-                    FROM pg_tables 
-                    WHERE schemaname = 'public'
-                    ORDER BY tablename
-                    LIMIT 10
-                """)
-            )
-            public_tables = [row[0] for row in result.fetchall()]
-            
-            return {
-                "database": db_name,
-                "current_schema": schema,
-                "search_path": search_path,
-                "combined_financial_statements_found_in": [
-                    {"schema": row[0], "table": row[1]} for row in table_info
-                ],
-                "sample_public_tables": public_tables
-            }
+        return await run_blocking(_query_db_info, uow_instance)
     except Exception as e:
         import traceback
         return {
@@ -196,14 +348,59 @@ async def debug_db_info():
             "traceback": traceback.format_exc()
         }
 
+def _query_db_info(uow_instance) -> dict:
+    from sqlalchemy import text
+    # Get database name
+    result = uow_instance.session.execute(text("SELECT current_database()"))
+    db_name = result.scalar()
+
+    # Get current schema
+    result = uow_instance.session.execute(text("SELECT current_schema()"))
+    schema = result.scalar()
+
+    # Get search path
+    result = uow_instance.session.execute(text("SHOW search_path"))
+    search_path = result.scalar()
+
+    # Check if table exists
+    result = uow_instance.session.execute(
+        text("""
+            SELECT schemaname, tablename
+            FROM pg_tables
+            WHERE tablename = 'combined_financial_statements'
+        """)
+    )
+    table_info = result.fetchall()
+
+    # Get all tables in public schema
+    result = uow_instance.session.execute(
+        text("""
+            SELECT tablename
+            FROM pg_tables
+            WHERE schemaname = 'public'
+            ORDER BY tablename
+            LIMIT 10
+        """)
+    )
+    public_tables = [row[0] for row in result.fetchall()]
+
+    return {
+        "database": db_name,
+        "current_schema": schema,
+        "search_path": search_path,
+        "combined_financial_statements_found_in": [
+            {"schema": row[0], "table": row[1]} for row in table_info
+        ],
+        "sample_public_tables": public_tables
+    }
+
 @app.get("/api/free-query-status")
 async def get_free_query_status(request: Request):
-    client_ip = get_client_ip(request)
-    usage_count = free_query_usage.get(client_ip, 0)
+    usage_count = min(await run_blocking(usage_store.get_usage_store().get, get_client_ip(request)), FREE_QUERY_LIMIT)
     return {
         "free_queries_used": usage_count,
-        "free_queries_remaining": max(0, 1 - usage_count),
-        "has_free_queries": usage_count < 1
+        "free_queries_remaining": FREE_QUERY_LIMIT - usage_count,
+        "has_free_queries": usage_count < FREE_QUERY_LIMIT
     }
 
 @app.get("/api/tickers/search")
@@ -219,10 +416,9 @@ async def search_tickers_endpoint(term: str):
 
 
 @app.post("/api/company/update-shares")
-async def update_shares_endpoint():
+async def update_shares_endpoint(uow_instance: uow.AbstractUnitOfWork = Depends(get_request_uow)):
     try:
-        with uow.SqlAlchemyUnitOfWork() as uow_instance:
-            service.update_shares_outstanding(uow_instance)
+        await run_blocking(service.update_shares_outstanding, uow_instance)
         return {"message": "Shares outstanding updated successfully."}
     except Exception as e:
         traceback.print_exc()
@@ -230,14 +426,12 @@ async def update_shares_endpoint():
 
 
 @app.post("/api/company/supplement/{ticker}", response_model=CompanyResponse)
-async def supplement_company_data_endpoint(ticker: str):
+async def supplement_company_data_endpoint(ticker: str, uow_instance: uow.AbstractUnitOfWork = Depends(get_request_uow)):
     """
     Supplements company data from an external API and stores it.
     """
     try:
-        with uow.SqlAlchemyUnitOfWork() as uow_instance:
-            company = service.supplement_company_data(ticker, uow_instance)
-        return company
+        return await run_blocking(service.supplement_company_data, ticker, uow_instance)
     except (ValueError, RuntimeError) as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -245,8 +439,144 @@ async def supplement_company_data_endpoint(ticker: str):
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 
+def _statement_metrics(combined_financial_statements) -> tuple[List[dict], List[str]]:
+    metrics = []
+    metric_names = combined_financial_statements.get_all_metrics()
+    sorted_periods = sorted(combined_financial_statements.get_all_periods(), key=lambda x: x.split(':')[0])
+
+    for metric_name in metric_names:
+        metric_series = combined_financial_statements.get_metric(metric_name)
+
+        if metric_series is not None:
+            values = {}
+
+            for period in sorted_periods:
+                value = metric_series.get(period)
+                try:
+                    if isinstance(value, pd.Series):
+                        if not value.empty and pd.notna(value.iloc[0]):
+                            values[period] = float(value.iloc[0])
+                    else:
+                        if pd.notna(value):
+                            values[period] = float(value)
+                except (ValueError, TypeError, IndexError) as e:
+                    continue
+
+            metrics.append({"name": metric_name, "values": values})
+
+    return metrics, sorted_periods
+
+
+def _build_job_response(job) -> BuildJobResponse:
+    result_url = None
+    if job.status == job.SUCCEEDED:
+        query = f"?{urlencode({'form_type': job.form_type})}" if job.form_type else ""
+        result_url = f"/api/financial/income/{job.ticker}{query}"
+    return BuildJobResponse(
+        job_id=job.id,
+        ticker=job.ticker,
+        form_type=job.form_type,
+        status=job.status,
+        error=job.error,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        status_url=f"/api/jobs/{job.id}",
+        result_url=result_url
+    )
+
+
+@app.get("/api/jobs/{job_id}", response_model=BuildJobResponse)
+async def get_build_job(job_id: str, uow_instance: uow.AbstractUnitOfWork = Depends(get_request_uow)):
+    job = await run_blocking(service.get_build_job, job_id, uow_instance)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return _build_job_response(job)
+
+
+def _encode_json(content) -> bytes:
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _response_etag(kind: str, ticker: str, form_type: Optional[str], version: str, *variant) -> str:
+    digest = hashlib.sha256(_encode_json([kind, ticker, form_type, version, *variant])).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+
+def _accepts_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+def _frame_content(df: pd.DataFrame, response_format: str) -> dict:
+    sorted_periods = sorted(df.columns, key=lambda x: str(x).split(':')[0])
+    frame = df[sorted_periods]
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in frame.dtypes):
+        frame = frame.apply(pd.to_numeric, errors="coerce")
+    values = np.ascontiguousarray(frame.to_numpy(dtype=np.float64, na_value=np.nan))
+    periods = [str(period) for period in sorted_periods]
+    metrics = [str(metric) for metric in df.index]
+    if response_format == "columnar":
+        return {"periods": periods, "metrics": metrics, "values": values}
+    return {
+        "metrics": [
+            {"name": metric, "values": {period: float(value) for period, value in zip(periods, row) if np.isfinite(value)}}
+            for metric, row in zip(metrics, values)
+        ],
+        "periods": periods
+    }
+
+
+def _columnar_statements(combined_financial_statements) -> dict:
+    return {
+        "ticker": combined_financial_statements.ticker,
+        "form_type": combined_financial_statements.form_type,
+        "format": "columnar",
+        **_frame_content(combined_financial_statements.df, "columnar")
+    }
+
+
+def _statements_content(combined_financial_statements, response_format: str) -> dict:
+    if response_format == "columnar":
+        return _columnar_statements(combined_financial_statements)
+    metrics, sorted_periods = _statement_metrics(combined_financial_statements)
+    return {
+        "ticker": combined_financial_statements.ticker,
+        "form_type": combined_financial_statements.form_type,
+        "metrics": metrics,
+        "periods": sorted_periods
+    }
+
+
+def _encode_statements_response(combined_financial_statements, response_format: str, content_encoding: Optional[str]) -> bytes:
+    body = _encode_json(_statements_content(combined_financial_statements, response_format))
+    if content_encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)
+    return body
+
+
+async def _accepted_build_job(ticker: str, form_type: Optional[str]) -> JSONResponse:
+    job = await run_blocking(service.enqueue_statement_build, ticker, uow.SqlAlchemyUnitOfWork(), form_type=form_type)
+    build_job_wakeup.set()
+    job_response = _build_job_response(job)
+    return JSONResponse(
+        status_code=202,
+        content=jsonable_encoder(job_response),
+        headers={"Location": job_response.status_url}
+    )
+
+
 @app.get("/api/financial/income/{ticker}")
-async def get_income_statements(ticker: str, request: Request, form_type: Optional[str] = None):
+async def get_income_statements(ticker: str, request: Request, form_type: Optional[str] = None,
+                                 response_format: Literal["records", "columnar"] = Query("records", alias="format"),
+                                 uow_instance: uow.AbstractUnitOfWork = Depends(get_request_uow)):
     # Validate that the company exists in our CSV
     if not service.validate_company_exists(ticker):
         raise HTTPException(
@@ -256,66 +586,36 @@ async def get_income_statements(ticker: str, request: Request, form_type: Option
 
     # Convert company name to ticker if needed
     validated_ticker = service.get_ticker_from_name_or_ticker(ticker)
-
-    # Check if user is authenticated
-    user_authenticated = is_authenticated(request)
-
-    # If not authenticated and no free queries left, reject request
-    if not user_authenticated and not check_free_query_limit(request):
-        raise HTTPException(
-            status_code=401,
-            detail="Free query limit exceeded. Please sign in to continue accessing financial data.",
-            headers={"X-Free-Limit-Exceeded": "true"}
-        )
+    service.record_company_lookup(validated_ticker)
 
     try:
-        with uow.SqlAlchemyUnitOfWork() as uow_instance:
-            combined_financial_statements = service.get_consolidated_income_statements(validated_ticker, uow_instance, form_type=form_type, retrieve_from_database=True, overwrite_database=False)
-
-        metrics = []
-        metric_names = combined_financial_statements.get_all_metrics()
-        sorted_periods = sorted(combined_financial_statements.get_all_periods(), key=lambda x: x.split(':')[0])
-
-        for metric_name in metric_names:
-            metric_series = combined_financial_statements.get_metric(metric_name)
-
-            if metric_series is not None:
-                values = {}
-
-                for period in sorted_periods:
-                    value = metric_series.get(period)
-                    try:
-                        if isinstance(value, pd.Series):
-                            if not value.empty and pd.notna(value.iloc[0]):
-                                values[period] = float(value.iloc[0])
-                        else:
-                            if pd.notna(value):
-                                values[period] = float(value)
-                    except (ValueError, TypeError, IndexError) as e:
-                        continue
-
-                metrics.append(FinancialMetric(
-                    name=metric_name,
-                    values=values
-                ))
-
-        # Track free query usage for non-authenticated users
-        if not user_authenticated:
-            increment_free_query_usage(request)
-
-        response_data = FinancialStatements(
-            ticker=combined_financial_statements.ticker,
-            form_type=combined_financial_statements.form_type,
-            metrics=metrics,
-            periods=sorted_periods
-        )
-
-        response = JSONResponse(content=response_data.dict())
-        if not user_authenticated:
-            response.headers["X-Free-Query-Used"] = "true"
-            response.headers["X-Remaining-Free-Queries"] = "0"
+        version = await run_blocking(service.get_statements_version, validated_ticker, uow_instance, form_type=form_type)
+        if version is None:
+            return await _accepted_build_job(validated_ticker, form_type)
+
+        content_encoding = "gzip" if _accepts_gzip(request) else None
+        cache_headers = {
+            "ETag": _response_etag("income", validated_ticker, form_type, version, response_format, content_encoding),
+            "Cache-Control": RESPONSE_CACHE_CONTROL,
+            "Vary": "Accept-Encoding"
+        }
+        if _etag_matches(request, cache_headers["ETag"]):
+            return Response(status_code=304, headers=cache_headers)
+        if content_encoding:
+            cache_headers["Content-Encoding"] = content_encoding
+
+        cache_key = f"income:{form_type}:{response_format}:{content_encoding or 'identity'}:{version}"
+        body = await run_blocking(service.get_cached_response, validated_ticker, cache_key)
+        if body is None:
+            combined_financial_statements = await run_blocking(
+                service.get_stored_income_statements, validated_ticker, uow_instance, form_type=form_type
+            )
+            if combined_financial_statements is None:
+                return await _accepted_build_job(validated_ticker, form_type)
+            body = await run_blocking(_encode_statements_response, combined_financial_statements, response_format, content_encoding)
+            await run_blocking(service.cache_response, validated_ticker, cache_key, body)
 
-        return response
+        return Response(content=body, media_type="application/json", headers=cache_headers)
 
     except Exception as e:
         print(f"--- Exception in /api/financial/income/{ticker} ---")
@@ -323,37 +623,98 @@ async def get_income_statements(ticker: str, request: Request, form_type: Option
         print("--------------------------------------------------")
         raise HTTPException(status_code=500, detail=f"Error fetching financial data for {ticker}: {str(e)}")
 
-@app.get("/api/financial/prices/{ticker}")
-async def get_price_data(ticker: str, days: int = 30):
-    try:
-        with uow.SqlAlchemyUnitOfWork() as uow_instance:
-            price_series = service.get_price_time_series(ticker, days, uow_instance)
+def _price_content(ticker: str, price_series) -> dict:
+    df = price_series.table()
+    if df.empty:
+        return {"ticker": ticker, "dates": [], "prices": [], "price_changes": []}
+
+    dates = [str(date) for date in df.index]
+    prices = [float(price) if pd.notna(price) and np.isfinite(price) else 0.0 for price in df['Price']]
+
+    price_changes = []
+    if 'Price_Change_Pct' in df.columns:
+        price_changes = [float(change) if pd.notna(change) and np.isfinite(change) else None
+                       for change in df['Price_Change_Pct']]
+
+    return {"ticker": ticker, "dates": dates, "prices": prices, "price_changes": price_changes}
 
-        df = price_series.table()
-        if df.empty:
-            return PriceDataResponse(ticker=ticker, dates=[], prices=[], price_changes=[])
 
-        dates = [str(date) for date in df.index]
-        prices = [float(price) if pd.notna(price) and np.isfinite(price) else 0.0 for price in df['Price']]
+def _progress_line(stage: str, data: dict, started: float, response_format: str) -> bytes:
+    if isinstance(data.get("table"), pd.DataFrame):
+        data = {**data, "table": _frame_content(data["table"], response_format)}
+    event = {"event": stage, "elapsed_seconds": round(time.perf_counter() - started, 3), **data}
+    return _encode_json(event) + b"\n"
 
-        price_changes = []
-        if 'Price_Change_Pct' in df.columns:
-            price_changes = [float(change) if pd.notna(change) and np.isfinite(change) else None
-                           for change in df['Price_Change_Pct']]
 
-        return PriceDataResponse(
-            ticker=ticker,
-            dates=dates,
-            prices=prices,
-            price_changes=price_changes
+@app.get("/api/financial/income/{ticker}/stream")
+async def stream_income_statements(request: Request, ticker: str, form_type: Optional[str] = None,
+                                   response_format: Literal["records", "columnar"] = Query("records", alias="format")):
+    if not service.validate_company_exists(ticker):
+        raise HTTPException(
+            status_code=422,
+            detail=f"Company '{ticker}' not found. Please select a valid company from the suggestions."
         )
+
+    validated_ticker = service.get_ticker_from_name_or_ticker(ticker)
+    service.record_company_lookup(validated_ticker)
+
+    async def stream():
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+        started = time.perf_counter()
+
+        def progress(stage, data):
+            loop.call_soon_threadsafe(events.put_nowait, (stage, data))
+
+        build = asyncio.ensure_future(run_build(
+            service.get_consolidated_income_statements, validated_ticker, uow.SqlAlchemyUnitOfWork(),
+            form_type=form_type, progress=progress
+        ))
+        yield _progress_line("started", {"ticker": validated_ticker, "form_type": form_type}, started, response_format)
+
+        while not (build.done() and events.empty()):
+            next_event = asyncio.ensure_future(events.get())
+            await asyncio.wait({next_event, build}, return_when=asyncio.FIRST_COMPLETED)
+            if next_event.done():
+                yield _progress_line(*next_event.result(), started, response_format)
+            else:
+                next_event.cancel()
+
+        try:
+            combined_financial_statements = build.result()
+        except Exception as e:
+            traceback.print_exc()
+            await refund_free_query(request)
+            yield _progress_line("error", {"detail": f"Error fetching financial data for {ticker}: {str(e)}"}, started, response_format)
+            return
+        if not combined_financial_statements:
+            await refund_free_query(request)
+            yield _progress_line("error", {"detail": f"No filings found for {ticker}"}, started, response_format)
+            return
+
+        content = await run_blocking(_statements_content, combined_financial_statements, response_format)
+        yield _progress_line("result", {"statements": content}, started, response_format)
+
+    return StreamingResponse(
+        stream(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/api/financial/prices/{ticker}")
+async def get_price_data(ticker: str, days: int = 30, uow_instance: uow.AbstractUnitOfWork = Depends(get_request_uow)):
+    try:
+        price_series = await run_blocking(service.get_price_time_series, ticker, days, uow_instance)
+        return PriceDataResponse(**_price_content(ticker, price_series))
     except Exception as e:
         print(f"--- Exception in /api/financial/prices/{ticker} ---")
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Error fetching price data: {str(e)}")
 
 @app.post("/api/financial/forecast/{ticker}")
-async def forecast_financial_data(ticker: str, request: Request, forecast_request: ForecastRequest, form_type: Optional[str] = None):
+async def forecast_financial_data(ticker: str, request: Request, forecast_request: ForecastRequest, form_type: Optional[str] = None,
+                                  uow_instance: uow.AbstractUnitOfWork = Depends(get_request_uow)):
     if not is_authenticated(request):
         raise HTTPException(
             status_code=401,
@@ -368,10 +729,20 @@ async def forecast_financial_data(ticker: str, request: Request, forecast_reques
         print(f"Form Type (query param): {form_type}")
         print(f"Forecast Years: {forecast_request.forecast_years}")
 
-        with uow.SqlAlchemyUnitOfWork() as uow_instance:
-            combined_financial_statements = service.get_consolidated_income_statements(
-                ticker, uow_instance, form_type=form_type
-            )
+        forecast_years = forecast_request.forecast_years
+        version = await run_blocking(service.get_statements_version, ticker, uow_instance, form_type=form_type)
+        if version is not None:
+            body = await run_blocking(service.get_cached_response, ticker, f"forecast:{form_type}:{forecast_years}:{version}")
+            if body is not None:
+                return Response(
+                    content=body,
+                    media_type="application/json",
+                    headers={"ETag": _response_etag("forecast", ticker, form_type, version, forecast_years)}
+                )
+
+        combined_financial_statements = await run_blocking(
+            service.get_consolidated_income_statements, ticker, uow_instance, form_type=form_type
+        )
 
         if not combined_financial_statements:
             raise HTTPException(
@@ -393,13 +764,7 @@ async def forecast_financial_data(ticker: str, request: Request, forecast_reques
                 detail=f"No financial data table available for forecasting for {ticker}."
             )
 
-        forecasted_df = forecasting.create_forecast_columns(
-            df,
-            forecasting.DEFAULT_FORECASTING_METHODS,
-            forecasting.DEFAULT_CALCULATED_METHODS,
-            periods=forecast_request.forecast_years,
-            verbose=False
-        )
+        forecasted_df = await run_blocking(service.forecast_financial_statements, combined_financial_statements, forecast_request.forecast_years)
 
         def parse_numeric(v):
             if v is None:
@@ -440,8 +805,19 @@ async def forecast_financial_data(ticker: str, request: Request, forecast_reques
             metrics=response_metrics,
             periods=sorted_periods
         )
-
-        return JSONResponse(content=response_data.dict())
+        body = _encode_json(response_data.dict())
+
+        if version is None:
+            version = await run_blocking(service.get_statements_version, ticker, uow_instance, form_type=form_type)
+        if version is None:
+            return Response(content=body, media_type="application/json")
+
+        await run_blocking(service.cache_response, ticker, f"forecast:{form_type}:{forecast_years}:{version}", body)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": _response_etag("forecast", ticker, form_type, version, forecast_years)}
+        )
 
     except HTTPException:
         raise
@@ -459,11 +835,75 @@ async def forecast_financial_data(ticker: str, request: Request, forecast_reques
         print("-----------------------------------------------------")
         raise HTTPException(status_code=500, detail=f"Error generating forecast for {ticker}: {str(e)}")
 
+def _batch_content(tickers: List[str], batch_request: BatchRequest, uow_instance: uow.AbstractUnitOfWork) -> dict:
+    resources = set(batch_request.resources)
+    results = {ticker: {} for ticker in tickers}
+    pending = {}
+
+    if "income" in resources:
+        statements = service.get_stored_income_statements_many(tickers, uow_instance, form_type=batch_request.form_type)
+        missing = [ticker for ticker in tickers if ticker not in statements]
+        jobs = service.enqueue_statement_builds(missing, uow.SqlAlchemyUnitOfWork(), form_type=batch_request.form_type)
+        pending = {ticker: job.id for ticker, job in jobs.items()}
+        for ticker in tickers:
+            statement = statements.get(ticker)
+            results[ticker]["income"] = _statements_content(statement, batch_request.format) if statement else None
+
+    price_series = None
+    if "prices" in resources:
+        price_series = service.get_price_time_series_many(tickers, batch_request.days, uow_instance)
+        for ticker in tickers:
+            results[ticker]["prices"] = _price_content(ticker, price_series[ticker])
+
+    if "valuation" in resources:
+        if batch_request.days < VALUATION_PRICE_DAYS:
+            price_series = None
+        valuations = service.calculate_valuations(
+            tickers, uow_instance, form_type=batch_request.form_type or "10-K", price_series=price_series
+        )
+        for ticker in tickers:
+            results[ticker]["valuation"] = valuations.get(ticker)
+
+    return {"results": results, "pending": pending}
+
+
+@app.post("/api/financial/batch")
+async def get_financial_batch(batch_request: BatchRequest, request: Request,
+                              uow_instance: uow.AbstractUnitOfWork = Depends(get_request_uow)):
+    if not is_authenticated(request):
+        raise HTTPException(
+            status_code=401,
+            detail="Authentication required for batch requests. Please sign in.",
+            headers={"X-Auth-Required": "true"}
+        )
+
+    tickers = []
+    errors = {}
+    for requested in batch_request.tickers:
+        if not service.validate_company_exists(requested):
+            errors[requested] = f"Company '{requested}' not found."
+            continue
+        ticker = service.get_ticker_from_name_or_ticker(requested)
+        if ticker not in tickers:
+            tickers.append(ticker)
+
+    try:
+        content = await run_blocking(_batch_content, tickers, batch_request, uow_instance)
+    except Exception as e:
+        print(f"--- Exception in /api/financial/batch ---")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Error fetching batch data: {str(e)}")
+
+    if content["pending"]:
+        build_job_wakeup.set()
+    content["errors"] = errors
+    return Response(content=_encode_json(content), media_type="application/json")
+
+
 @app.get("/api/financial/valuation/{ticker}")
-async def get_valuation(ticker: str, form_type: Optional[str] = "10-K"):
+async def get_valuation(ticker: str, form_type: Optional[str] = "10-K", uow_instance: uow.AbstractUnitOfWork = Depends(get_request_uow)):
     try:
-        with uow.SqlAlchemyUnitOfWork() as uow_instance:
-            data = service.calculate_valuation(ticker, uow_instance, form_type=form_type or "10-K")
+        data = await run_blocking(service.calculate_valuation, ticker, uow_instance, form_type=form_type or "10-K")
         return ValuationResponse(**data)
     except Exception as e:
         print(f"--- Exception in /api/financial/valuation/{ticker} ---")
@@ -471,10 +911,9 @@ async def get_valuation(ticker: str, form_type: Optional[str] = "10-K"):
         raise HTTPException(status_code=500, detail=f"Error calculating valuation for {ticker}: {str(e)}")
 
 @app.get("/api/financial/sec-filings-url/{ticker}")
-async def get_sec_filings_url(ticker: str, form_type: Optional[str] = "10-K"):
+async def get_sec_filings_url(ticker: str, form_type: Optional[str] = "10-K", uow_instance: uow.AbstractUnitOfWork = Depends(get_request_uow)):
     try:
-        with uow.SqlAlchemyUnitOfWork() as uow_instance:
-            sec_url = service.get_sec_filings_url(ticker=ticker, form_type=form_type, uow_instance=uow_instance)
+        sec_url = await run_blocking(service.get_sec_filings_url, ticker=ticker, form_type=form_type, uow_instance=uow_instance)
 
         return {"ticker": ticker, "form_type": form_type, "sec_filings_url": sec_url}
 
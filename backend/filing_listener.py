@@ -11,6 +11,7 @@ from aiohttp import web
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from adapters import metrics
 from service_layer import service, uow
 
 API_KEY = os.getenv("SEC_API_KEY")
@@ -34,6 +35,10 @@ start_time = time.time()
 message_count = 0
 last_message_time = time.time()
 
+LISTENER_FILINGS = metrics.REGISTRY.counter(
+    "equityalchemy_listener_filings_total", "Filings received from the SEC stream.", ("form_type",)
+)
+
 async def health_check(request):
     """HTTP health check endpoint for Fly.io"""
     try:
@@ -78,6 +83,9 @@ async def ping(request):
     """Simple ping endpoint for testing"""
     return web.json_response({"ping": "pong", "timestamp": time.time()})
 
+async def metrics_endpoint(request):
+    return web.Response(body=metrics.REGISTRY.render().encode("utf-8"), headers={"Content-Type": metrics.CONTENT_TYPE})
+
 async def start_health_server():
     """Start HTTP health check server"""
     try:
@@ -85,6 +93,7 @@ async def start_health_server():
         app.router.add_get('/', health_check)
         app.router.add_get('/health', health_check)
         app.router.add_get('/ping', ping)
+        app.router.add_get('/metrics', metrics_endpoint)
 
         # Add middleware to log all requests
         async def log_middleware(app, handler):
@@ -109,6 +118,7 @@ async def start_health_server():
         print("🏥 Health endpoints:")
         print("   - GET /")
         print("   - GET /health")
+        print("   - GET /metrics")
 
         # List all sites to confirm binding
         for site in runner.sites:
@@ -157,7 +167,8 @@ async def process_10k_filing(filing_data, retry_count=0):
             uow_instance=uow_instance,
             form_type="10-K",
             retrieve_from_database=False,
-            overwrite_database=True
+            overwrite_database=True,
+            latency_budget_seconds=None
         )
 
         print(f"✅ Successfully processed 10-K for {ticker}")
@@ -204,6 +215,24 @@ async def health_monitor():
             print(f"❌ Error in health monitor: {e}")
             break
 
+async def readable_name_batcher():
+    """Periodically resolve queued index names and refine statements built past the LLM deadline"""
+    interval = float(os.getenv("READABLE_NAME_BATCH_INTERVAL_SECONDS", "60"))
+    while not shutdown_event.is_set():
+        try:
+            await asyncio.sleep(interval)
+            refreshed = await asyncio.to_thread(service.refresh_readable_names, uow.SqlAlchemyUnitOfWork())
+            if refreshed:
+                print(f"🏷️ Stored {refreshed} readable index names")
+            refined = await asyncio.to_thread(service.refine_degraded_statements, uow.SqlAlchemyUnitOfWork())
+            if refined:
+                print(f"🏷️ Refined {refined} stored statements")
+        except asyncio.CancelledError:
+            print("🔄 Readable name batcher cancelled")
+            break
+        except Exception as e:
+            print(f"❌ Error in readable name batcher: {e}")
+
 async def websocket_client():
     global message_count, last_message_time
     retry_counter = 0
@@ -245,6 +274,7 @@ async def websocket_client():
 
                         for filing in filings:
                             print(f"📄 {filing['accessionNo']} {filing['formType']} {filing['filedAt']} CIK:{filing['cik']}")
+                            LISTENER_FILINGS.inc(form_type=filing['formType'])
 
                             if filing['formType'] == '10-K':
                                 print(f"🎯 Found 10-K filing! Starting background processing...")
@@ -388,8 +418,11 @@ async def main():
         except NotImplementedError:
             print("⚠️ Signal handlers not available on this platform")
 
+        readable_name_task = asyncio.create_task(readable_name_batcher())
+
         print(f"🔄 About to start websocket client...")
         await websocket_client()
+        readable_name_task.cancel()
         print(f"🔄 Websocket client returned...")
 
     except asyncio.CancelledError:
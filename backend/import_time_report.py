@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Per-module import time report for the API and listener entrypoints.
+
+Runs the import in a fresh interpreter with ``-X importtime`` and fails when
+the total exceeds IMPORT_TIME_BUDGET_SECONDS or when a module that should
+only load on first use (SEC API, yfinance, Gemini, matplotlib, Prophet) is
+pulled in at startup.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+IMPORT_TIME_BUDGET_SECONDS = float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", "3.0"))
+LAZY_MODULES = ("sec_api", "yfinance", "google.generativeai", "matplotlib", "prophet")
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_import_times(module: str) -> Dict[str, int]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [BACKEND_DIR, env.get("PYTHONPATH")]))
+    env.setdefault("DATABASE_URL", "sqlite://")
+    env.setdefault("SEC_API_KEY", "import-time-report")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    cumulative_us = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            cumulative_us[name.strip()] = int(cumulative.strip())
+    return cumulative_us
+
+
+def eagerly_imported_lazy_modules(import_times: Dict[str, int]) -> List[str]:
+    return sorted(
+        name for name in import_times
+        if any(name == lazy or name.startswith(f"{lazy}.") for lazy in LAZY_MODULES)
+    )
+
+
+def report(module: str, top: int = 15) -> bool:
+    import_times = measure_import_times(module)
+    total_seconds = import_times.get(module, 0) / 1e6
+    print(f"{module}: {total_seconds:.3f}s (budget {IMPORT_TIME_BUDGET_SECONDS:.1f}s)")
+    for name, cumulative in sorted(import_times.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {cumulative / 1e3:9.1f}ms  {name}")
+
+    eager = eagerly_imported_lazy_modules(import_times)
+    if eager:
+        print(f"  modules that should be imported lazily: {', '.join(eager)}")
+    return total_seconds <= IMPORT_TIME_BUDGET_SECONDS and not eager
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Report per-module import time for the entrypoints')
+    parser.add_argument('modules', nargs='*', default=['entrypoints.backend', 'filing_listener'], help='Modules to import')
+    parser.add_argument('--top', type=int, default=15, help='Number of slowest modules to list')
+
+    args = parser.parse_args()
+
+    results = [report(module, args.top) for module in args.modules]
+    sys.exit(0 if all(results) else 1)
@@ -8,7 +8,7 @@ def persist_statements(
     uow: AbstractUnitOfWork
 ) -> None:
     with uow:
-        uow.stmts.add_many(statements)
+        uow.stmts.bulk_upsert(statements)
         uow.commit()
 
 
@@ -17,7 +17,7 @@ def persist_single_statement(
     uow: AbstractUnitOfWork
 ) -> None:
     with uow:
-        uow.stmts.add(statement)
+        uow.stmts.upsert(statement)
         uow.commit()
 
 
@@ -53,6 +53,5 @@ def update_statement(
     uow: AbstractUnitOfWork
 ) -> None:
     with uow:
-        uow.stmts.delete(statement.ticker, statement.form_type)
-        uow.stmts.add(statement)
+        uow.stmts.upsert(statement)
         uow.commit()
@@ -1,17 +1,21 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Union
+from adapters import metrics
 
 np.float_ = np.float64
 
-try:
-    from prophet import Prophet
-    PROPHET_AVAILABLE = True
-except (ImportError, AttributeError) as e:
-    print(f"Warning: Prophet import failed ({e}). Prophet forecasting will not be available.")
-    PROPHET_AVAILABLE = False
+
+@lru_cache(maxsize=1)
+def _load_prophet():
+    try:
+        from prophet import Prophet
+        return Prophet
+    except (ImportError, AttributeError) as e:
+        print(f"Warning: Prophet import failed ({e}). Prophet forecasting will not be available.")
+        return None
 
 
 DEFAULT_FORECASTING_METHODS = {
@@ -73,8 +77,10 @@ def _fallback_growth_forecast(df: pd.DataFrame, key: str, periods: int = 5, defa
     return forecasts
 
 
+@metrics.track("prophet_forecast")
 def forecast_prophet(df: pd.DataFrame, key: str, periods: int = 5) -> List[float]:
-    if not PROPHET_AVAILABLE:
+    Prophet = _load_prophet()
+    if Prophet is None:
         print(f"Prophet not available. Using growth rate forecasting for {key} instead.")
         return _fallback_growth_forecast(df, key, periods)
     
@@ -205,6 +211,7 @@ def forecast_growth_rate(df: pd.DataFrame, key: str, periods: int = 5,
     return forecasts
 
 
+@metrics.track("forecast")
 def create_forecast_columns(df: pd.DataFrame, 
                            defaults: Optional[Dict[str, Dict[str, Any]]] = None,
                            defaults_calculated: Optional[Dict[str, Dict[str, Any]]] = None,
@@ -326,6 +333,8 @@ def plot_forecast(df: pd.DataFrame, metric_name: str, figsize: tuple = (12, 6))
         print(f"No data available for '{metric_name}'")
         return
     
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=figsize)
     
     if historical_years:
@@ -1,13 +1,23 @@
 from domain import model
+from adapters import metrics
+from adapters.cache import get_shared_cache
+from adapters.company_csv import CsvCompanyDirectorySource
+from adapters.frame_codec import decode_frame, encode_frame
+from domain.index_matching import IndexMatcher, IndexMatchResult, humanize_tag
 from service_layer import uow
+from service_layer.single_flight import SingleFlight
 import pandas as pd
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import List, Dict, Set
+from functools import partial
+from typing import Callable, List, Dict, Optional, Set
+import json
 import os
 import re
+import threading
 import time
-from sec_api import MappingApi
+import traceback
 from sqlalchemy import BigInteger
 import csv
 import os
@@ -15,6 +25,18 @@ from typing import Dict, List, Tuple
 import supplement_balance_sheets 
 
 
+LLM_LATENCY_BUDGET_SECONDS = float(os.getenv("LLM_LATENCY_BUDGET_SECONDS", "20"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+LATE_LLM_MAPPINGS_MAX_SIZE = 256
+VALUATION_CACHE_TTL_SECONDS = float(os.getenv("VALUATION_CACHE_TTL_SECONDS", "300"))
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "3600"))
+
+_llm_executor = ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY, thread_name_prefix="llm-mapping")
+_late_llm_mappings: Dict[tuple, dict] = {}
+_late_llm_mappings_lock = threading.Lock()
+_statement_builds = SingleFlight()
+
+
 def get_price_time_series(ticker: str, days: int = 30, uow_instance: uow.AbstractUnitOfWork = None) -> model.PriceTimeSeries:
     from datetime import date, timedelta
     end_date = date.today()
@@ -24,32 +46,22 @@ def get_price_time_series(ticker: str, days: int = 30, uow_instance: uow.Abstrac
         return model.PriceTimeSeries(ticker, price_points)
 
 
+def get_price_time_series_many(tickers: list[str], days: int = 30, uow_instance: uow.AbstractUnitOfWork = None) -> Dict[str, model.PriceTimeSeries]:
+    from datetime import date, timedelta
+    end_date = date.today()
+    start_date = end_date - timedelta(days=days)
+    with uow_instance as uowx:
+        price_points = uowx.market_data.fetch_prices_many(tickers, start_date, end_date)
+    return {ticker: model.PriceTimeSeries(ticker, price_points.get(ticker.upper(), [])) for ticker in tickers}
+
+
 def get_all_tickers(uow_instance: uow.AbstractUnitOfWork) -> list[str]:
     with uow_instance as uow:
         return uow.stmts.get_all_tickers()
 
 
 def _parse_numeric_from_df_value(value):
-    try:
-        if value is None:
-            return None
-        # Handle numpy types
-        if hasattr(value, 'dtype'):
-            try:
-                return float(value)
-            except Exception:
-                pass
-        if isinstance(value, str):
-            vv = value.replace(",", "").replace("$", "").strip()
-            return float(vv) if vv not in ("", "-") else None
-        if isinstance(value, (int, float)) or hasattr(value, '__float__'):
-            return float(value)
-        if hasattr(value, "iloc"):
-            if not value.empty and pd.notna(value.iloc[0]):
-                return float(value.iloc[0])
-        return None
-    except Exception:
-        return None
+    return model.FinancialFact.parse_value(value)
 
 
 def _select_latest_annual_column(df: pd.DataFrame) -> str | None:
@@ -91,39 +103,173 @@ def _build_balance_sheet_df_from_filings(combined: model.CombinedFinancialStatem
         return None
 
 
+def get_cache_stats() -> dict:
+    return get_shared_cache().stats()
+
+
 def _get_balance_df_from_db_any_form(ticker: str, preferred_form_type: str, uow_instance: uow.AbstractUnitOfWork) -> pd.DataFrame | None:
     with uow_instance as uowx:
-        stmt = uowx.stmts.get_balance_sheet(ticker, preferred_form_type)
-    if stmt and getattr(stmt, "balance_sheet_df", None) is not None and not stmt.balance_sheet_df.empty:
-        return stmt.balance_sheet_df
+        return uowx.stmts.get_preferred_balance_sheet(ticker, preferred_form_type)
+
+
+VALUATION_BALANCE_METRICS = [
+    "CashAndCashEquivalents",
+    "ShortTermInvestments",
+    "ShortTermDebtAndCurrentMaturities",
+    "LongTermDebt",
+    "LeaseLiabilitiesCurrent",
+    "LeaseLiabilitiesNoncurrent",
+    "PreferredStock",
+    "NoncontrollingInterestEquity",
+]
+
+
+VALUATION_INPUT_FIELDS = {
+    "CashAndCashEquivalents": "cash_and_cash_equivalents",
+    "ShortTermInvestments": "short_term_investments",
+    "ShortTermDebtAndCurrentMaturities": "short_term_debt_and_current_maturities",
+    "LongTermDebt": "long_term_debt",
+    "LeaseLiabilitiesCurrent": "lease_liabilities_current",
+    "LeaseLiabilitiesNoncurrent": "lease_liabilities_noncurrent",
+    "PreferredStock": "preferred_stock",
+    "NoncontrollingInterestEquity": "noncontrolling_interest",
+}
+
+
+def _get_latest_balance_metrics_from_facts(ticker: str, preferred_form_type: str, metrics: list[str], uow_instance: uow.AbstractUnitOfWork) -> Tuple[str | None, Dict[str, float]]:
     with uow_instance as uowx:
-        stmt = uowx.stmts.get_balance_sheet(ticker, "10-K")
-    if stmt and getattr(stmt, "balance_sheet_df", None) is not None and not stmt.balance_sheet_df.empty:
-        return stmt.balance_sheet_df
+        facts = uowx.stmts.get_facts(ticker, metrics=metrics, statement_type=model.FinancialFact.BALANCE_SHEET)
+    return _latest_balance_metrics(facts, preferred_form_type)
+
+
+def _latest_balance_metrics(facts: list[model.FinancialFact], preferred_form_type: str) -> Tuple[str | None, Dict[str, float]]:
+    if not facts:
+        return None, {}
+    for form_type in (preferred_form_type, "10-K", "10-Q"):
+        form_facts = [fact for fact in facts if fact.form_type == form_type]
+        if form_facts:
+            break
+    else:
+        form_facts = facts
+    latest_period = max((fact.period_start, fact.period_end) for fact in form_facts)
+    latest_facts = [fact for fact in form_facts if (fact.period_start, fact.period_end) == latest_period]
+    return latest_facts[0].period, {fact.metric: fact.value for fact in latest_facts}
+
+
+def calculate_valuation(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_type: str = "10-K") -> dict:
+    cache = get_shared_cache()
+    cache_field = f"valuation:{form_type}"
+    cached = cache.get(ticker, cache_field)
+    if cached is not None:
+        return json.loads(cached)
+
+    valuation = _calculate_valuation(ticker, uow_instance, form_type)
+    cache.set(ticker, cache_field, json.dumps(valuation).encode('utf-8'), ttl_seconds=VALUATION_CACHE_TTL_SECONDS)
+    return valuation
+
+
+def calculate_valuations(tickers: list[str], uow_instance: uow.AbstractUnitOfWork, form_type: str = "10-K",
+                         price_series: Optional[Dict[str, model.PriceTimeSeries]] = None) -> Dict[str, dict]:
+    from domain.valuation import compute_valuations
+    cache = get_shared_cache()
+    cache_field = f"valuation:{form_type}"
+    valuations = {}
+    pending = []
+    for ticker in dict.fromkeys(tickers):
+        cached = cache.get(ticker, cache_field)
+        if cached is not None:
+            valuations[ticker] = json.loads(cached)
+        else:
+            pending.append(ticker)
+    if not pending:
+        return valuations
+
     with uow_instance as uowx:
-        stmt = uowx.stmts.get_balance_sheet(ticker, "10-Q")
-    if stmt and getattr(stmt, "balance_sheet_df", None) is not None and not stmt.balance_sheet_df.empty:
-        return stmt.balance_sheet_df
+        facts = uowx.stmts.get_facts_for_tickers(pending, metrics=VALUATION_BALANCE_METRICS, statement_type=model.FinancialFact.BALANCE_SHEET)
+        companies = uowx.companies.get_by_tickers(pending)
+    facts_by_ticker = {}
+    for fact in facts:
+        facts_by_ticker.setdefault(fact.ticker, []).append(fact)
+
+    for ticker in pending:
+        if ticker in facts_by_ticker:
+            continue
+        balance_df = _get_balance_df_from_db_any_form(ticker, form_type, uow_instance)
+        valuations[ticker] = calculate_valuation(ticker, uow_instance, form_type) if balance_df is not None else None
+    batch = [ticker for ticker in pending if ticker in facts_by_ticker]
+    if not batch:
+        return valuations
+
+    if price_series is None:
+        price_series = get_price_time_series_many(batch, 30, uow_instance)
+    periods = {}
+    rows = {}
+    for ticker in batch:
+        periods[ticker], values = _latest_balance_metrics(facts_by_ticker[ticker], form_type)
+        missing = [metric for metric in VALUATION_BALANCE_METRICS if metric not in values]
+        if missing:
+            balance_df = _normalize_balance_df(_get_balance_df_from_db_any_form(ticker, form_type, uow_instance))
+            frame_period = _frame_period(balance_df, periods[ticker])
+            for metric in missing:
+                num = _balance_metric_from_frame(balance_df, metric, frame_period)
+                if num is not None:
+                    values[metric] = num
+        series = price_series.get(ticker)
+        company = companies.get(ticker)
+        rows[ticker] = {
+            "price": float(series.most_recent_price().price) if series and series.price_points else None,
+            "shares_outstanding": company.shares_outstanding if company else None,
+            **{field: values.get(metric, 0.0) for metric, field in VALUATION_INPUT_FIELDS.items()},
+        }
+
+    inputs = pd.DataFrame.from_dict(rows, orient="index")
+    results = compute_valuations(inputs)
+    for ticker in batch:
+        row = inputs.loc[ticker]
+        result = results.loc[ticker]
+        valuation = {
+            "ticker": ticker,
+            "as_of_period": periods[ticker],
+            "price": rows[ticker]["price"],
+            "shares_outstanding": rows[ticker]["shares_outstanding"],
+            "market_cap": None if pd.isna(result["market_cap"]) else float(result["market_cap"]),
+            "enterprise_value": None if pd.isna(result["enterprise_value"]) else float(result["enterprise_value"]),
+            "components": {
+                "cash_and_cash_equivalents": float(row["cash_and_cash_equivalents"]),
+                "short_term_investments": float(row["short_term_investments"]),
+                "total_debt": float(result["total_debt"]),
+                "net_cash": float(result["net_cash"]),
+                "net_debt": float(result["net_debt"]),
+                "preferred_stock": float(row["preferred_stock"]),
+                "noncontrolling_interest": float(row["noncontrolling_interest"]),
+            },
+        }
+        cache.set(ticker, cache_field, json.dumps(valuation).encode('utf-8'), ttl_seconds=VALUATION_CACHE_TTL_SECONDS)
+        valuations[ticker] = valuation
+    return valuations
+
+
+def _balance_metric_from_frame(balance_df: pd.DataFrame | None, metric: str, period_col: str | None) -> float | None:
+    if balance_df is None or period_col is None or metric not in balance_df.index:
+        return None
     try:
-        with uow_instance as uowx:
-            stmts = uowx.stmts.get_by_ticker(ticker)
-        for s in stmts:
-            bs = getattr(s, "balance_sheet_df", None)
-            if bs is not None and not bs.empty:
-                return bs
+        val = balance_df.loc[metric, period_col]
     except Exception:
-        pass
-    return None
+        val = None
+    if val is None:
+        try:
+            row = balance_df.loc[metric]
+            if hasattr(row, 'keys'):
+                cols = list(row.keys())
+                if cols:
+                    latest_col = sorted([str(c) for c in cols], key=lambda c: c.split(":")[0])[-1]
+                    val = row.get(latest_col, None)
+        except Exception:
+            val = None
+    return _parse_numeric_from_df_value(val)
 
 
-def calculate_valuation(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_type: str = "10-K") -> dict:
-    from domain.valuation import ValuationInputs, compute_valuation
-    balance_df = _get_balance_df_from_db_any_form(ticker, form_type, uow_instance)
-    if balance_df is None or balance_df.empty:
-        with uow_instance as uowx:
-            combined = get_consolidated_income_statements(ticker, uowx, form_type=form_type, retrieve_from_database=True, overwrite_database=False)
-        balance_df = _build_balance_sheet_df_from_filings(combined) if combined else None
-    # normalize index/columns to strings for reliable lookup
+def _normalize_balance_df(balance_df: pd.DataFrame | None) -> pd.DataFrame | None:
     if balance_df is not None and not balance_df.empty:
         try:
             balance_df = balance_df.copy()
@@ -131,33 +277,37 @@ def calculate_valuation(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_
             balance_df.columns = [str(c) for c in balance_df.columns]
         except Exception:
             pass
-    period_col = _select_latest_annual_column(balance_df) if balance_df is not None else None
-    if balance_df is not None and period_col is not None and period_col not in balance_df.columns:
-        try:
-            period_col = list(balance_df.columns)[-1]
-        except Exception:
-            period_col = None
+    return balance_df
+
+
+def _frame_period(balance_df: pd.DataFrame | None, preferred_period: str | None) -> str | None:
+    if balance_df is None or balance_df.empty:
+        return preferred_period
+    if preferred_period in balance_df.columns:
+        return preferred_period
+    if preferred_period is None:
+        return _select_latest_annual_column(balance_df)
+    return list(balance_df.columns)[-1]
+
+
+def _calculate_valuation(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_type: str = "10-K") -> dict:
+    from domain.valuation import ValuationInputs, compute_valuation
+    fact_period, fact_values = _get_latest_balance_metrics_from_facts(ticker, form_type, VALUATION_BALANCE_METRICS, uow_instance)
+    balance_df = None
+    if any(metric not in fact_values for metric in VALUATION_BALANCE_METRICS):
+        balance_df = _get_balance_df_from_db_any_form(ticker, form_type, uow_instance)
+    if not fact_values and (balance_df is None or balance_df.empty):
+        with uow_instance as uowx:
+            combined = get_consolidated_income_statements(ticker, uowx, form_type=form_type, retrieve_from_database=True, overwrite_database=False)
+        balance_df = _build_balance_sheet_df_from_filings(combined) if combined else None
+    balance_df = _normalize_balance_df(balance_df)
+    frame_period = _frame_period(balance_df, fact_period)
+    period_col = fact_period if fact_values else frame_period
     def get_metric(metric: str) -> float:
-        if balance_df is None or period_col is None:
-            return 0.0
-        if metric not in balance_df.index:
-            return 0.0
-        try:
-            val = balance_df.loc[metric, period_col]
-        except Exception:
-            val = None
-        if val is None:
-            try:
-                row = balance_df.loc[metric]
-                if hasattr(row, 'keys'):
-                    cols = list(row.keys())
-                    if cols:
-                        latest_col = sorted([str(c) for c in cols], key=lambda c: c.split(":")[0])[-1]
-                        val = row.get(latest_col, None)
-            except Exception:
-                val = None
-        num = _parse_numeric_from_df_value(val)
-        return float(num) if num is not None else 0.0
+        if metric in fact_values:
+            return fact_values[metric]
+        num = _balance_metric_from_frame(balance_df, metric, frame_period)
+        return num if num is not None else 0.0
     cash = get_metric("CashAndCashEquivalents")
     sti = get_metric("ShortTermInvestments")
     std = get_metric("ShortTermDebtAndCurrentMaturities")
@@ -208,6 +358,27 @@ def calculate_valuation(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_
         },
     }
 
+def forecast_financial_statements(combined_statements: model.CombinedFinancialStatements, forecast_years: int) -> pd.DataFrame:
+    from service_layer import forecasting
+    cache = get_shared_cache()
+    cache_field = f"forecast:{combined_statements.form_type}:{forecast_years}"
+    cached = cache.get(combined_statements.ticker, cache_field)
+    if cached is not None:
+        return decode_frame(bytearray(cached))
+
+    forecasted_df = forecasting.create_forecast_columns(
+        combined_statements.df,
+        forecasting.DEFAULT_FORECASTING_METHODS,
+        forecasting.DEFAULT_CALCULATED_METHODS,
+        periods=forecast_years,
+        verbose=False
+    )
+    encoded = encode_frame(forecasted_df)
+    if encoded is not None:
+        cache.set(combined_statements.ticker, cache_field, encoded)
+    return forecasted_df
+
+
 def update_shares_outstanding(ticker: str, uow_instance: uow.AbstractUnitOfWork):
     with uow_instance as uow:
         try:
@@ -258,6 +429,7 @@ def supplement_company_data(ticker: str, uow: uow.AbstractUnitOfWork) -> model.C
             return company
 
         # Fetch supplemental data from SEC API
+        from sec_api import MappingApi
         mapping_api = MappingApi(os.getenv("SEC_API_KEY"))
         try:
             supplemental_data = mapping_api.resolve("ticker", ticker)[0]
@@ -430,83 +602,230 @@ def get_dataframe_from_ticker(ticker: str, repository_or_uow):
 
 
 def format_dataframe_indexes(dataframe: pd.DataFrame, uow_instance: uow.AbstractUnitOfWork) -> pd.DataFrame:
-    if dataframe.empty or not uow_instance.llm:
-        return dataframe
+    df, _ = format_dataframe_indexes_with_fallbacks(dataframe, uow_instance)
+    return df
+
+
+def format_dataframe_indexes_with_fallbacks(dataframe: pd.DataFrame, uow_instance: uow.AbstractUnitOfWork) -> Tuple[pd.DataFrame, bool]:
+    if dataframe.empty:
+        return dataframe, False
 
     df = dataframe.copy()
-    index_mapping = uow_instance.llm.make_index_readable(df.index.tolist())
-    df.index = [index_mapping.get(idx, idx) for idx in df.index]
+    index_names = list(dict.fromkeys(df.index.tolist()))
+    with uow_instance as uowx:
+        index_mapping = uowx.readable_names.get_many(index_names)
+        unknown_names = [name for name in index_names if name not in index_mapping]
+        if unknown_names:
+            uowx.readable_names.enqueue(unknown_names)
+            uowx.commit()
+
+    if unknown_names:
+        print(f"Queued {len(unknown_names)} unknown index names for readable naming")
+    df.index = [index_mapping.get(idx, humanize_tag(idx)) for idx in df.index]
+
+    return df, bool(unknown_names)
+
+
+def refresh_readable_names(uow_instance: uow.AbstractUnitOfWork, batch_size: int = 200) -> int:
+    with uow_instance as uowx:
+        llm = uowx.llm
+        pending_names = uowx.readable_names.claim_pending(batch_size) if llm else []
+        uowx.commit()
+    if not pending_names:
+        return 0
+
+    print(f"Requesting readable names for {len(pending_names)} queued index names")
+    index_mapping = llm.make_index_readable(pending_names)
+    if not index_mapping:
+        print("LLM returned no readable names, leaving names queued")
+        return 0
+
+    readable_names = {name: index_mapping.get(name) or humanize_tag(name) for name in pending_names}
+
+    with uow_instance as uowx:
+        uowx.readable_names.add_many(readable_names)
+        uowx.commit()
+    return len(readable_names)
+
+
+def _prepare_index_mapping(base_df: pd.DataFrame, current_df: pd.DataFrame, uow_instance: uow.AbstractUnitOfWork) -> Tuple[dict, Optional[IndexMatchResult]]:
+    base_indices = base_df.index.tolist()
+    current_indices = current_df.index.tolist()
+
+    with uow_instance as uowx:
+        cached_mapping = uowx.mappings.get(base_indices, current_indices)
+        if cached_mapping is None:
+            equivalences = uowx.mappings.get_equivalences(base_indices + current_indices)
+    if cached_mapping is not None:
+        print(f"Reusing stored mapping for dataframes with {len(base_indices)} and {len(current_indices)} indices")
+        return cached_mapping, None
+
+    match_result = IndexMatcher().match(base_indices, current_indices, equivalences)
+    print(f"Pre-matched {len(match_result.mapping)} indices locally {match_result.stage_counts}; "
+          f"{len(match_result.unresolved_base)} and {len(match_result.unresolved_current)} left unresolved")
+    return dict(match_result.mapping), match_result
+
+
+def _residue_key(match_result: IndexMatchResult) -> tuple:
+    return tuple(sorted(match_result.unresolved_base)), tuple(sorted(match_result.unresolved_current))
 
-    return df
+
+def _request_llm_mapping(llm, base_df: pd.DataFrame, current_df: pd.DataFrame, match_result: IndexMatchResult) -> dict:
+    with _late_llm_mappings_lock:
+        late_mapping = _late_llm_mappings.pop(_residue_key(match_result), None)
+    if late_mapping:
+        print(f"Reusing late LLM mapping for {len(late_mapping)} indices")
+        return late_mapping
+
+    return llm.map_dataframes(
+        base_df[base_df.index.isin(match_result.unresolved_base)],
+        current_df[current_df.index.isin(match_result.unresolved_current)]
+    )
+
+
+def _remember_late_llm_mapping(residue_key: tuple, future: Future) -> None:
+    if future.cancelled() or future.exception() is not None or not future.result():
+        return
+    with _late_llm_mappings_lock:
+        _late_llm_mappings[residue_key] = future.result()
+        while len(_late_llm_mappings) > LATE_LLM_MAPPINGS_MAX_SIZE:
+            _late_llm_mappings.pop(next(iter(_late_llm_mappings)))
+
+
+def _merge_llm_mapping(index_mapping: dict, llm_mapping: dict) -> dict:
+    merged_mapping = dict(index_mapping)
+    used_targets = set(merged_mapping.values())
+    for source_idx, target_idx in llm_mapping.items():
+        if source_idx not in merged_mapping and target_idx not in used_targets:
+            merged_mapping[source_idx] = target_idx
+            used_targets.add(target_idx)
+    return merged_mapping
+
+
+def _store_index_mapping(base_df: pd.DataFrame, current_df: pd.DataFrame, index_mapping: dict, uow_instance: uow.AbstractUnitOfWork) -> None:
+    with uow_instance as uowx:
+        uowx.mappings.add(base_df.index.tolist(), current_df.index.tolist(), index_mapping)
+        uowx.mappings.record_equivalences(index_mapping)
+        uowx.commit()
+
+
+def get_index_mapping(base_df: pd.DataFrame, current_df: pd.DataFrame, uow_instance: uow.AbstractUnitOfWork) -> dict:
+    mappings, _ = get_index_mappings_within_budget(base_df, [current_df], uow_instance, latency_budget_seconds=None)
+    return mappings[0]
+
+
+def get_index_mappings_within_budget(base_df: pd.DataFrame, current_dfs: list[pd.DataFrame], uow_instance: uow.AbstractUnitOfWork,
+                                     latency_budget_seconds: Optional[float] = LLM_LATENCY_BUDGET_SECONDS) -> Tuple[list[dict], bool]:
+    base_indices = tuple(sorted(base_df.index.tolist()))
+    unique_frames = {}
+    frame_keys = []
+    for current_df in current_dfs:
+        frame_key = (base_indices, tuple(sorted(current_df.index.tolist())))
+        unique_frames.setdefault(frame_key, current_df)
+        frame_keys.append(frame_key)
+
+    prepared = {key: _prepare_index_mapping(base_df, current_df, uow_instance) for key, current_df in unique_frames.items()}
+
+    llm = uow_instance.llm
+    futures = {}
+    for key, (_, match_result) in prepared.items():
+        if match_result is not None and not match_result.is_complete and llm:
+            futures[key] = _llm_executor.submit(_request_llm_mapping, llm, base_df, unique_frames[key], match_result)
+
+    if futures:
+        _, not_done = wait(list(futures.values()), timeout=latency_budget_seconds)
+        if not_done:
+            print(f"LLM latency budget of {latency_budget_seconds}s expired with {len(not_done)} of {len(futures)} mappings pending")
+
+    degraded = False
+    resolved = {}
+    for key, (index_mapping, match_result) in prepared.items():
+        if match_result is None:
+            resolved[key] = index_mapping
+            continue
+
+        mapping_is_final = match_result.is_complete
+        future = futures.get(key)
+        if future is not None:
+            if future.done():
+                llm_mapping = future.result() if future.exception() is None else {}
+                mapping_is_final = bool(llm_mapping)
+                index_mapping = _merge_llm_mapping(index_mapping, llm_mapping)
+            else:
+                degraded = True
+                mapping_is_final = False
+                future.add_done_callback(partial(_remember_late_llm_mapping, _residue_key(match_result)))
+
+        if index_mapping and mapping_is_final:
+            _store_index_mapping(base_df, unique_frames[key], index_mapping, uow_instance)
+        resolved[key] = index_mapping
+
+    return [resolved[key] for key in frame_keys], degraded
 
 
 def join_financial_statements_with_mapping(financial_statements: list[pd.DataFrame], uow_instance: uow.AbstractUnitOfWork) -> pd.DataFrame:
+    result_df, _ = join_financial_statements_within_budget(financial_statements, uow_instance, latency_budget_seconds=None)
+    return result_df
+
+
+def join_financial_statements_within_budget(financial_statements: list[pd.DataFrame], uow_instance: uow.AbstractUnitOfWork,
+                                            latency_budget_seconds: Optional[float] = LLM_LATENCY_BUDGET_SECONDS) -> Tuple[pd.DataFrame, bool]:
     if len(financial_statements) < 2:
         if financial_statements and hasattr(financial_statements[0], 'copy'):
-            return financial_statements[0].copy()
+            return financial_statements[0].copy(), False
         elif financial_statements:
             if isinstance(financial_statements[0], pd.DataFrame):
-                return financial_statements[0].copy()
+                return financial_statements[0].copy(), False
             else:
-                return pd.DataFrame()
+                return pd.DataFrame(), False
         else:
-            return pd.DataFrame()
+            return pd.DataFrame(), False
 
     if not isinstance(financial_statements[0], pd.DataFrame):
         raise TypeError("Expected a DataFrame object, but got {0}".format(type(financial_statements[0])))
 
     result_df = financial_statements[0].copy()
 
-    mapping_cache = {}
-
     for i, statement in enumerate(financial_statements[1:], 1):
         if not isinstance(statement, pd.DataFrame):
             raise TypeError("Expected a DataFrame object at index {0}, but got {1}".format(i, type(statement)))
 
-        current_df = statement
+    statements_to_map = [statement for statement in financial_statements[1:] if not statement.empty]
+    if not uow_instance.llm or not statements_to_map:
+        return result_df, False
 
-        if current_df.empty:
-            continue
+    index_mappings, degraded = get_index_mappings_within_budget(
+        financial_statements[0], statements_to_map, uow_instance, latency_budget_seconds
+    )
 
-        if uow_instance.llm:
-            base_indices = tuple(sorted(financial_statements[0].index.tolist()))
-            current_indices = tuple(sorted(current_df.index.tolist()))
-            cache_key = (base_indices, current_indices)
+    for current_df, index_mapping in zip(statements_to_map, index_mappings):
+        mapped_df = current_df.copy()
+        new_index = []
 
-            if cache_key in mapping_cache:
-                print(f"Reusing cached mapping for dataframes with {len(base_indices)} and {len(current_indices)} indices")
-                index_mapping = mapping_cache[cache_key]
-            else:
-                index_mapping = uow_instance.llm.map_dataframes(financial_statements[0], current_df)
-                mapping_cache[cache_key] = index_mapping
-
-            mapped_df = current_df.copy()
-            new_index = []
-
-            for idx in current_df.index:
-                found = False
-                for base_idx, mapped_idx in index_mapping.items():
-                    if idx == mapped_idx:
-                        new_index.append(base_idx)
-                        found = True
-                        break
-
-                if not found:
-                    new_index.append(idx)
-
-            mapped_df.index = new_index
-
-            new_columns = [col for col in mapped_df.columns if col not in result_df.columns]
-            if new_columns:
-                for col in new_columns:
-                    for idx in result_df.index:
-                        if idx in mapped_df.index:
-                            if hasattr(mapped_df.loc[idx, col], '__len__') and len(mapped_df.loc[idx, col]) > 1:
-                                print('indexer found more than one value for the same index, skipping...')
-                                continue
-                            result_df.loc[idx, col] = mapped_df.loc[idx, col]
+        for idx in current_df.index:
+            found = False
+            for base_idx, mapped_idx in index_mapping.items():
+                if idx == mapped_idx:
+                    new_index.append(base_idx)
+                    found = True
+                    break
 
-    return result_df
+            if not found:
+                new_index.append(idx)
+
+        mapped_df.index = new_index
+
+        new_columns = [col for col in mapped_df.columns if col not in result_df.columns]
+        if new_columns:
+            for col in new_columns:
+                for idx in result_df.index:
+                    if idx in mapped_df.index:
+                        if hasattr(mapped_df.loc[idx, col], '__len__') and len(mapped_df.loc[idx, col]) > 1:
+                            print('indexer found more than one value for the same index, skipping...')
+                            continue
+                        result_df.loc[idx, col] = mapped_df.loc[idx, col]
+
+    return result_df, degraded
 
 
 def load_data(filing: model.Filing, uow_instance: uow.AbstractUnitOfWork) -> model.Filing:
@@ -526,7 +845,9 @@ def get_sec_filings_url(ticker: str = None, cik: str = None, form_type: str = '1
         cik = uow_instance.sec_filings.get_cik_by_ticker(ticker)
     return f"https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={cik}&type={form_type}&dateb=&owner=include&count=40"
 
-def get_consolidated_income_statements(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_type: str = None, retrieve_from_database: bool = True, overwrite_database: bool = False) -> model.CombinedFinancialStatements:
+def get_consolidated_income_statements(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_type: str = None, retrieve_from_database: bool = True, overwrite_database: bool = False,
+                                       latency_budget_seconds: Optional[float] = LLM_LATENCY_BUDGET_SECONDS,
+                                       progress: Optional[Callable[[str, dict], None]] = None) -> model.CombinedFinancialStatements:
     if retrieve_from_database:
         with uow_instance as uow:
             saved_statements = uow.stmts.get(ticker, form_type)
@@ -535,22 +856,75 @@ def get_consolidated_income_statements(ticker: str, uow_instance: uow.AbstractUn
             return saved_statements
         print('no statements found in database')
 
+        combined_statements, shared = _statement_builds.do(
+            (ticker, form_type),
+            partial(_build_statements_once, ticker, uow_instance, form_type, latency_budget_seconds, progress)
+        )
+        if shared:
+            print(f"Reused the in-flight build of {ticker} {form_type}")
+        return combined_statements
+
+    with uow_instance as uow, metrics.track("consolidate"):
+        uow.stmts.lock_statement_build(ticker, form_type)
+        return _build_consolidated_income_statements(ticker, uow, form_type, retrieve_from_database, overwrite_database, latency_budget_seconds, progress)
+
+
+@metrics.track("consolidate")
+def _build_statements_once(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_type: Optional[str],
+                           latency_budget_seconds: Optional[float],
+                           progress: Optional[Callable[[str, dict], None]] = None) -> model.CombinedFinancialStatements:
+    with uow_instance as uow:
+        uow.stmts.lock_statement_build(ticker, form_type)
+        saved_statements = uow.stmts.get(ticker, form_type)
+        if saved_statements:
+            print(f"{ticker} {form_type} was built by another worker while waiting")
+            return saved_statements
+        return _build_consolidated_income_statements(ticker, uow, form_type, True, False, latency_budget_seconds, progress)
+
+
+def _report_progress(progress: Optional[Callable[[str, dict], None]], stage: str, **data) -> None:
+    if progress is None:
+        return
+    try:
+        progress(stage, data)
+    except Exception as e:
+        print(f"Error reporting {stage} progress: {e}")
+
+
+def _build_consolidated_income_statements(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_type: Optional[str],
+                                          retrieve_from_database: bool, overwrite_database: bool,
+                                          latency_budget_seconds: Optional[float],
+                                          progress: Optional[Callable[[str, dict], None]] = None) -> model.CombinedFinancialStatements:
     company = get_company_by_ticker(ticker, uow_instance)
+    partial_reported = False
+
+    def load(filing: model.Filing) -> None:
+        nonlocal partial_reported
+        load_data(filing, uow_instance)
+        _report_progress(progress, "filing_loaded", form=filing.form, accession_number=filing.accession_number,
+                         filing_date=filing.filing_date, has_data=bool(filing.data))
+        if progress is None or partial_reported or not filing.data or not filing.income_statement:
+            return
+        table = filing.income_statement.table
+        if not table.empty:
+            partial_reported = True
+            _report_progress(progress, "partial", form=filing.form, accession_number=filing.accession_number, table=table)
 
     if form_type == '10-Q':
         quarterly_filings_to_load = company.get_filings_by_type('10-Q')
+        _report_progress(progress, "filings_listed", form='10-Q', count=len(quarterly_filings_to_load))
 
         if not quarterly_filings_to_load:
             print('no 10-Q filings found')
             return None
 
         # get data for the first filing so we can get the number of years covered.
-        load_data(quarterly_filings_to_load[0], uow_instance)
+        load(quarterly_filings_to_load[0])
         quarterly_filings_to_load = company.select_filings_with_processing_pattern(quarterly_filings_to_load, '10-Q')
 
         # get all the data for the quarterly filings
         for filing in quarterly_filings_to_load:
-            load_data(filing, uow_instance)
+            load(filing)
         # remove filings with no data
         quarterly_filings_to_load = [filing for filing in quarterly_filings_to_load if filing.data]
 
@@ -559,9 +933,10 @@ def get_consolidated_income_statements(ticker: str, uow_instance: uow.AbstractUn
             years_covered_by_quarterly_filings.append(filing.cover_page.document_fiscal_year_focus)
 
         annual_filings_to_load = company.get_filings_by_type('10-K')
+        _report_progress(progress, "filings_listed", form='10-K', count=len(annual_filings_to_load))
         # get all the data for the annual filings
         for filing in annual_filings_to_load:
-            load_data(filing, uow_instance)
+            load(filing)
         # remove filings with no data
         annual_filings_to_load = [filing for filing in annual_filings_to_load if filing.data and len(filing.data) > 3]
 
@@ -573,6 +948,7 @@ def get_consolidated_income_statements(ticker: str, uow_instance: uow.AbstractUn
 
     elif form_type == '10-K':
         annual_filings_to_load = company.get_filings_by_type('10-K')
+        _report_progress(progress, "filings_listed", form='10-K', count=len(annual_filings_to_load))
 
         if not annual_filings_to_load:
             print('no 10-K filings found')
@@ -580,7 +956,7 @@ def get_consolidated_income_statements(ticker: str, uow_instance: uow.AbstractUn
 
         data_found = False
         for filing in annual_filings_to_load:
-            load_data(filing, uow_instance)
+            load(filing)
             if filing.data:
                 data_found = True
                 break
@@ -591,7 +967,7 @@ def get_consolidated_income_statements(ticker: str, uow_instance: uow.AbstractUn
         annual_filings_to_load = company.select_filings_with_processing_pattern(annual_filings_to_load, '10-K')
 
         for filing in annual_filings_to_load:
-            load_data(filing, uow_instance)
+            load(filing)
 
             filing_url = uow_instance.sec_filings.get_filing_url(
                 filing.cik,
@@ -623,20 +999,34 @@ def get_consolidated_income_statements(ticker: str, uow_instance: uow.AbstractUn
     if not filings_to_load:
         return model.CombinedFinancialStatements([], ticker, form_type)
 
-    income_statements = [filing.income_statement for filing in filings_to_load if filing.income_statement]
-    combined_statements = model.CombinedFinancialStatements(income_statements, filings_to_load, ticker, company.name, form_type)
+    with metrics.track("xbrl_parse"):
+        income_statements = [filing.income_statement for filing in filings_to_load if filing.income_statement]
+    with metrics.track("combine"):
+        combined_statements = model.CombinedFinancialStatements(income_statements, filings_to_load, ticker, company.name, form_type)
 
+    used_fallback_names = False
     if uow_instance.llm and len(income_statements) > 1:
-        tables = [stmt.table for stmt in income_statements if not stmt.table.empty]
+        with metrics.track("pivot"):
+            tables = [stmt.table for stmt in income_statements if not stmt.table.empty]
         if len(tables) > 1:
-            enhanced_df = join_financial_statements_with_mapping(tables, uow_instance)
-            enhanced_df = format_dataframe_indexes(enhanced_df, uow_instance)
+            with metrics.track("index_mapping"):
+                enhanced_df, mapping_degraded = join_financial_statements_within_budget(tables, uow_instance, latency_budget_seconds)
+                enhanced_df, used_fallback_names = format_dataframe_indexes_with_fallbacks(enhanced_df, uow_instance)
             combined_statements.df = enhanced_df
+            combined_statements.needs_refinement = mapping_degraded or used_fallback_names
+            if mapping_degraded:
+                print(f"Statements for {ticker} {form_type} built with partial index mapping, queued for refinement")
     elif uow_instance.llm:
-        combined_statements.df = format_dataframe_indexes(combined_statements.df, uow_instance)
+        combined_statements.df, used_fallback_names = format_dataframe_indexes_with_fallbacks(combined_statements.df, uow_instance)
+        combined_statements.needs_refinement = used_fallback_names
+    if used_fallback_names:
+        print(f"Statements for {ticker} {form_type} built with fallback index names, queued for refinement")
+
+    _report_progress(progress, "mapping_done", filings=len(filings_to_load), degraded=combined_statements.needs_refinement)
 
     if form_type == '10-Q':
-        combined_statements.create_implied_missing_quarters()
+        with metrics.track("implied_quarters"):
+            combined_statements.create_implied_missing_quarters()
 
     combined_statements.clean_dataframe()
 
@@ -650,19 +1040,126 @@ def get_consolidated_income_statements(ticker: str, uow_instance: uow.AbstractUn
     # supplement balance sheet
     result = supplement_balance_sheets.process_balance_sheet_for_ticker(ticker, uow_instance)
 
-    if overwrite_database:
-        with uow_instance as uow:
-            uow.stmts.delete(ticker, form_type)
-            uow.stmts.add(combined_statements)
-            uow.commit()
-    elif retrieve_from_database:
+    if overwrite_database or retrieve_from_database:
         with uow_instance as uow:
-            uow.stmts.add(combined_statements)
+            uow.stmts.upsert(combined_statements)
             uow.commit()
+        _report_progress(progress, "stored")
 
     return combined_statements
 
 
+def get_statements_version(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_type: str = None) -> Optional[str]:
+    with uow_instance as uowx:
+        return uowx.stmts.get_version(ticker, form_type)
+
+
+def get_cached_response(ticker: str, key: str) -> Optional[bytes]:
+    return get_shared_cache().get(ticker, f"response:{key}")
+
+
+def cache_response(ticker: str, key: str, body: bytes) -> None:
+    get_shared_cache().set(ticker, f"response:{key}", body, ttl_seconds=RESPONSE_CACHE_TTL_SECONDS)
+
+
+def get_stored_income_statements(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_type: str = None) -> Optional[model.CombinedFinancialStatements]:
+    with uow_instance as uowx:
+        return uowx.stmts.get(ticker, form_type)
+
+
+def enqueue_statement_build(ticker: str, uow_instance: uow.AbstractUnitOfWork, form_type: str = None) -> model.BuildJob:
+    with uow_instance as uowx:
+        job = uowx.build_jobs.enqueue(ticker, form_type)
+        uowx.commit()
+    return job
+
+
+def get_stored_income_statements_many(tickers: list[str], uow_instance: uow.AbstractUnitOfWork, form_type: str = None) -> Dict[str, model.CombinedFinancialStatements]:
+    with uow_instance as uowx:
+        return uowx.stmts.get_many(tickers, form_type)
+
+
+def enqueue_statement_builds(tickers: list[str], uow_instance: uow.AbstractUnitOfWork, form_type: str = None) -> Dict[str, model.BuildJob]:
+    if not tickers:
+        return {}
+    with uow_instance as uowx:
+        jobs = {ticker: uowx.build_jobs.enqueue(ticker, form_type) for ticker in tickers}
+        uowx.commit()
+    return jobs
+
+
+def get_build_job(job_id: str, uow_instance: uow.AbstractUnitOfWork) -> Optional[model.BuildJob]:
+    with uow_instance as uowx:
+        return uowx.build_jobs.get(job_id)
+
+
+def claim_build_jobs(uow_instance: uow.AbstractUnitOfWork, limit: int, max_running: int) -> list[model.BuildJob]:
+    with uow_instance as uowx:
+        jobs = uowx.build_jobs.claim_next(limit, max_running)
+        uowx.commit()
+    return jobs
+
+
+def run_build_job(job: model.BuildJob, uow_instance: uow.AbstractUnitOfWork) -> bool:
+    print(f"Running build job {job.id} for {job.ticker} {job.form_type}")
+    try:
+        combined_statements = get_consolidated_income_statements(
+            job.ticker, uow_instance, form_type=job.form_type,
+            retrieve_from_database=True, overwrite_database=False,
+            latency_budget_seconds=None
+        )
+        error = None if combined_statements else f"No filings found for {job.ticker}"
+    except Exception as e:
+        traceback.print_exc()
+        error = str(e) or type(e).__name__
+
+    with uow_instance as uowx:
+        if error:
+            uowx.build_jobs.mark_failed(job.id, error, job.attempts)
+        else:
+            uowx.build_jobs.mark_succeeded(job.id, job.attempts)
+        uowx.commit()
+    return error is None
+
+
+def heartbeat_build_jobs(jobs: list[model.BuildJob], uow_instance: uow.AbstractUnitOfWork) -> None:
+    with uow_instance as uowx:
+        uowx.build_jobs.heartbeat(jobs)
+        uowx.commit()
+
+
+def refine_degraded_statements(uow_instance: uow.AbstractUnitOfWork, limit: int = 5) -> int:
+    with uow_instance as uowx:
+        pending_statements = uowx.stmts.claim_statements_needing_refinement(limit)
+        uowx.commit()
+
+    refined = 0
+    for ticker, form_type in pending_statements:
+        try:
+            print(f"Refining stored statements for {ticker} {form_type}")
+            stmt = get_consolidated_income_statements(
+                ticker, uow_instance, form_type=form_type,
+                retrieve_from_database=False, overwrite_database=True,
+                latency_budget_seconds=None
+            )
+            if stmt is None:
+                with uow_instance as uowx:
+                    uowx.stmts.clear_refinement(ticker, form_type)
+                    uowx.commit()
+                continue
+            refined += 1
+        except Exception as e:
+            print(f"Error refining statements for {ticker} {form_type}: {e}")
+    return refined
+
+
+def backfill_binary_frames(uow_instance: uow.AbstractUnitOfWork, batch_size: int = 50) -> int:
+    with uow_instance as uowx:
+        converted = uowx.stmts.backfill_binary_frames(batch_size)
+        uowx.commit()
+    return converted
+
+
 def process_new_filings_from_csv(csv_path: str = "filing_urls.csv", uow_instance: uow.AbstractUnitOfWork = None) -> Dict[str, any]:
     if uow_instance is None:
         uow_instance = uow.SqlAlchemyUnitOfWork()
@@ -696,7 +1193,7 @@ def process_new_filings_from_csv(csv_path: str = "filing_urls.csv", uow_instance
                     results["details"].append(f"Could not find ticker for CIK: {cik}")
                     continue
 
-                existing_statements = uow.stmts.get(ticker, "10-K")
+                existing_statements = uow.stmts.get_income_statement(ticker, "10-K")
 
                 filing = model.Filing(cik, "10-K", "", accession_number, primary_document, True)
                 filing_data, cover_page = uow.sec_filings.get_filing_data(cik, accession_number, primary_document)
@@ -723,8 +1220,7 @@ def process_new_filings_from_csv(csv_path: str = "filing_urls.csv", uow_instance
                             existing_statements.clean_dataframe()
                             existing_statements.df = _apply_display_formatting(existing_statements.df)
 
-                            uow.stmts.delete(ticker, "10-K")
-                            uow.stmts.add(existing_statements)
+                            uow.stmts.upsert(existing_statements)
                             uow.commit()
 
                             results["updated"] += 1
@@ -738,6 +1234,7 @@ def process_new_filings_from_csv(csv_path: str = "filing_urls.csv", uow_instance
                         [filing.income_statement] if filing.income_statement else [],
                         [filing],
                         ticker,
+                        cover_page.entity_registrant_name if cover_page else None,
                         "10-K"
                     )
 
@@ -745,7 +1242,7 @@ def process_new_filings_from_csv(csv_path: str = "filing_urls.csv", uow_instance
                         new_statements.clean_dataframe()
                         new_statements.df = _apply_display_formatting(new_statements.df)
 
-                        uow.stmts.add(new_statements)
+                        uow.stmts.upsert(new_statements)
                         uow.commit()
 
                         results["updated"] += 1
@@ -818,7 +1315,7 @@ def _merge_dataframes(existing_df: pd.DataFrame, new_df: pd.DataFrame, uow) -> p
     result_df = existing_df.copy()
 
     if uow.llm:
-        index_mapping = uow.llm.map_dataframes(existing_df, new_df)
+        index_mapping = get_index_mapping(existing_df, new_df, uow)
 
         mapped_df = new_df.copy()
         new_index = []
@@ -877,76 +1374,32 @@ def _convert_to_millions(val):
         return val
 
 
+COMPANY_DIRECTORY = CsvCompanyDirectorySource(
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), 'all_companies_available.csv'),
+    reload_interval_seconds=float(os.getenv("COMPANY_DIRECTORY_RELOAD_INTERVAL_SECONDS", "30"))
+)
+
+
 def search_companies_from_csv(term: str) -> List[Dict[str, str]]:
     """
-    Search companies by name or ticker from CSV file.
-    Returns list of dicts with 'name' and 'ticker' keys.
+    Search companies by name or ticker from the in-memory company directory.
+    Returns list of dicts with 'name' and 'ticker' keys, best matches first.
     """
     if not term or len(term) < 2:
         return []
 
-    csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'all_companies_available.csv')
-
-    if not os.path.exists(csv_path):
-        print(f"CSV file not found at: {csv_path}")
-        return []
-
-    results = []
-    term_lower = term.lower()
-
-    try:
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                name = row.get('name', '').strip()
-                ticker = row.get('ticker', '').strip()
-
-                # Search in both name and ticker (case insensitive)
-                if (term_lower in name.lower() or
-                    term_lower in ticker.lower()):
-                    results.append({
-                        'name': name,
-                        'ticker': ticker
-                    })
-
-                # Limit results to prevent overwhelming the UI
-                if len(results) >= 10:
-                    break
-
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        return []
-
-    return results
+    return [
+        {'name': entry.name, 'ticker': entry.ticker}
+        for entry in COMPANY_DIRECTORY.get().search(term, limit=10)
+    ]
 
 
 def validate_company_exists(ticker_or_name: str) -> bool:
     """
-    Validate that a company exists in the CSV by ticker or name.
+    Validate that a company exists in the directory by ticker or name.
     Returns True if found, False otherwise.
     """
-    csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'all_companies_available.csv')
-
-    if not os.path.exists(csv_path):
-        return False
-
-    search_term = ticker_or_name.strip().upper()
-
-    try:
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                name = row.get('name', '').strip().upper()
-                ticker = row.get('ticker', '').strip().upper()
-
-                if search_term == ticker or search_term == name:
-                    return True
-
-    except Exception as e:
-        print(f"Error validating company: {e}")
-        return False
-
-    return False
+    return COMPANY_DIRECTORY.get().lookup(ticker_or_name) is not None
 
 
 def get_ticker_from_name_or_ticker(input_value: str) -> str:
@@ -954,33 +1407,12 @@ def get_ticker_from_name_or_ticker(input_value: str) -> str:
     Given a company name or ticker, return the ticker.
     Returns the input if it's already a ticker, or finds the ticker for a company name.
     """
-    csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'all_companies_available.csv')
-
-    if not os.path.exists(csv_path):
-        return input_value.upper()
-
-    search_term = input_value.strip()
-
-    try:
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                name = row.get('name', '').strip()
-                ticker = row.get('ticker', '').strip()
+    entry = COMPANY_DIRECTORY.get().lookup(input_value)
+    return entry.ticker.upper() if entry else input_value.upper()
 
-                # If input matches ticker exactly (case insensitive), return the ticker
-                if search_term.upper() == ticker.upper():
-                    return ticker.upper()
-
-                # If input matches name exactly (case insensitive), return the ticker
-                if search_term.upper() == name.upper():
-                    return ticker.upper()
-
-    except Exception as e:
-        print(f"Error getting ticker: {e}")
-        return input_value.upper()
 
-    return input_value.upper()
+def record_company_lookup(ticker: str) -> None:
+    COMPANY_DIRECTORY.get().record_lookup(ticker)
 
 def check_for_xbrl(ticker, form_type, uow_instance):
     company = get_company_by_ticker(ticker, uow_instance)
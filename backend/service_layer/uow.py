@@ -1,7 +1,8 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
 from adapters import repository
 from adapters.config import get_postgres_uri
 
@@ -10,12 +11,64 @@ def get_database_url():
     print(f"Database URL: {url}")
     return url
 
-DEFAULT_SESSION_FACTORY = sessionmaker(
-    bind=create_engine(
-        get_database_url(),
-        pool_pre_ping=True,
-    )
-)
+_default_session_factory: sessionmaker | None = None
+_default_session_factory_lock = threading.Lock()
+
+
+def get_default_session_factory() -> sessionmaker:
+    global _default_session_factory
+    if _default_session_factory is None:
+        with _default_session_factory_lock:
+            if _default_session_factory is None:
+                _default_session_factory = sessionmaker(
+                    bind=create_engine(
+                        get_database_url(),
+                        pool_pre_ping=True,
+                    )
+                )
+    return _default_session_factory
+
+
+class SharedAdapters:
+    def __init__(self, factories: dict[str, Callable[[], Any]]):
+        self._factories = factories
+        self._instances: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Any:
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = self._factories[name]()
+                    self._instances[name] = instance
+        return instance
+
+    def created(self) -> list[str]:
+        return sorted(self._instances)
+
+
+SHARED_ADAPTERS = SharedAdapters({
+    'sec_filings': repository.SECFilingRepository,
+    'llm': repository.LLMRepository,
+    'market_data': repository.YFinanceMarketDataProvider,
+})
+
+
+class _SharedAdapter:
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if self.name in instance.__dict__:
+            return instance.__dict__[self.name]
+        return instance.shared_adapters.get(self.name)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
 
 
 class AbstractUnitOfWork(ABC):
@@ -23,6 +76,9 @@ class AbstractUnitOfWork(ABC):
     llm: repository.LLMRepository
     stmts: repository.PostgresCombinedFinancialStatementsRepository
     companies: repository.CompanyRepository
+    mappings: repository.IndexMappingRepository
+    readable_names: repository.ReadableNameRepository
+    build_jobs: repository.BuildJobRepository
     market_data: Any
 
     def __enter__(self):
@@ -45,6 +101,8 @@ class FakeUnitOfWork(AbstractUnitOfWork):
         self.sec_filings = repository.FakeSECFilingRepository()
         self.llm = None
         self.stmts = None
+        self.mappings = repository.FakeIndexMappingRepository()
+        self.readable_names = repository.FakeReadableNameRepository()
         self.market_data = repository.FakeMarketDataProvider()
         self.committed = False
 
@@ -66,6 +124,8 @@ class UnitOfWork(AbstractUnitOfWork):
         self.sec_filings = repository.SECFilingRepository()
         self.llm = repository.LLMRepository()
         self.stmts = None
+        self.mappings = repository.FakeIndexMappingRepository()
+        self.readable_names = repository.FakeReadableNameRepository()
 
     def __enter__(self):
         return self
@@ -81,20 +141,47 @@ class UnitOfWork(AbstractUnitOfWork):
 
 
 class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
-    def __init__(self, session_factory: sessionmaker = DEFAULT_SESSION_FACTORY):
+    sec_filings = _SharedAdapter()
+    llm = _SharedAdapter()
+    market_data = _SharedAdapter()
+
+    def __init__(self, session_factory: sessionmaker | None = None,
+                 shared_adapters: SharedAdapters = SHARED_ADAPTERS):
         self.session_factory = session_factory
+        self.shared_adapters = shared_adapters
         self.session: Session | None = None
+        self._savepoints: list[SessionTransaction] = []
+        self._depth = 0
 
     def __enter__(self) -> 'SqlAlchemyUnitOfWork':
+        if self._depth:
+            self._depth += 1
+            self._savepoints.append(self.session.begin_nested())
+            return self
+
+        if self.session_factory is None:
+            self.session_factory = get_default_session_factory()
+        self._depth = 1
         self.session = self.session_factory()
         self.stmts = repository.PostgresCombinedFinancialStatementsRepository(self.session)
-        self.sec_filings = repository.SECFilingRepository()
-        self.llm = repository.LLMRepository()
         self.companies = repository.PostgresCompanyRepository(self.session)
-        self.market_data = repository.YFinanceMarketDataProvider()
+        self.mappings = repository.PostgresIndexMappingRepository(self.session)
+        self.readable_names = repository.PostgresReadableNameRepository(self.session)
+        self.build_jobs = repository.PostgresBuildJobRepository(self.session)
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if self._depth > 1:
+            self._depth -= 1
+            savepoint = self._savepoints.pop()
+            if savepoint.is_active:
+                if exc_type:
+                    savepoint.rollback()
+                else:
+                    savepoint.commit()
+            return
+
+        self._depth = 0
         if exc_type:
             self.rollback()
         else:
@@ -102,9 +189,15 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
         self.session.close()
 
     def commit(self) -> None:
-        if self.session:
+        if self._savepoints:
+            if self._savepoints[-1].is_active:
+                self._savepoints[-1].commit()
+        elif self.session:
             self.session.commit()
 
     def rollback(self) -> None:
-        if self.session:
+        if self._savepoints:
+            if self._savepoints[-1].is_active:
+                self._savepoints[-1].rollback()
+        elif self.session:
             self.session.rollback()
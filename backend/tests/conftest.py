@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from adapters.orm import Base
+from domain import model
+from service_layer import uow as uow_mod
+
+SqlAlchemyUnitOfWork = uow_mod.SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def session(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def make_uow(session_factory):
+    def make(**adapters):
+        factories = {"llm": lambda: None}
+        factories.update({name: (lambda adapter=adapter: adapter) for name, adapter in adapters.items()})
+        return SqlAlchemyUnitOfWork(session_factory, uow_mod.SharedAdapters(factories))
+    return make
+
+
+@pytest.fixture
+def make_statements():
+    def make(ticker: str, revenue: float = 100.0, balance_sheet: dict = None, form_type: str = "10-K") -> model.CombinedFinancialStatements:
+        stmt = model.CombinedFinancialStatements([], [], ticker, f"{ticker} Corp", form_type)
+        stmt.df = pd.DataFrame({"2023-01-01:2023-12-31": [revenue]}, index=["Revenue"])
+        if balance_sheet is not None:
+            stmt.balance_sheet_df = pd.DataFrame(
+                {"2023-12-31:2023-12-31": list(balance_sheet.values())}, index=list(balance_sheet)
+            )
+        return stmt
+    return make
+
+
+@pytest.fixture
+def call_app():
+    from entrypoints import backend
+
+    def call(scenario):
+        async def run():
+            transport = httpx.ASGITransport(app=backend.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await scenario(client)
+        return asyncio.run(run())
+    return call
@@ -0,0 +1,59 @@
+import asyncio
+import json
+import threading
+import time
+
+from entrypoints import backend
+from service_layer import service
+
+
+class NullUnitOfWork:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class TestBlockingHandlers:
+    def test_search_stays_fast_during_cold_consolidation(self, monkeypatch, make_statements, call_app):
+        """Test that ticker search is served while a slow cold statement build is running."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_build(ticker, uow_instance, **kwargs):
+            started.set()
+            release.wait(5)
+            return make_statements(ticker, 1.0)
+
+        monkeypatch.setattr(backend.uow, "SqlAlchemyUnitOfWork", NullUnitOfWork)
+        monkeypatch.setattr(service, "get_consolidated_income_statements", slow_build)
+        monkeypatch.setattr(service, "validate_company_exists", lambda ticker: True)
+        monkeypatch.setattr(service, "get_ticker_from_name_or_ticker", lambda ticker: ticker)
+        monkeypatch.setattr(service, "record_company_lookup", lambda ticker: None)
+        monkeypatch.setattr(service, "search_companies_from_csv", lambda term: [{"name": "Test Corp", "ticker": "TEST"}])
+
+        async def scenario(client):
+            build = asyncio.create_task(
+                client.get("/api/financial/income/TEST/stream", headers={"Authorization": "Bearer token"})
+            )
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+
+            search_started = time.perf_counter()
+            search = await asyncio.wait_for(client.get("/api/tickers/search", params={"term": "te"}), timeout=2)
+            search_seconds = time.perf_counter() - search_started
+            build_was_running = not build.done()
+
+            release.set()
+            return search, search_seconds, build_was_running, await build
+
+        search, search_seconds, build_was_running, build = call_app(scenario)
+
+        assert search.json() == [{"name": "Test Corp", "ticker": "TEST"}]
+        assert search_seconds < 1
+        assert build_was_running
+        assert build.status_code == 200
+        result = json.loads(build.text.splitlines()[-1])
+        assert result["event"] == "result"
+        assert result["statements"]["metrics"] == [{"name": "Revenue", "values": {"2023-01-01:2023-12-31": 1.0}}]
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from adapters.orm import FinancialFactORM
+from adapters.repository import FakeMarketDataProvider
+from domain import model
+from entrypoints import backend
+from service_layer import service
+
+
+class CountingMarketData(FakeMarketDataProvider):
+    def __init__(self):
+        super().__init__()
+        self.bulk_calls = []
+
+    def fetch_prices_many(self, tickers, start_date, end_date):
+        self.bulk_calls.append(list(tickers))
+        return super().fetch_prices_many(tickers, start_date, end_date)
+
+
+class BatchHarness:
+    @pytest.fixture(autouse=True)
+    def store_batch(self, engine, make_uow, make_statements):
+        self.engine = engine
+        self.market_data = CountingMarketData()
+        self.make_uow = lambda: make_uow(market_data=self.market_data)
+
+        yesterday = datetime.now() - timedelta(days=1)
+        with self.make_uow() as uowx:
+            for ticker, cash, price in [("BATA", 100.0, 10.0), ("BATB", 50.0, 20.0)]:
+                uowx.stmts.upsert(make_statements(ticker, balance_sheet={"CashAndCashEquivalents": cash, "LongTermDebt": 300.0}))
+                uowx.companies.add(model.Company(name=f"{ticker} Corp", ticker=ticker, shares_outstanding=1000))
+                self.market_data.add_fake_data(ticker, [model.PricePoint(date=yesterday, price=Decimal(str(price)))])
+
+
+class TestCalculateValuations(BatchHarness):
+    def test_batch_matches_single_ticker_valuation(self):
+        """Test that the batched valuation returns what calculate_valuation returns per ticker."""
+        batched = service.calculate_valuations(["BATA", "BATB"], self.make_uow(), form_type="10-Q")
+        single = {ticker: service._calculate_valuation(ticker, self.make_uow(), form_type="10-Q") for ticker in ["BATA", "BATB"]}
+
+        assert batched == single
+        assert batched["BATA"]["enterprise_value"] == 10.0 * 1000 + 300.0 - 100.0
+        assert self.market_data.bulk_calls == [["BATA", "BATB"]]
+
+
+    def test_metrics_missing_from_facts_fall_back_to_the_frame(self):
+        """Test that a balance metric with no stored fact is still read from the stored balance sheet."""
+        with self.make_uow() as uowx:
+            uowx.session.query(FinancialFactORM).filter_by(ticker="BATA", metric="LongTermDebt").delete()
+            uowx.commit()
+
+        batched = service.calculate_valuations(["BATA"], self.make_uow(), form_type="10-Q")
+        single = service._calculate_valuation("BATA", self.make_uow(), form_type="10-Q")
+
+        assert batched["BATA"] == single
+        assert single["components"]["total_debt"] == 300.0
+        assert single["as_of_period"] == "2023-12-31:2023-12-31"
+
+
+class TestBatchEndpoint(BatchHarness):
+    def test_batch_returns_all_resources_in_one_response(self, monkeypatch, call_app):
+        """Test that one batch call serves stored statements, prices and valuations and queues cold tickers."""
+        monkeypatch.setattr(backend.uow, "SqlAlchemyUnitOfWork", self.make_uow)
+        monkeypatch.setattr(service, "validate_company_exists", lambda ticker: ticker != "NOPE")
+        monkeypatch.setattr(service, "get_ticker_from_name_or_ticker", lambda ticker: ticker.upper())
+        statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+
+        response = call_app(lambda client: client.post(
+            "/api/financial/batch",
+            json={"tickers": ["BATA", "batb", "COLD", "NOPE"], "form_type": "10-K", "format": "columnar"},
+            headers={"Authorization": "Bearer token"}
+        ))
+        body = response.json()
+        statement_reads = [sql for sql in statements if "combined_financial_statements.data_blob" in sql]
+
+        assert response.status_code == 200
+        assert body["results"]["BATA"]["income"]["values"] == [[100.0]]
+        assert body["results"]["BATB"]["prices"]["prices"] == [20.0]
+        assert body["results"]["BATB"]["valuation"]["market_cap"] == 20000.0
+        assert body["results"]["COLD"]["income"] is None
+        assert list(body["pending"]) == ["COLD"]
+        assert body["errors"] == {"NOPE": "Company 'NOPE' not found."}
+        assert len(statement_reads) == 1
+        assert self.market_data.bulk_calls == [["BATA", "BATB", "COLD"]]
+
+    def test_batch_requires_authentication(self, call_app):
+        """Test that anonymous batch requests are rejected."""
+        response = call_app(lambda client: client.post("/api/financial/batch", json={"tickers": ["BATA"]}))
+
+        assert response.status_code == 401
@@ -0,0 +1,189 @@
+import uuid
+from datetime import timedelta
+
+from adapters.orm import BuildJobORM
+from adapters.repository import PostgresBuildJobRepository, PostgresCombinedFinancialStatementsRepository
+from domain import model
+from entrypoints import backend
+from service_layer import service
+
+
+class TestBuildJobRepository:
+    def test_active_jobs_are_deduplicated_per_ticker(self, make_uow):
+        """Test that enqueueing a ticker twice returns the same job until it finishes."""
+
+        first = service.enqueue_statement_build("aapl", make_uow(), form_type="10-K")
+        second = service.enqueue_statement_build("AAPL", make_uow(), form_type="10-K")
+        quarterly = service.enqueue_statement_build("AAPL", make_uow(), form_type="10-Q")
+
+        assert first.id == second.id
+        assert quarterly.id != first.id
+        assert first.status == model.BuildJob.QUEUED
+
+        with make_uow() as uowx:
+            uowx.build_jobs.mark_succeeded(first.id)
+        rebuilt = service.enqueue_statement_build("AAPL", make_uow(), form_type="10-K")
+
+        assert rebuilt.id != first.id
+
+    def test_job_finishing_during_enqueue_is_replaced(self, make_uow):
+        """Test that an active job finishing between the conflicting insert and the lookup leads to a new job."""
+        first = service.enqueue_statement_build("AAPL", make_uow(), form_type="10-K")
+
+        with make_uow() as uowx:
+            execute = uowx.session.execute
+
+            def finish_after_conflict(statement, *args, **kwargs):
+                result = execute(statement, *args, **kwargs)
+                if getattr(statement, "is_insert", False) and uowx.session.execute is finish_after_conflict:
+                    uowx.session.execute = execute
+                    uowx.build_jobs.mark_succeeded(first.id)
+                    uowx.session.flush()
+                return result
+
+            uowx.session.execute = finish_after_conflict
+            job = uowx.build_jobs.enqueue("AAPL", "10-K")
+            uowx.commit()
+
+        assert job.id != first.id
+        assert job.status == model.BuildJob.QUEUED
+        assert service.get_build_job(first.id, make_uow()).status == model.BuildJob.SUCCEEDED
+
+    def test_claims_respect_global_concurrency_limit(self, make_uow):
+        """Test that no more jobs are claimed than the global limit allows to run at once."""
+        for ticker in ["AAPL", "MSFT", "NVDA"]:
+            service.enqueue_statement_build(ticker, make_uow())
+
+        claimed = service.claim_build_jobs(make_uow(), limit=5, max_running=2)
+        blocked = service.claim_build_jobs(make_uow(), limit=5, max_running=2)
+        with make_uow() as uowx:
+            uowx.build_jobs.mark_succeeded(claimed[0].id)
+        remaining = service.claim_build_jobs(make_uow(), limit=5, max_running=2)
+
+        assert [job.ticker for job in claimed] == ["AAPL", "MSFT"]
+        assert all(job.status == model.BuildJob.RUNNING for job in claimed)
+        assert blocked == []
+        assert [job.ticker for job in remaining] == ["NVDA"]
+
+    def test_unknown_job_id_is_not_found(self, make_uow):
+        """Test that malformed and unknown job ids return None."""
+
+        assert service.get_build_job("not-a-uuid", make_uow()) is None
+        assert service.get_build_job("00000000-0000-0000-0000-000000000000", make_uow()) is None
+
+
+class TestRunBuildJob:
+    def test_failed_build_records_error(self, monkeypatch, make_uow):
+        """Test that a build that raises leaves the job failed with its error."""
+        service.enqueue_statement_build("AAPL", make_uow())
+        [job] = service.claim_build_jobs(make_uow(), limit=1, max_running=1)
+
+        def failing_build(*args, **kwargs):
+            raise RuntimeError("SEC API unavailable")
+
+        monkeypatch.setattr(service, "get_consolidated_income_statements", failing_build)
+
+        assert service.run_build_job(job, make_uow()) is False
+        stored = service.get_build_job(job.id, make_uow())
+        assert stored.status == model.BuildJob.FAILED
+        assert stored.error == "SEC API unavailable"
+        assert stored.finished_at is not None
+
+    def test_heartbeats_keep_long_builds_claimed(self, monkeypatch, make_uow):
+        """Test that a build still heartbeating is neither reclaimed nor dropped from the running count."""
+        for ticker in ["AAPL", "MSFT"]:
+            service.enqueue_statement_build(ticker, make_uow())
+        [job] = service.claim_build_jobs(make_uow(), limit=1, max_running=1)
+
+        monkeypatch.setattr(PostgresBuildJobRepository, "CLAIM_TIMEOUT", timedelta(seconds=60))
+        with make_uow() as uowx:
+            uowx.session.get(BuildJobORM, uuid.UUID(job.id)).heartbeat_at -= timedelta(minutes=5)
+            uowx.commit()
+        service.heartbeat_build_jobs([job], make_uow())
+
+        assert service.claim_build_jobs(make_uow(), limit=5, max_running=1) == []
+
+    def test_superseded_attempt_cannot_overwrite_the_retry(self, monkeypatch, make_uow):
+        """Test that a stale first attempt finishing late leaves the reclaimed retry running."""
+        service.enqueue_statement_build("AAPL", make_uow())
+        [first] = service.claim_build_jobs(make_uow(), limit=1, max_running=1)
+        monkeypatch.setattr(PostgresBuildJobRepository, "CLAIM_TIMEOUT", timedelta(0))
+        [retry] = service.claim_build_jobs(make_uow(), limit=1, max_running=1)
+        monkeypatch.setattr(service, "get_consolidated_income_statements", lambda *args, **kwargs: None)
+
+        service.run_build_job(first, make_uow())
+
+        assert (first.attempts, retry.attempts) == (1, 2)
+        assert service.get_build_job(first.id, make_uow()).status == model.BuildJob.RUNNING
+
+
+class TestRefineDegradedStatements:
+    def store_degraded(self, make_uow, make_statements):
+        stmt = make_statements("SLOW")
+        stmt.needs_refinement = True
+        with make_uow() as uowx:
+            uowx.stmts.add(stmt)
+            uowx.commit()
+        return stmt
+
+    def test_failed_refinement_stays_flagged_and_is_reclaimed_after_the_lease(self, monkeypatch, make_uow, make_statements):
+        """Test that a refinement that raises keeps its flag and is retried once its lease expires."""
+        self.store_degraded(make_uow, make_statements)
+
+        def failing_build(*args, **kwargs):
+            raise RuntimeError("SEC API unavailable")
+
+        monkeypatch.setattr(service, "get_consolidated_income_statements", failing_build)
+        assert service.refine_degraded_statements(make_uow()) == 0
+        assert service.refine_degraded_statements(make_uow()) == 0
+
+        with make_uow() as uowx:
+            assert uowx.stmts.claim_statements_needing_refinement(5) == []
+        monkeypatch.setattr(PostgresCombinedFinancialStatementsRepository, "REFINEMENT_CLAIM_TIMEOUT", timedelta(0))
+        with make_uow() as uowx:
+            assert uowx.stmts.claim_statements_needing_refinement(5) == [("SLOW", "10-K")]
+
+    def test_successful_rebuild_clears_the_flag(self, monkeypatch, make_uow, make_statements):
+        """Test that the flag is only cleared by the rebuilt statement being stored."""
+        stmt = self.store_degraded(make_uow, make_statements)
+
+        def rebuild(ticker, uow_instance, **kwargs):
+            stmt.needs_refinement = False
+            with uow_instance as uowx:
+                uowx.stmts.upsert(stmt)
+                uowx.commit()
+            return stmt
+
+        monkeypatch.setattr(service, "get_consolidated_income_statements", rebuild)
+        monkeypatch.setattr(PostgresCombinedFinancialStatementsRepository, "REFINEMENT_CLAIM_TIMEOUT", timedelta(0))
+
+        assert service.refine_degraded_statements(make_uow()) == 1
+        with make_uow() as uowx:
+            assert uowx.stmts.claim_statements_needing_refinement(5) == []
+
+
+class TestBuildJobEndpoints:
+    def test_cold_ticker_returns_accepted_job(self, monkeypatch, make_uow, call_app):
+        """Test that a ticker with no stored statements gets a 202 and a pollable job."""
+        monkeypatch.setattr(backend.uow, "SqlAlchemyUnitOfWork", make_uow)
+        monkeypatch.setattr(service, "validate_company_exists", lambda ticker: True)
+        monkeypatch.setattr(service, "get_ticker_from_name_or_ticker", lambda ticker: ticker)
+        monkeypatch.setattr(service, "record_company_lookup", lambda ticker: None)
+
+        async def scenario(client):
+            headers = {"Authorization": "Bearer token"}
+            first = await client.get("/api/financial/income/TEST", params={"form_type": "10-K"}, headers=headers)
+            second = await client.get("/api/financial/income/TEST", params={"form_type": "10-K"}, headers=headers)
+            status = await client.get(first.headers["Location"])
+            missing = await client.get("/api/jobs/00000000-0000-0000-0000-000000000000")
+            return first, second, status, missing
+
+        first, second, status, missing = call_app(scenario)
+
+        assert first.status_code == 202
+        assert second.json()["job_id"] == first.json()["job_id"]
+        assert status.status_code == 200
+        assert status.json()["status"] == model.BuildJob.QUEUED
+        assert status.json()["ticker"] == "TEST"
+        assert status.json()["result_url"] is None
+        assert missing.status_code == 404
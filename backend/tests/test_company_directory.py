@@ -0,0 +1,60 @@
+import os
+
+from adapters.company_csv import CsvCompanyDirectorySource
+from domain.company_directory import CompanyDirectory, CompanyEntry
+
+
+ENTRIES = [
+    CompanyEntry("APPLIED MATERIALS INC", "AMAT"),
+    CompanyEntry("APPLE INC", "AAPL"),
+    CompanyEntry("PINEAPPLE ENERGY INC", "PEGY"),
+    CompanyEntry("AMAZON COM INC", "AMZN"),
+    CompanyEntry("AMERICAN APPLE GROWERS", "APPL"),
+]
+
+
+class TestCompanyDirectory:
+    def test_lookup_by_ticker_or_name(self):
+        """Test that exact lookups ignore case and surrounding whitespace."""
+        directory = CompanyDirectory(ENTRIES)
+        assert directory.lookup(" aapl ").ticker == "AAPL"
+        assert directory.lookup("apple inc").ticker == "AAPL"
+        assert directory.lookup("APPLE") is None
+
+    def test_search_ranks_exact_then_prefix_then_substring(self):
+        """Test that exact tickers beat ticker prefixes, name prefixes and substrings."""
+        directory = CompanyDirectory(ENTRIES)
+        tickers = [entry.ticker for entry in directory.search("appl")]
+        assert tickers[0] == "APPL"
+        assert tickers.index("AAPL") < tickers.index("PEGY")
+        assert set(tickers) == {"APPL", "AMAT", "AAPL", "PEGY"}
+
+    def test_popularity_breaks_ties_within_a_tier(self):
+        """Test that frequently requested companies are listed first within a tier."""
+        directory = CompanyDirectory(ENTRIES)
+        assert [entry.ticker for entry in directory.search("am")][:2] == ["AMAT", "AMZN"]
+        directory.record_lookup("AMZN")
+        assert [entry.ticker for entry in directory.search("am")][:2] == ["AMZN", "AMAT"]
+
+
+class TestCsvCompanyDirectorySource:
+    def test_reloads_when_file_changes(self, tmp_path):
+        """Test that the directory is rebuilt after the CSV changes and keeps popularity."""
+        csv_path = tmp_path / "companies.csv"
+        csv_path.write_text('"name","ticker"\n"APPLE INC","AAPL"\n', encoding="utf-8")
+        now = [0.0]
+        source = CsvCompanyDirectorySource(str(csv_path), reload_interval_seconds=10, clock=lambda: now[0])
+        source.get().record_lookup("AAPL")
+
+        csv_path.write_text('"name","ticker"\n"APPLE INC","AAPL"\n"MICROSOFT CORP","MSFT"\n', encoding="utf-8")
+        os.utime(csv_path, (1, 1))
+        assert source.get().lookup("MSFT") is None
+
+        now[0] = 11.0
+        assert source.get().lookup("MSFT").ticker == "MSFT"
+        assert source.get().popularity["AAPL"] == 1
+
+    def test_missing_file_gives_empty_directory(self, tmp_path):
+        """Test that a missing CSV behaves like a directory without companies."""
+        source = CsvCompanyDirectorySource(str(tmp_path / "missing.csv"))
+        assert len(source.get()) == 0
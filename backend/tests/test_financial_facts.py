@@ -0,0 +1,205 @@
+from datetime import date
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from adapters.cache import InMemoryCache
+from adapters.orm import CombinedFinancialStatementsORM
+from adapters.repository import PostgresCombinedFinancialStatementsRepository, _copy_rows
+from domain import model
+from domain.model import FinancialFact
+
+
+@pytest.fixture
+def make_statements(make_statements):
+    def make(ticker: str, revenue: float) -> model.CombinedFinancialStatements:
+        stmt = make_statements(ticker, balance_sheet={"CashAndCashEquivalents": 42.0})
+        stmt.df = pd.DataFrame(
+            {"2023-01-01:2023-12-31": [revenue, np.nan], "2022-01-01:2022-12-31": [revenue / 2, 5.0]},
+            index=["Revenue", "Net Income"]
+        )
+        return stmt
+    return make
+
+
+class StatementStorageHarness:
+    @pytest.fixture(autouse=True)
+    def repository(self, session, make_statements):
+        self.session = session
+        self.make_statements = make_statements
+        self.repo = PostgresCombinedFinancialStatementsRepository(session, cache=InMemoryCache())
+
+
+class TestToFinancialFacts:
+    def test_facts_are_extracted_per_metric_and_period(self, make_statements):
+        """Test that every numeric cell with a parseable period becomes a fact."""
+        facts = make_statements("TEST", 100.0).to_financial_facts()
+
+        assert len(facts) == 4
+        assert FinancialFact("TEST", "10-K", FinancialFact.INCOME_STATEMENT, "Revenue",
+                             date(2023, 1, 1), date(2023, 12, 31), 100.0) in facts
+        assert {fact.statement_type for fact in facts} == {FinancialFact.INCOME_STATEMENT, FinancialFact.BALANCE_SHEET}
+
+
+    def test_display_formatted_values_become_facts(self):
+        """Test that thousands separators and currency symbols are parsed rather than dropped."""
+        stmt = model.CombinedFinancialStatements([], [], "FMT", "Fmt Corp", "10-K")
+        stmt.df = pd.DataFrame({"2023-01-01:2023-12-31": ["1,234", "$5", 7.5, "n/a"]}, index=["Revenue", "EPS", "Margin", "Note"])
+
+        facts = stmt.to_financial_facts()
+
+        assert [(fact.metric, fact.value) for fact in facts] == [("Revenue", 1234.0), ("EPS", 5.0), ("Margin", 7.5)]
+
+
+class TestFactStorage(StatementStorageHarness):
+    @pytest.fixture(autouse=True)
+    def store_facts(self, repository):
+        self.repo.add(self.make_statements("AAA", 100.0))
+        self.repo.add(self.make_statements("BBB", 300.0))
+        self.session.commit()
+
+    def test_get_facts_filters_metrics_and_periods(self):
+        """Test that only the requested metric and periods are returned for a ticker."""
+        facts = self.repo.get_facts("AAA", metrics=["Revenue"], period_end_from=date(2023, 1, 1))
+        assert [(fact.metric, fact.period, fact.value) for fact in facts] == [("Revenue", "2023-01-01:2023-12-31", 100.0)]
+
+    def test_get_metric_facts_across_tickers(self):
+        """Test that one metric can be read across companies."""
+        facts = self.repo.get_metric_facts("Revenue", form_type="10-K", period_end_to=date(2022, 12, 31))
+        assert [(fact.ticker, fact.value) for fact in facts] == [("AAA", 50.0), ("BBB", 150.0)]
+
+    def test_delete_removes_facts(self):
+        """Test that deleting a statement also removes its facts."""
+        self.repo.delete("AAA", "10-K")
+        self.session.commit()
+        assert self.repo.get_facts("AAA") == []
+        assert self.repo.get_facts("BBB")
+
+
+class TestBalanceSheetCompleteness(StatementStorageHarness):
+    def test_short_and_missing_balance_sheets_are_listed(self):
+        """Test that tickers with fewer than four balance sheet rows or none at all are returned."""
+        complete = self.make_statements("FULL", 100.0)
+        complete.balance_sheet_df = pd.DataFrame({"2023-12-31:2023-12-31": [1.0, 2.0, 3.0, 4.0]},
+                                                 index=["Cash", "Assets", "Liabilities", "Equity"])
+        missing = self.make_statements("NONE", 100.0)
+        missing.balance_sheet_df = None
+        for stmt in [complete, missing, self.make_statements("SHORT", 100.0)]:
+            self.repo.add(stmt)
+        self.session.commit()
+
+        assert sorted(self.repo.get_tickers_with_insufficient_balance_sheet_data()) == ["NONE", "SHORT"]
+
+    def test_updated_balance_sheet_refreshes_row_count(self):
+        """Test that replacing a balance sheet updates the stored row count."""
+        self.repo.add(self.make_statements("GROW", 100.0))
+        self.session.commit()
+
+        update = self.make_statements("GROW", 100.0)
+        update.balance_sheet_df = pd.DataFrame({"2023-12-31:2023-12-31": [1.0, 2.0, 3.0, 4.0]},
+                                               index=["Cash", "Assets", "Liabilities", "Equity"])
+        self.repo.add_or_update_balance_sheet(update)
+        self.session.commit()
+
+        assert self.repo.get_tickers_with_insufficient_balance_sheet_data() == []
+
+
+class TestStatementUpsert(StatementStorageHarness):
+    def test_upsert_replaces_row_and_facts(self):
+        """Test that upserting the same ticker and form type updates the single stored row."""
+        self.repo.upsert(self.make_statements("AAA", 100.0))
+        self.session.commit()
+        self.repo.upsert(self.make_statements("AAA", 200.0))
+        self.session.commit()
+
+        assert self.session.query(CombinedFinancialStatementsORM).count() == 1
+        assert self.repo.get("AAA", "10-K").df.loc["Revenue", "2023-01-01:2023-12-31"] == 200.0
+        assert [fact.value for fact in self.repo.get_facts("AAA", metrics=["Revenue"])] == [100.0, 200.0]
+
+    def test_upsert_without_balance_sheet_keeps_stored_one(self):
+        """Test that an income-only upsert does not wipe the stored balance sheet."""
+        self.repo.upsert(self.make_statements("AAA", 100.0))
+        self.session.commit()
+        income_only = self.make_statements("AAA", 200.0)
+        income_only.balance_sheet_df = None
+        self.repo.upsert(income_only)
+        self.session.commit()
+
+        assert self.repo.get_balance_sheet("AAA", "10-K").balance_sheet_df.loc["CashAndCashEquivalents"].iloc[0] == 42.0
+        assert self.repo.get_facts("AAA", statement_type=FinancialFact.BALANCE_SHEET)
+
+    def test_bulk_upsert_inserts_and_updates(self):
+        """Test that a bulk load inserts new tickers, updates existing ones and keeps the last duplicate."""
+        self.repo.upsert(self.make_statements("AAA", 100.0))
+        self.session.commit()
+
+        loaded = self.repo.bulk_upsert([self.make_statements("AAA", 300.0), self.make_statements("BBB", 10.0), self.make_statements("BBB", 20.0)])
+        self.session.commit()
+
+        assert loaded == 2
+        assert sorted(self.repo.get_all_tickers()) == ["AAA", "BBB"]
+        assert self.repo.get("BBB", "10-K").df.loc["Revenue", "2023-01-01:2023-12-31"] == 20.0
+        assert len(self.repo.get_facts("AAA", metrics=["Revenue"])) == 2
+
+    def test_statements_without_a_form_type_share_one_row(self):
+        """Test that statements with no form type are stored under an empty form type and upserted onto one row."""
+        stmt = self.make_statements("NOFT", 100.0)
+        stmt.form_type = None
+        self.repo.upsert(stmt)
+        self.session.commit()
+        self.repo.bulk_upsert([self.make_statements("NOFT", 200.0), stmt])
+        self.session.commit()
+
+        form_types = self.session.query(CombinedFinancialStatementsORM.form_type).filter_by(ticker="NOFT")
+        assert sorted(form_type for form_type, in form_types) == ["", "10-K"]
+        assert self.repo.get("NOFT", None).form_type is None
+        assert self.repo.get("NOFT", None).df.loc["Revenue", "2023-01-01:2023-12-31"] == 100.0
+
+    def test_balance_sheet_supplement_updates_the_matching_form_type(self):
+        """Test that supplementing a balance sheet upserts the row for the statement's own form type."""
+        self.repo.add(model.CombinedFinancialStatements([], [], "QTR", "QTR Corp", "10-Q"))
+        self.session.commit()
+
+        update = self.make_statements("QTR", 100.0)
+        update.form_type = "10-Q"
+        update.balance_sheet_df = pd.DataFrame({"2023-12-31:2023-12-31": [7.0]}, index=["CashAndCashEquivalents"])
+        self.repo.add_or_update_balance_sheet(update)
+        self.repo.add_or_update_balance_sheet(update)
+        self.session.commit()
+
+        assert self.session.query(CombinedFinancialStatementsORM).filter_by(ticker="QTR").count() == 1
+        assert self.repo.get_balance_sheet("QTR", "10-Q").balance_sheet_df.iloc[0, 0] == 7.0
+        assert self.repo.get("QTR", "10-Q").df.empty
+
+
+class CopyCursor:
+    def __init__(self, read_size: int, produced: list):
+        self.read_size = read_size
+        self.produced = produced
+        self.reads = []
+
+    def copy_expert(self, sql, source):
+        while chunk := source.read(self.read_size):
+            self.reads.append((chunk, len(self.produced)))
+
+    def close(self):
+        pass
+
+
+class TestCopyRows:
+    def test_rows_are_streamed_to_copy_in_chunks(self):
+        """Test that COPY pulls rows as it reads instead of from one prebuilt buffer."""
+        produced = []
+
+        def rows():
+            for index in range(3):
+                produced.append(index)
+                yield {"ticker": f"T{index}", "value": None}
+
+        cursor = CopyCursor(8, produced)
+        connection = SimpleNamespace(connection=SimpleNamespace(cursor=lambda: cursor))
+        _copy_rows(SimpleNamespace(connection=lambda: connection), "facts", ["ticker", "value"], rows())
+
+        assert "".join(chunk for chunk, _ in cursor.reads) == "T0,\\N\r\nT1,\\N\r\nT2,\\N\r\n"
+        assert cursor.reads[0] == ("T0,\\N\r\nT", 2)
@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+import pandas as pd
+from sqlalchemy import event
+from adapters.cache import InMemoryCache
+from adapters.frame_codec import decode_frame, encode_frame, is_encoded_frame
+from adapters.orm import CombinedFinancialStatementsORM
+from adapters.repository import PostgresCombinedFinancialStatementsRepository
+from domain import model
+
+
+def make_frame():
+    return pd.DataFrame(
+        {"2023-12-31": [100.0, np.nan, -3.5], "2022-12-31": [90, 40, 2]},
+        index=["Revenue", "Cost Of Revenue", "EPS"]
+    )
+
+
+class TestFrameCodec:
+    def test_round_trip_preserves_labels_and_values(self):
+        """Test that encoding and decoding keeps labels, order and NaN values."""
+        df = make_frame()
+        decoded = decode_frame(encode_frame(df))
+        pd.testing.assert_frame_equal(decoded, df.astype("float64"))
+
+    def test_decode_is_zero_copy(self):
+        """Test that decoded values are a view over the encoded buffer."""
+        buffer = bytearray(encode_frame(make_frame()))
+        decoded = decode_frame(buffer)
+        assert np.shares_memory(decoded._mgr.blocks[0].values, np.frombuffer(buffer, dtype=np.uint8))
+
+    def test_empty_frame_round_trip(self):
+        """Test that an empty frame survives encoding."""
+        decoded = decode_frame(encode_frame(pd.DataFrame()))
+        assert decoded.empty
+
+    def test_non_numeric_frames_are_not_encoded(self):
+        """Test that frames the codec cannot represent fall back to JSON."""
+        assert encode_frame(pd.DataFrame({"a": ["text"]}, index=["x"])) is None
+        assert encode_frame(pd.DataFrame({1: [1.0]}, index=["x"])) is None
+        assert not is_encoded_frame(b"")
+
+    def test_numeric_string_frames_are_not_encoded(self):
+        """Test that frames holding numbers as strings are left to JSON instead of being coerced to floats."""
+        assert encode_frame(pd.DataFrame({"2023": ["100", "2.5"]}, index=["Revenue", "EPS"])) is None
+        assert encode_frame(pd.DataFrame({"2023": [100, 2]}, index=["Revenue", "EPS"])) is not None
+
+
+class TestStatementStorage:
+    @pytest.fixture(autouse=True)
+    def repository(self, session):
+        self.session = session
+        self.repo = PostgresCombinedFinancialStatementsRepository(session, cache=InMemoryCache())
+
+    def test_reads_prefer_binary_frames(self, monkeypatch):
+        """Test that stored statements are read back from the binary column."""
+        stmt = model.CombinedFinancialStatements([], [], "TEST", "Test Corp", "10-K")
+        stmt.df = make_frame()
+        self.repo.add(stmt)
+        self.session.commit()
+
+        monkeypatch.setattr(pd, "read_json", lambda *args, **kwargs: pytest.fail("JSON was parsed"))
+        loaded = self.repo.get("TEST", "10-K")
+
+        pd.testing.assert_frame_equal(loaded.df, make_frame().astype("float64"))
+
+    def test_json_rows_are_read_and_backfilled(self):
+        """Test that rows written before the binary column are still readable and get backfilled."""
+        stmt = model.CombinedFinancialStatements([], [], "OLD", "Old Corp", "10-K")
+        stmt.df = make_frame()
+        self.repo.add(stmt)
+        self.session.commit()
+        self.session.query(CombinedFinancialStatementsORM).update({"data_blob": None, "frames_encoded_at": None})
+        self.session.commit()
+        self.session.expire_all()
+
+        assert self.repo.get("OLD", "10-K").df.loc["Revenue", "2023-12-31"] == 100.0
+        assert self.repo.backfill_binary_frames(10) == 1
+        self.session.commit()
+        assert self.repo.backfill_binary_frames(10) == 0
+
+    def test_unencodable_frames_are_stored_as_null_and_not_backfilled_again(self):
+        """Test that frames the codec cannot represent leave their blobs NULL and are only backfilled once."""
+        stmt = model.CombinedFinancialStatements([], [], "TXT", "Text Corp", "10-K")
+        stmt.df = pd.DataFrame({"2023-12-31": ["1,000"]}, index=["Revenue"])
+        stmt.balance_sheet_df = pd.DataFrame({"2023-12-31": ["$5"]}, index=["Cash"])
+        self.repo.add(stmt)
+        self.session.commit()
+        row = self.session.query(CombinedFinancialStatementsORM).one()
+
+        assert (row.data_blob, row.balance_sheet_blob) == (None, None)
+        assert self.repo.backfill_binary_frames(10) == 0
+        assert self.repo.get("TXT", "10-K").df.loc["Revenue", "2023-12-31"] == "1,000"
+
+    def test_unencodable_balance_sheet_replaces_the_stored_blob(self):
+        """Test that upserting a balance sheet the codec cannot represent clears the previous binary copy."""
+        stmt = model.CombinedFinancialStatements([], [], "BS", "Balance Corp", "10-K")
+        stmt.balance_sheet_df = pd.DataFrame({"2023-12-31": [5.0]}, index=["Cash"])
+        self.repo.upsert(stmt)
+        self.session.commit()
+        stmt.balance_sheet_df = pd.DataFrame({"2023-12-31": ["$7"]}, index=["Cash"])
+        self.repo.upsert(stmt)
+        self.session.commit()
+        self.session.expire_all()
+
+        assert self.repo.get_balance_sheet("BS", "10-K").balance_sheet_df.iloc[0, 0] == "$7"
+
+    def test_preferred_balance_sheet_follows_form_preference(self):
+        """Test that the balance sheet lookup prefers the requested form and skips empty frames."""
+        for form_type, value in [("10-Q", 1.0), ("10-K", 2.0), ("8-K", 3.0)]:
+            stmt = model.CombinedFinancialStatements([], [], "BAL", "Bal Corp", form_type)
+            stmt.balance_sheet_df = pd.DataFrame({"2023-12-31:2023-12-31": [value]}, index=["CashAndCashEquivalents"])
+            self.repo.add(stmt)
+        empty = model.CombinedFinancialStatements([], [], "BAL", "Bal Corp", "10-K/A")
+        empty.balance_sheet_df = pd.DataFrame()
+        self.repo.add(empty)
+        self.session.commit()
+
+        assert self.repo.get_preferred_balance_sheet("BAL", "10-Q").iloc[0, 0] == 1.0
+        assert self.repo.get_preferred_balance_sheet("BAL", "10-K/A").iloc[0, 0] == 2.0
+        assert self.repo.get_preferred_balance_sheet("NONE", "10-K") is None
+
+    def test_projections_load_only_the_requested_frame(self):
+        """Test that single-frame reads do not select the other frame columns."""
+        stmt = model.CombinedFinancialStatements([], [], "PRJ", "Projection Corp", "10-K")
+        stmt.df = make_frame()
+        stmt.balance_sheet_df = pd.DataFrame({"2023-12-31:2023-12-31": [5.0]}, index=["CashAndCashEquivalents"])
+        self.repo.add(stmt)
+        self.session.commit()
+        self.session.expire_all()
+
+        statements = []
+        event.listen(self.session.get_bind(), "before_cursor_execute",
+                     lambda conn, cursor, sql, params, context, executemany: statements.append(sql))
+
+        balance_sheet = self.repo.get_balance_sheet("PRJ", "10-K")
+
+        assert balance_sheet.balance_sheet_df.iloc[0, 0] == 5.0 and balance_sheet.df.empty
+        assert not any("data_blob" in sql or ".data," in sql for sql in statements)
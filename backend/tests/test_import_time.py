@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+
+import import_time_report
+
+
+class TestImportTime:
+    def test_api_entrypoint_defers_heavy_modules(self):
+        """Test that importing the API loads no lazily-used third-party modules and stays within budget."""
+        import_times = import_time_report.measure_import_times("entrypoints.backend")
+
+        assert import_time_report.eagerly_imported_lazy_modules(import_times) == []
+        assert import_times["entrypoints.backend"] / 1e6 <= import_time_report.IMPORT_TIME_BUDGET_SECONDS
+
+    def test_importing_uow_creates_no_engine(self):
+        """Test that the database engine is only created when a unit of work is first entered."""
+        completed = subprocess.run(
+            [sys.executable, "-c", "from service_layer import uow; print(uow._default_session_factory is None)"],
+            cwd=import_time_report.BACKEND_DIR,
+            env={**os.environ, "DATABASE_URL": "sqlite://"},
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        assert completed.stdout.strip().splitlines()[-1] == "True"
+        assert "Database URL" not in completed.stdout
@@ -0,0 +1,220 @@
+import threading
+import pandas as pd
+from sqlalchemy import select
+from domain.index_matching import IndexMatcher, build_synonym_index, humanize_tag, normalize_tag, tokenize_tag
+from adapters import repository
+from adapters.orm import TagEquivalenceORM
+from service_layer import service
+from service_layer import uow as uow_mod
+
+
+SYNONYMS = build_synonym_index({
+    "Revenue": {
+        "primary": ["us-gaap:Revenues"],
+        "secondary": ["us-gaap:SalesRevenueNet"]
+    }
+})
+
+
+class TestTagHelpers:
+    def test_normalize_tag_strips_prefix_and_punctuation(self):
+        """Test that namespace prefixes, case and punctuation are ignored."""
+        assert normalize_tag("us-gaap:Net_Income-Loss") == "netincomeloss"
+
+    def test_tokenize_tag_splits_camel_case(self):
+        """Test that CamelCase tags are split into lowercase tokens."""
+        assert tokenize_tag("EarningsPerShareBasic") == {"earnings", "per", "share", "basic"}
+
+    def test_humanize_tag_keeps_acronyms(self):
+        """Test that the request-time fallback name is readable and keeps acronyms."""
+        assert humanize_tag("us-gaap:ResearchAndDevelopmentExpense") == "Research And Development Expense"
+        assert humanize_tag("COGS") == "COGS"
+
+
+class TestIndexMatcher:
+    def test_exact_matches_are_kept(self):
+        """Test that identical labels map to themselves."""
+        result = IndexMatcher(SYNONYMS).match(["Revenue", "COGS"], ["COGS", "Revenue"])
+        assert result.mapping == {"Revenue": "Revenue", "COGS": "COGS"}
+        assert result.is_complete
+
+    def test_normalized_match(self):
+        """Test that labels differing only in case or prefix are matched."""
+        result = IndexMatcher(SYNONYMS).match(["us-gaap:NetIncomeLoss"], ["netincomeloss"])
+        assert result.mapping == {"us-gaap:NetIncomeLoss": "netincomeloss"}
+        assert result.stage_counts["normalized"] == 1
+
+    def test_xbrl_synonyms_are_matched(self):
+        """Test that tags from the same xbrl_mappings group are matched."""
+        result = IndexMatcher(SYNONYMS).match(["Revenues"], ["SalesRevenueNet"])
+        assert result.mapping == {"Revenues": "SalesRevenueNet"}
+
+    def test_stored_equivalences_are_matched(self):
+        """Test that learned tag equivalences resolve otherwise unrelated tags."""
+        equivalences = {"ResearchAndDevelopmentExpense": {"TechnologyAndDevelopment"}}
+        result = IndexMatcher(SYNONYMS).match(["ResearchAndDevelopmentExpense"], ["TechnologyAndDevelopment"], equivalences)
+        assert result.mapping == {"ResearchAndDevelopmentExpense": "TechnologyAndDevelopment"}
+
+    def test_basic_and_diluted_are_not_confused(self):
+        """Test that similarity scoring does not pair basic and diluted metrics."""
+        result = IndexMatcher(SYNONYMS).match(["EarningsPerShareBasic"], ["EarningsPerShareDiluted"])
+        assert result.mapping == {}
+        assert result.unresolved_base == ["EarningsPerShareBasic"]
+        assert result.unresolved_current == ["EarningsPerShareDiluted"]
+
+
+class MappingOnlyUnitOfWork(uow_mod.AbstractUnitOfWork):
+    def __init__(self, llm):
+        self.llm = llm
+        self.mappings = repository.FakeIndexMappingRepository()
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class RecordingLLM:
+    def __init__(self, mapping):
+        self.mapping = mapping
+        self.calls = []
+
+    def map_dataframes(self, df1, df2):
+        self.calls.append((list(df1.index), list(df2.index)))
+        return self.mapping
+
+
+class BlockingLLM(RecordingLLM):
+    def __init__(self, mapping):
+        super().__init__(mapping)
+        self.release = threading.Event()
+        self.finished = threading.Event()
+
+    def map_dataframes(self, df1, df2):
+        self.release.wait(5)
+        mapping = super().map_dataframes(df1, df2)
+        self.finished.set()
+        return mapping
+
+
+class TestGetIndexMapping:
+    def test_only_residue_is_sent_to_llm_and_result_is_reused(self):
+        """Test that the LLM sees only unresolved rows and the stored mapping is reused."""
+        base_df = pd.DataFrame({"2023": [1.0, 2.0, 3.0]}, index=["Revenue", "CostOfRevenue", "OtherExpense"])
+        current_df = pd.DataFrame({"2022": [1.0, 2.0, 3.0]}, index=["Revenue", "CostOfRevenue", "MiscellaneousCharges"])
+        uow_instance = MappingOnlyUnitOfWork(RecordingLLM({"OtherExpense": "MiscellaneousCharges"}))
+
+        mapping = service.get_index_mapping(base_df, current_df, uow_instance)
+        service.get_index_mapping(base_df, current_df, uow_instance)
+
+        assert mapping["OtherExpense"] == "MiscellaneousCharges"
+        assert uow_instance.llm.calls == [(["OtherExpense"], ["MiscellaneousCharges"])]
+
+    def test_llm_is_skipped_when_everything_matches(self):
+        """Test that no LLM call is made when the pre-matcher resolves every row."""
+        base_df = pd.DataFrame({"2023": [1.0]}, index=["Revenue"])
+        current_df = pd.DataFrame({"2022": [1.0]}, index=["Revenue"])
+        uow_instance = MappingOnlyUnitOfWork(RecordingLLM({}))
+
+        assert service.get_index_mapping(base_df, current_df, uow_instance) == {"Revenue": "Revenue"}
+        assert uow_instance.llm.calls == []
+
+
+class TestGetIndexMappingsWithinBudget:
+    def test_duplicate_frames_share_one_llm_call(self):
+        """Test that statements with identical indices are mapped once."""
+        base_df = pd.DataFrame({"2023": [1.0, 2.0]}, index=["Revenue", "OtherExpense"])
+        current_df = pd.DataFrame({"2022": [1.0, 2.0]}, index=["Revenue", "MiscellaneousCharges"])
+        uow_instance = MappingOnlyUnitOfWork(RecordingLLM({"OtherExpense": "MiscellaneousCharges"}))
+
+        mappings, degraded = service.get_index_mappings_within_budget(base_df, [current_df, current_df.copy()], uow_instance, 5)
+
+        assert not degraded
+        assert mappings[0] == mappings[1] == {"Revenue": "Revenue", "OtherExpense": "MiscellaneousCharges"}
+        assert len(uow_instance.llm.calls) == 1
+
+    def test_expired_budget_degrades_and_keeps_late_result(self):
+        """Test that an expired budget returns the local mapping and a late LLM result is reused."""
+        base_df = pd.DataFrame({"2023": [1.0, 2.0]}, index=["Revenue", "OtherExpense"])
+        current_df = pd.DataFrame({"2022": [1.0, 2.0]}, index=["Revenue", "UnusualCharges"])
+        uow_instance = MappingOnlyUnitOfWork(BlockingLLM({"OtherExpense": "UnusualCharges"}))
+
+        mappings, degraded = service.get_index_mappings_within_budget(base_df, [current_df], uow_instance, 0.05)
+
+        assert degraded
+        assert mappings == [{"Revenue": "Revenue"}]
+        assert uow_instance.mappings.get(base_df.index.tolist(), current_df.index.tolist()) is None
+
+        uow_instance.llm.release.set()
+        assert uow_instance.llm.finished.wait(5)
+        for _ in range(100):
+            if service._late_llm_mappings:
+                break
+            threading.Event().wait(0.01)
+
+        mapping = service.get_index_mapping(base_df, current_df, uow_instance)
+
+        assert mapping == {"Revenue": "Revenue", "OtherExpense": "UnusualCharges"}
+        assert len(uow_instance.llm.calls) == 1
+
+
+class TestIndexMappingRepository:
+    def test_mapping_key_ignores_index_order(self, session):
+        """Test that a stored mapping is found for the same index sets in any order and is not overwritten."""
+        mappings = repository.PostgresIndexMappingRepository(session)
+
+        mappings.add(["Revenue", "OtherExpense"], ["MiscCharges", "Revenue"], {"OtherExpense": "MiscCharges"})
+        mappings.add(["OtherExpense", "Revenue"], ["Revenue", "MiscCharges"], {"OtherExpense": "Revenue"})
+
+        assert repository.build_mapping_cache_key(["b", "a"], ["c"]) == repository.build_mapping_cache_key(["a", "b"], ["c"])
+        assert repository.build_mapping_cache_key(["a"], ["b"]) != repository.build_mapping_cache_key(["b"], ["a"])
+        assert mappings.get(["OtherExpense", "Revenue"], ["Revenue", "MiscCharges"]) == {"OtherExpense": "MiscCharges"}
+        assert mappings.get(["Revenue"], ["Revenue"]) is None
+
+    def test_equivalence_occurrences_are_counted(self, session):
+        """Test that repeated equivalences increment one row, identities are skipped and lookups are symmetric."""
+        stored = repository.PostgresIndexMappingRepository(session)
+        fake = repository.FakeIndexMappingRepository()
+        mapping = {"ResearchAndDevelopmentExpense": "TechnologyAndDevelopment", "Revenue": "Revenue"}
+
+        for mappings in (stored, fake):
+            mappings.record_equivalences(mapping)
+            mappings.record_equivalences(mapping)
+            assert mappings.get_equivalences(["TechnologyAndDevelopment"]) == {
+                "ResearchAndDevelopmentExpense": {"TechnologyAndDevelopment"},
+                "TechnologyAndDevelopment": {"ResearchAndDevelopmentExpense"},
+            }
+            assert mappings.get_equivalences(["Revenue"]) == {}
+
+        rows = session.execute(select(TagEquivalenceORM.source_tag, TagEquivalenceORM.occurrences)).all()
+        assert rows == [("ResearchAndDevelopmentExpense", 2)]
+        assert fake.equivalences == {("ResearchAndDevelopmentExpense", "TechnologyAndDevelopment"): 2}
+
+    def test_warm_cache_skips_the_llm(self, make_uow):
+        """Test that a mapping stored through one unit of work is reused by the next without an LLM call."""
+        base_df = pd.DataFrame({"2023": [1.0, 2.0]}, index=["Revenue", "LegalSettlements"])
+        current_df = pd.DataFrame({"2022": [1.0, 2.0]}, index=["Revenue", "LitigationCharges"])
+        cold_llm = RecordingLLM({"LegalSettlements": "LitigationCharges"})
+        warm_llm = RecordingLLM({})
+
+        cold = service.get_index_mapping(base_df, current_df, make_uow(llm=cold_llm))
+        warm = service.get_index_mapping(base_df, current_df, make_uow(llm=warm_llm))
+
+        assert cold == warm == {"Revenue": "Revenue", "LegalSettlements": "LitigationCharges"}
+        assert len(cold_llm.calls) == 1
+        assert warm_llm.calls == []
+
+    def test_mapping_inside_an_open_unit_of_work_is_stored(self, make_uow):
+        """Test that mapping from within an already open unit of work stores its result on exit."""
+        base_df = pd.DataFrame({"2023": [1.0, 2.0]}, index=["Revenue", "RestructuringCosts"])
+        current_df = pd.DataFrame({"2022": [1.0, 2.0]}, index=["Revenue", "ReorganizationItems"])
+        uow_instance = make_uow(llm=RecordingLLM({"RestructuringCosts": "ReorganizationItems"}))
+
+        with uow_instance:
+            service.get_index_mapping(base_df, current_df, uow_instance)
+
+        with make_uow() as uowx:
+            assert uowx.mappings.get(base_df.index.tolist(), current_df.index.tolist()) == {
+                "Revenue": "Revenue", "RestructuringCosts": "ReorganizationItems"
+            }
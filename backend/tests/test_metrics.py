@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy import create_engine, text
+from adapters import metrics
+from adapters.metrics import MetricsRegistry
+from entrypoints import backend
+from service_layer import service
+
+
+class TestMetricsRegistry:
+    def test_histogram_renders_cumulative_buckets(self):
+        """Test that histograms render cumulative buckets, sum and count in Prometheus text format."""
+        registry = MetricsRegistry()
+        latency = registry.histogram("test_latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+        latency.observe(0.05, stage="sec")
+        latency.observe(0.5, stage="sec")
+        latency.observe(2.0, stage="sec")
+
+        assert registry.render().splitlines() == [
+            "# HELP test_latency_seconds Latency.",
+            "# TYPE test_latency_seconds histogram",
+            'test_latency_seconds_bucket{stage="sec",le="0.1"} 1.0',
+            'test_latency_seconds_bucket{stage="sec",le="1.0"} 2.0',
+            'test_latency_seconds_bucket{stage="sec",le="+Inf"} 3.0',
+            'test_latency_seconds_sum{stage="sec"} 2.55',
+            'test_latency_seconds_count{stage="sec"} 3.0',
+        ]
+
+    def test_label_values_are_escaped_and_checked(self):
+        """Test that label values are escaped and that missing labels are rejected."""
+        registry = MetricsRegistry()
+        requests = registry.counter("test_requests_total", "Requests.", ("route",))
+        requests.inc(route='/a"b\\c')
+
+        assert 'test_requests_total{route="/a\\"b\\\\c"} 1.0' in registry.render()
+        with pytest.raises(ValueError):
+            requests.inc()
+        assert registry.counter("test_requests_total", "Requests.", ("route",)) is requests
+
+
+class TestTrack:
+    def test_failed_stage_counts_error_and_leaves_no_in_flight(self):
+        """Test that a stage that raises is timed, counted as an error and no longer in flight."""
+        errors = metrics.STAGE_ERRORS.value(stage="test_failing_stage")
+
+        with pytest.raises(RuntimeError):
+            with metrics.track("test_failing_stage"):
+                assert metrics.STAGE_IN_FLIGHT.value(stage="test_failing_stage") == 1
+                raise RuntimeError("boom")
+
+        assert metrics.STAGE_ERRORS.value(stage="test_failing_stage") == errors + 1
+        assert metrics.STAGE_IN_FLIGHT.value(stage="test_failing_stage") == 0
+        assert metrics.STAGE_DURATION.count(stage="test_failing_stage") >= 1
+
+    def test_database_queries_are_timed(self):
+        """Test that every executed SQL statement is recorded under the db_query stage."""
+        engine = create_engine("sqlite://")
+        before = metrics.STAGE_DURATION.count(stage="db_query")
+
+        with engine.connect() as connection:
+            connection.execute(text("select 1"))
+            connection.execute(text("select 2"))
+
+        assert metrics.STAGE_DURATION.count(stage="db_query") == before + 2
+
+
+class TestMetricsEndpoint:
+    def test_requests_are_recorded_by_route_template(self, monkeypatch, call_app):
+        """Test that /metrics exposes request counts keyed by route template rather than raw path."""
+        monkeypatch.setattr(service, "validate_company_exists", lambda ticker: False)
+        route = "/api/financial/income/{ticker}/stream"
+
+        async def scenario(client):
+            await client.get("/api/financial/income/NOPE/stream", headers={"Authorization": "Bearer token"})
+            await client.get("/no-such-route")
+            return await client.get("/metrics")
+
+        before = backend.HTTP_REQUESTS.value(method="GET", route=route, status="422")
+        response = call_app(scenario)
+
+        assert response.headers["Content-Type"] == metrics.CONTENT_TYPE
+        assert backend.HTTP_REQUESTS.value(method="GET", route=route, status="422") == before + 1
+        assert 'equityalchemy_http_requests_total{method="GET",route="unmatched",status="404"}' in response.text
+        assert "# TYPE equityalchemy_stage_duration_seconds histogram" in response.text
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+import pandas as pd
+from adapters.repository import PostgresReadableNameRepository
+from service_layer import service
+
+
+class ReadableNameLLM:
+    def __init__(self, mapping):
+        self.mapping = mapping
+        self.calls = []
+
+    def make_index_readable(self, index_names):
+        self.calls.append(list(index_names))
+        return self.mapping
+
+
+class TestClaimPending:
+    def test_claims_are_leased_until_the_timeout(self, monkeypatch, make_uow):
+        """Test that claimed tags are hidden from other workers until their lease expires."""
+        with make_uow() as uowx:
+            uowx.readable_names.enqueue(["us-gaap:Revenues", "us-gaap:CostOfRevenue"])
+            uowx.commit()
+
+        with make_uow() as uowx:
+            first = uowx.readable_names.claim_pending(1)
+            uowx.commit()
+        with make_uow() as uowx:
+            second = uowx.readable_names.claim_pending(5)
+            uowx.commit()
+        with make_uow() as uowx:
+            assert uowx.readable_names.claim_pending(5) == []
+
+        monkeypatch.setattr(PostgresReadableNameRepository, "CLAIM_TIMEOUT", timedelta(0))
+        with make_uow() as uowx:
+            uowx.readable_names.add_many({first[0]: "Revenue"})
+            assert uowx.readable_names.claim_pending(5) == second
+
+        assert sorted(first + second) == ["us-gaap:CostOfRevenue", "us-gaap:Revenues"]
+
+
+class TestRefreshReadableNames:
+    def test_unchanged_and_omitted_names_are_stored(self, make_uow):
+        """Test that names the LLM keeps or skips are stored instead of being requeued forever."""
+        with make_uow() as uowx:
+            uowx.readable_names.enqueue(["EBITDA", "us-gaap:Revenues", "us-gaap:OtherNonoperatingIncome"])
+            uowx.commit()
+        llm = ReadableNameLLM({"EBITDA": "EBITDA", "us-gaap:Revenues": "Revenue"})
+
+        assert service.refresh_readable_names(make_uow(llm=llm)) == 3
+        assert service.refresh_readable_names(make_uow(llm=llm)) == 0
+        with make_uow() as uowx:
+            assert uowx.readable_names.get_many(["EBITDA", "us-gaap:Revenues", "us-gaap:OtherNonoperatingIncome"]) == {
+                "EBITDA": "EBITDA", "us-gaap:Revenues": "Revenue", "us-gaap:OtherNonoperatingIncome": "Other Nonoperating Income"
+            }
+        assert len(llm.calls) == 1
+
+    def test_failed_request_leaves_names_queued(self, monkeypatch, make_uow):
+        """Test that an empty LLM response stores nothing and the names are claimed again after the lease."""
+        with make_uow() as uowx:
+            uowx.readable_names.enqueue(["us-gaap:Revenues"])
+            uowx.commit()
+
+        assert service.refresh_readable_names(make_uow(llm=ReadableNameLLM({}))) == 0
+        monkeypatch.setattr(PostgresReadableNameRepository, "CLAIM_TIMEOUT", timedelta(0))
+        assert service.refresh_readable_names(make_uow(llm=ReadableNameLLM({"us-gaap:Revenues": "Revenue"}))) == 1
+
+
+class TestFormatDataframeIndexes:
+    def test_fallback_names_are_reported_until_readable_names_exist(self, make_uow):
+        """Test that humanized fallbacks are flagged so stored statements can be refined once names arrive."""
+        df = pd.DataFrame({"2023": [1.0]}, index=["us-gaap:Revenues"])
+
+        fallback_df, used_fallback = service.format_dataframe_indexes_with_fallbacks(df, make_uow())
+        service.refresh_readable_names(make_uow(llm=ReadableNameLLM({"us-gaap:Revenues": "Revenue"})))
+        named_df, still_fallback = service.format_dataframe_indexes_with_fallbacks(df, make_uow())
+
+        assert (fallback_df.index.tolist(), used_fallback) == (["Revenues"], True)
+        assert (named_df.index.tolist(), still_fallback) == (["Revenue"], False)
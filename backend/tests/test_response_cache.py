@@ -0,0 +1,121 @@
+import pandas as pd
+import pytest
+from adapters.orm import CombinedFinancialStatementsORM
+from entrypoints import backend
+from service_layer import service
+
+
+class IncomeEndpointHarness:
+    @pytest.fixture(autouse=True)
+    def harness(self, make_uow, make_statements, call_app):
+        self.make_uow = make_uow
+        self.make_statements = make_statements
+        self.call_app = call_app
+
+    def store(self, stmt):
+        with self.make_uow() as uowx:
+            uowx.stmts.upsert(stmt)
+
+    def request_income(self, monkeypatch, ticker, *header_sets, params=None):
+        monkeypatch.setattr(backend.uow, "SqlAlchemyUnitOfWork", self.make_uow)
+        monkeypatch.setattr(service, "validate_company_exists", lambda ticker: True)
+        monkeypatch.setattr(service, "get_ticker_from_name_or_ticker", lambda ticker: ticker)
+        monkeypatch.setattr(service, "record_company_lookup", lambda ticker: None)
+
+        async def scenario(client):
+            responses = []
+            for headers in header_sets:
+                responses.append(await client.get(
+                    f"/api/financial/income/{ticker}", params={"form_type": "10-K", **(params or {})},
+                    headers={"Authorization": "Bearer token", **headers}
+                ))
+            return responses
+
+        return self.call_app(scenario)
+
+
+class TestIncomeResponseCache(IncomeEndpointHarness):
+    def test_matching_etag_returns_not_modified(self, monkeypatch):
+        """Test that a request carrying the current ETag gets an empty 304."""
+        self.store(self.make_statements("ETAG", 100.0))
+
+        first, second = self.request_income(monkeypatch, "ETAG", {}, {})
+        revalidated, = self.request_income(monkeypatch, "ETAG", {"If-None-Match": first.headers["ETag"]})
+
+        assert first.status_code == 200
+        assert first.json()["metrics"] == [{"name": "Revenue", "values": {"2023-01-01:2023-12-31": 100.0}}]
+        assert first.headers["Cache-Control"] == backend.RESPONSE_CACHE_CONTROL
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+
+    def test_hot_ticker_is_served_from_encoded_cache(self, monkeypatch):
+        """Test that repeat requests reuse the encoded body without loading the statements."""
+        self.store(self.make_statements("HOTC", 100.0))
+        loads = []
+        load_statements = service.get_stored_income_statements
+
+        def counting_load(*args, **kwargs):
+            loads.append(args[0])
+            return load_statements(*args, **kwargs)
+
+        monkeypatch.setattr(service, "get_stored_income_statements", counting_load)
+
+        first, second = self.request_income(monkeypatch, "HOTC", {}, {})
+
+        assert loads == ["HOTC"]
+        assert second.content == first.content
+
+    def test_new_data_changes_etag(self, monkeypatch):
+        """Test that rewriting the stored statements produces a new ETag and body."""
+        self.store(self.make_statements("NEWD", 100.0))
+        before, = self.request_income(monkeypatch, "NEWD", {})
+
+        self.store(self.make_statements("NEWD", 200.0))
+        with self.make_uow() as uowx:
+            orm_row = uowx.session.query(CombinedFinancialStatementsORM).one()
+            orm_row.updated_at = pd.Timestamp("2030-01-01", tz="UTC").to_pydatetime()
+        after, = self.request_income(monkeypatch, "NEWD", {"If-None-Match": before.headers["ETag"]})
+
+        assert after.status_code == 200
+        assert after.headers["ETag"] != before.headers["ETag"]
+        assert after.json()["metrics"][0]["values"]["2023-01-01:2023-12-31"] == 200.0
+
+
+class TestColumnarResponse(IncomeEndpointHarness):
+    def test_columnar_format_returns_values_matrix(self, monkeypatch):
+        """Test that format=columnar returns sorted periods, metric names and a values matrix with nulls."""
+        stmt = self.make_statements("COLS", 100.0)
+        stmt.df = pd.DataFrame(
+            {"2023-01-01:2023-12-31": [100.0, None], "2022-01-01:2022-12-31": [90.0, 5.0]},
+            index=["Revenue", "NetIncome"]
+        )
+        self.store(stmt)
+
+        columnar, = self.request_income(monkeypatch, "COLS", {}, params={"format": "columnar"})
+        records, = self.request_income(monkeypatch, "COLS", {})
+
+        assert columnar.json() == {
+            "ticker": "COLS",
+            "form_type": "10-K",
+            "format": "columnar",
+            "periods": ["2022-01-01:2022-12-31", "2023-01-01:2023-12-31"],
+            "metrics": ["Revenue", "NetIncome"],
+            "values": [[90.0, 100.0], [5.0, None]]
+        }
+        assert columnar.headers["ETag"] != records.headers["ETag"]
+        assert records.json()["metrics"][1] == {"name": "NetIncome", "values": {"2022-01-01:2022-12-31": 5.0}}
+
+    def test_gzip_is_negotiated(self, monkeypatch):
+        """Test that the body is gzipped only for clients that accept it, under a distinct ETag."""
+        self.store(self.make_statements("GZIP", 100.0))
+
+        compressed, identity = self.request_income(
+            monkeypatch, "GZIP", {"Accept-Encoding": "gzip"}, {"Accept-Encoding": "identity"}
+        )
+
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert "Content-Encoding" not in identity.headers
+        assert compressed.headers["Vary"] == "Accept-Encoding"
+        assert compressed.json() == identity.json()
+        assert compressed.headers["ETag"] != identity.headers["ETag"]
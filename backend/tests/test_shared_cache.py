@@ -0,0 +1,128 @@
+import socketserver
+import threading
+import time
+
+import pytest
+from adapters.cache import InMemoryCache, RespCache, RespConnection, TieredCache
+
+
+class StandInRespServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInRespHandler)
+        self.hashes = {}
+        self.subscribers = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.server_address[1]}/0"
+
+
+class StandInRespHandler(socketserver.StreamRequestHandler):
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def write_bulk(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def handle(self):
+        server = self.server
+        while True:
+            command = self.read_command()
+            if command is None:
+                return
+            name = command[0].upper()
+            with server.lock:
+                if name == b"HGET":
+                    reply = self.write_bulk(server.hashes.get(command[1], {}).get(command[2]))
+                elif name == b"HSET":
+                    server.hashes.setdefault(command[1], {})[command[2]] = command[3]
+                    reply = b":1\r\n"
+                elif name == b"DEL":
+                    reply = b":%d\r\n" % int(server.hashes.pop(command[1], None) is not None)
+                elif name == b"PUBLISH":
+                    message = b"*3\r\n" + self.write_bulk(b"message") + self.write_bulk(command[1]) + self.write_bulk(command[2])
+                    for subscriber in server.subscribers:
+                        subscriber.write(message)
+                        subscriber.flush()
+                    reply = b":%d\r\n" % len(server.subscribers)
+                elif name == b"SUBSCRIBE":
+                    server.subscribers.append(self.wfile)
+                    reply = b"*3\r\n" + self.write_bulk(b"subscribe") + self.write_bulk(command[1]) + b":1\r\n"
+                else:
+                    reply = b"+OK\r\n"
+            self.wfile.write(reply)
+            self.wfile.flush()
+
+
+@pytest.fixture
+def resp_server():
+    server = StandInRespServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestRespCache:
+    def test_values_round_trip_and_expire(self, resp_server):
+        """Test that values are stored per scope and honour their TTL."""
+        now = [1000.0]
+        cache = RespCache(RespConnection.from_url(resp_server.url), clock=lambda: now[0])
+        cache.set("AAPL", "statements:10-K", b"payload", ttl_seconds=10)
+
+        assert cache.get("AAPL", "statements:10-K") == b"payload"
+        now[0] += 11
+        assert cache.get("AAPL", "statements:10-K") is None
+
+    def test_unreachable_server_degrades_to_misses(self):
+        """Test that a missing cache server never raises into callers."""
+        cache = RespCache(RespConnection("127.0.0.1", 1, timeout=0.1))
+        cache.set("AAPL", "statements:10-K", b"payload")
+        assert cache.get("AAPL", "statements:10-K") is None
+        assert cache.stats()["errors"] == 1
+
+
+class TestTieredCache:
+    def test_invalidation_reaches_other_instances(self, resp_server):
+        """Test that a writer's invalidation evicts the local tier of another instance."""
+        def make_instance():
+            cache = TieredCache(InMemoryCache(), RespCache(RespConnection.from_url(resp_server.url)))
+            cache.start_invalidation_listener(lambda: RespConnection.from_url(resp_server.url))
+            return cache
+
+        reader, writer = make_instance(), make_instance()
+        assert wait_for(lambda: len(resp_server.subscribers) == 2)
+
+        writer.set("MSFT", "statements:10-K", b"v1")
+        assert reader.get("MSFT", "statements:10-K") == b"v1"
+        assert reader.local.get("MSFT", "statements:10-K") == b"v1"
+
+        writer.invalidate("MSFT")
+
+        assert wait_for(lambda: reader.local.get("MSFT", "statements:10-K") is None)
+        assert reader.get("MSFT", "statements:10-K") is None
+        reader.stop()
+        writer.stop()
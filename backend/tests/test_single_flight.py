@@ -0,0 +1,94 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from service_layer import service
+from service_layer import uow as uow_mod
+from service_layer.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        """Test that callers arriving while a key is in flight get the leader's result."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def build():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(flight.do, "AAPL", build)
+            while not calls:
+                threading.Event().wait(0.01)
+            followers = [executor.submit(flight.do, "AAPL", build) for _ in range(3)]
+            threading.Event().wait(0.1)
+            release.set()
+
+            assert leader.result() == ("result", False)
+            assert [f.result() for f in followers] == [("result", True)] * 3
+        assert calls == [1]
+        assert flight.in_flight() == 0
+
+    def test_errors_reach_followers_and_key_is_released(self):
+        """Test that a failed call is reported and does not block later calls."""
+        flight = SingleFlight()
+
+        with pytest.raises(ValueError):
+            flight.do("AAPL", lambda: (_ for _ in ()).throw(ValueError("boom")))
+
+        assert flight.do("AAPL", lambda: "retry") == ("retry", False)
+
+
+class EmptyStatements:
+    def __init__(self):
+        self.locks = []
+
+    def get(self, ticker, form_type):
+        return None
+
+    def lock_statement_build(self, ticker, form_type):
+        self.locks.append((ticker, form_type))
+
+
+class StatementsOnlyUnitOfWork(uow_mod.AbstractUnitOfWork):
+    def __init__(self, stmts):
+        self.stmts = stmts
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class TestCoalescedStatementBuilds:
+    def test_concurrent_cold_requests_build_once(self, monkeypatch):
+        """Test that simultaneous requests for an uncached ticker run the pipeline once."""
+        builds = []
+        release = threading.Event()
+
+        def slow_build(ticker, uow_instance, form_type, *args):
+            builds.append(ticker)
+            release.wait(5)
+            return f"{ticker}-{form_type}"
+
+        monkeypatch.setattr(service, "_build_consolidated_income_statements", slow_build)
+        stmts = EmptyStatements()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(service.get_consolidated_income_statements, "AAPL", StatementsOnlyUnitOfWork(stmts), "10-K")
+                for _ in range(3)
+            ]
+            while not builds:
+                threading.Event().wait(0.01)
+            threading.Event().wait(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == ["AAPL-10-K"] * 3
+        assert builds == ["AAPL"]
+        assert stmts.locks == [("AAPL", "10-K")]
@@ -0,0 +1,128 @@
+import pytest
+from adapters.cache import MISSING, InMemoryCache, TTLCache
+from adapters.repository import PostgresCombinedFinancialStatementsRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    def test_entries_expire_after_ttl(self):
+        """Test that entries older than the TTL are treated as misses."""
+        clock = FakeClock()
+        cache = TTLCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        clock.now = 11
+        assert cache.get("a") is MISSING
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache stays bounded by evicting the least recently used key."""
+        cache = TTLCache(max_size=2, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+
+class TestRepositoryCache:
+    @pytest.fixture(autouse=True)
+    def repository_cache(self, session_factory, make_statements):
+        self.session_factory = session_factory
+        self.make_statements = make_statements
+        self.cache = InMemoryCache()
+
+    def repo(self, session):
+        return PostgresCombinedFinancialStatementsRepository(session, cache=self.cache)
+
+    def store(self, revenue: float):
+        stmt = self.make_statements("HOT", revenue)
+        session = self.session_factory()
+        repo = self.repo(session)
+        repo.delete("HOT", "10-K")
+        repo.add(stmt)
+        session.commit()
+        session.close()
+
+    def test_repeated_reads_are_served_from_memory(self):
+        """Test that a second read hits the cache and returns an independent copy."""
+        self.store(100.0)
+        first = self.repo(self.session_factory()).get("HOT", "10-K")
+        first.df.loc["Revenue", "2023-01-01:2023-12-31"] = -1.0
+        second = self.repo(self.session_factory()).get("HOT", "10-K")
+
+        assert second.df.loc["Revenue", "2023-01-01:2023-12-31"] == 100.0
+        assert self.cache.stats()["hits"] == 1
+
+    def test_income_reads_are_cached_apart_from_full_statements(self):
+        """Test that income-only reads are cached without standing in for the full statement."""
+        session = self.session_factory()
+        self.repo(session).add(self.make_statements("HOT", balance_sheet={"CashAndCashEquivalents": 5.0}))
+        session.commit()
+
+        self.repo(self.session_factory()).get_income_statement("HOT", "10-K")
+        income = self.repo(self.session_factory()).get_income_statement("HOT", "10-K")
+        full = self.repo(self.session_factory()).get("HOT", "10-K")
+
+        assert income.df.iloc[0, 0] == 100.0 and income.balance_sheet_df is None
+        assert full.balance_sheet_df.iloc[0, 0] == 5.0
+        assert self.cache.stats()["hits"] == 1
+
+    def test_writes_invalidate_cached_statements(self):
+        """Test that committing a new statement replaces the cached one."""
+        self.store(100.0)
+        self.repo(self.session_factory()).get("HOT", "10-K")
+        self.store(200.0)
+
+        assert self.repo(self.session_factory()).get("HOT", "10-K").df.iloc[0, 0] == 200.0
+
+    def test_rolled_back_writes_never_reach_the_cache(self):
+        """Test that reading back an uncommitted write does not cache it once the transaction rolls back."""
+        stmt = self.make_statements("RBK", 1.0)
+        session = self.session_factory()
+        repo = self.repo(session)
+        repo.upsert(stmt)
+        assert repo.get("RBK", "10-K") is not None
+        assert repo.get_version("RBK", "10-K") is not None
+        session.rollback()
+        session.close()
+
+        assert self.repo(self.session_factory()).get("RBK", "10-K") is None
+        assert self.repo(self.session_factory()).get_version("RBK", "10-K") is None
+
+    def test_savepoint_rollback_discards_staged_fills(self):
+        """Test that a read inside a rolled-back savepoint is not cached when the outer transaction commits."""
+        stmt = self.make_statements("SVP", 1.0)
+        session = self.session_factory()
+        repo = self.repo(session)
+        savepoint = session.begin_nested()
+        repo.upsert(stmt)
+        repo.get("SVP", "10-K")
+        savepoint.rollback()
+        session.commit()
+        session.close()
+
+        assert self.repo(self.session_factory()).get("SVP", "10-K") is None
+
+    def test_reads_of_own_writes_are_cached_after_commit(self):
+        """Test that a statement read back before commit is published to the cache by the commit."""
+        stmt = self.make_statements("OWN", 1.0)
+        session = self.session_factory()
+        repo = self.repo(session)
+        repo.upsert(stmt)
+        repo.get("OWN", "10-K")
+        assert self.cache.get("OWN", "statements:10-K") is None
+        session.commit()
+        session.close()
+
+        assert self.cache.get("OWN", "statements:10-K") is not None
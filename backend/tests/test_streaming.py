@@ -0,0 +1,104 @@
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+from entrypoints import backend
+from service_layer import service
+
+
+@pytest.fixture
+def stream_events(monkeypatch, call_app):
+    monkeypatch.setattr(backend.uow, "SqlAlchemyUnitOfWork", lambda: None)
+    monkeypatch.setattr(service, "validate_company_exists", lambda ticker: True)
+    monkeypatch.setattr(service, "get_ticker_from_name_or_ticker", lambda ticker: ticker)
+    monkeypatch.setattr(service, "record_company_lookup", lambda ticker: None)
+
+    def stream(build, params=None):
+        monkeypatch.setattr(service, "get_consolidated_income_statements", build)
+        response = call_app(lambda client: client.get(
+            "/api/financial/income/STRM/stream", params={"form_type": "10-K", **(params or {})},
+            headers={"Authorization": "Bearer token", "Accept-Encoding": "gzip"}
+        ))
+        return response, [json.loads(line) for line in response.text.splitlines()]
+    return stream
+
+
+class TestIncomeStream:
+    def test_stage_events_arrive_in_order_before_result(self, stream_events, make_statements):
+        """Test that build progress is streamed as NDJSON, partial table first and the result last."""
+        def build(ticker, uow, form_type=None, progress=None, **kwargs):
+            progress("filings_listed", {"form": "10-K", "count": 2})
+            progress("filing_loaded", {"form": "10-K", "accession_number": "0001", "has_data": True})
+            progress("partial", {"form": "10-K", "accession_number": "0001",
+                                 "table": pd.DataFrame({"2023-01-01:2023-12-31": [100.0]}, index=["Revenue"])})
+            progress("mapping_done", {"filings": 2, "degraded": False})
+            progress("stored", {})
+            stmt = make_statements(ticker)
+            stmt.df["2022-01-01:2022-12-31"] = [90.0]
+            return stmt
+
+        response, events = stream_events(build, params={"format": "columnar"})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("application/x-ndjson")
+        assert response.headers["Content-Encoding"] == "identity"
+        assert [event["event"] for event in events] == [
+            "started", "filings_listed", "filing_loaded", "partial", "mapping_done", "stored", "result"
+        ]
+        assert events[3]["table"] == {"periods": ["2023-01-01:2023-12-31"], "metrics": ["Revenue"], "values": [[100.0]]}
+        assert events[-1]["statements"]["periods"] == ["2022-01-01:2022-12-31", "2023-01-01:2023-12-31"]
+
+    def test_failed_build_ends_with_error_event(self, stream_events):
+        """Test that a build that raises mid-stream closes the stream with an error event."""
+        def build(ticker, uow, form_type=None, progress=None, **kwargs):
+            progress("filings_listed", {"form": "10-K", "count": 1})
+            raise RuntimeError("SEC API unavailable")
+
+        response, events = stream_events(build)
+
+        assert response.status_code == 200
+        assert [event["event"] for event in events] == ["started", "filings_listed", "error"]
+        assert "SEC API unavailable" in events[-1]["detail"]
+
+
+    def test_builds_wait_for_a_shared_build_slot(self, monkeypatch, make_statements, call_app):
+        """Test that a streamed build does not start while every build slot is taken."""
+        calls = []
+
+        def build(ticker, uow, **kwargs):
+            calls.append(ticker)
+            return make_statements(ticker)
+
+        monkeypatch.setattr(backend.uow, "SqlAlchemyUnitOfWork", lambda: None)
+        monkeypatch.setattr(service, "validate_company_exists", lambda ticker: True)
+        monkeypatch.setattr(service, "get_ticker_from_name_or_ticker", lambda ticker: ticker)
+        monkeypatch.setattr(service, "record_company_lookup", lambda ticker: None)
+        monkeypatch.setattr(service, "get_consolidated_income_statements", build)
+        monkeypatch.setattr(backend, "build_slots", asyncio.Semaphore(1))
+
+        async def scenario(client):
+            await backend.build_slots.acquire()
+            request = asyncio.ensure_future(client.get(
+                "/api/financial/income/STRM/stream", headers={"Authorization": "Bearer token"}
+            ))
+            await asyncio.sleep(0.2)
+            waiting_calls = list(calls)
+            backend.build_slots.release()
+            return waiting_calls, await request
+
+        waiting_calls, response = call_app(scenario)
+
+        assert waiting_calls == []
+        assert calls == ["STRM"]
+        assert json.loads(response.text.splitlines()[-1])["event"] == "result"
+
+
+class TestReportProgress:
+    def test_callback_errors_do_not_break_the_build(self):
+        """Test that an exception raised by a progress callback is swallowed."""
+        def failing_progress(stage, data):
+            raise RuntimeError("client went away")
+
+        service._report_progress(failing_progress, "stored")
+        service._report_progress(None, "stored")
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import select
+from adapters.orm import ReadableNameORM
+from service_layer import uow as uow_mod
+
+
+class TestSharedAdapters:
+    def test_adapters_are_created_lazily_and_shared(self, session_factory):
+        """Test that entering a unit of work builds no adapters and later entries reuse them."""
+        built = []
+        shared = uow_mod.SharedAdapters({"llm": lambda: built.append("llm") or object()})
+
+        with uow_mod.SqlAlchemyUnitOfWork(session_factory, shared) as first:
+            assert built == []
+            llm = first.llm
+        with uow_mod.SqlAlchemyUnitOfWork(session_factory, shared) as second:
+            assert second.llm is llm
+
+        assert built == ["llm"]
+
+    def test_assigned_adapter_overrides_shared_one(self, session_factory):
+        """Test that a unit of work can still be given its own adapter."""
+        shared = uow_mod.SharedAdapters({"sec_filings": object})
+        uow_instance = uow_mod.SqlAlchemyUnitOfWork(session_factory, shared)
+        replacement = object()
+
+        uow_instance.sec_filings = replacement
+
+        assert uow_instance.sec_filings is replacement
+        assert shared.created() == []
+
+
+class TestReentrantUnitOfWork:
+    @pytest.fixture(autouse=True)
+    def counting_uow(self, session_factory):
+        self.sessions = []
+
+        def counting_factory():
+            session = session_factory()
+            self.sessions.append(session)
+            return session
+
+        self.uow = uow_mod.SqlAlchemyUnitOfWork(counting_factory, uow_mod.SharedAdapters({}))
+
+    def stored_tags(self):
+        with self.uow as uow_instance:
+            return sorted(uow_instance.session.scalars(select(ReadableNameORM.tag)))
+
+    def test_nested_entries_share_one_session(self):
+        """Test that nested service calls reuse the outer session and commit at the outer boundary."""
+        with self.uow as outer:
+            with self.uow as inner:
+                inner.session.add(ReadableNameORM(tag="Revenue"))
+                inner.commit()
+                assert inner.session is outer.session
+
+        assert len(self.sessions) == 1
+        assert self.stored_tags() == ["Revenue"]
+
+    def test_nested_rollback_keeps_outer_work(self):
+        """Test that a failing nested call only undoes its own changes."""
+        with self.uow as outer:
+            outer.session.add(ReadableNameORM(tag="Revenue"))
+            with self.uow as inner:
+                inner.session.add(ReadableNameORM(tag="CostOfRevenue"))
+                inner.rollback()
+
+        assert self.stored_tags() == ["Revenue"]
@@ -0,0 +1,211 @@
+import json
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+from adapters import usage_store
+from adapters.cache import RespConnection
+from adapters.usage_store import InMemoryUsageStore, RespUsageStore
+from entrypoints import backend
+from service_layer import service
+
+
+class StandInCounterServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInCounterHandler)
+        self.counters = {}
+        self.ttls = {}
+        self.lock = threading.Lock()
+        self.connections = []
+        self.reply_delay = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.server_address[1]}/0"
+
+
+class StandInCounterHandler(socketserver.StreamRequestHandler):
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        server = self.server
+        server.connections.append(self.request)
+        while True:
+            command = self.read_command()
+            if command is None:
+                return
+            name = command[0].upper()
+            with server.lock:
+                if name == b"INCRBY":
+                    server.counters[command[1]] = server.counters.get(command[1], 0) + int(command[2])
+                    reply = b":%d\r\n" % server.counters[command[1]]
+                elif name == b"SET":
+                    options = [option.upper() for option in command[3:]]
+                    if b"NX" in options and command[1] in server.counters:
+                        reply = b"$-1\r\n"
+                    else:
+                        server.counters[command[1]] = int(command[2])
+                        if b"EX" in options:
+                            server.ttls[command[1]] = int(command[3 + options.index(b"EX") + 1])
+                        elif b"KEEPTTL" not in options:
+                            server.ttls.pop(command[1], None)
+                        reply = b"+OK\r\n"
+                elif name == b"GET":
+                    value = server.counters.get(command[1])
+                    reply = b"$-1\r\n" if value is None else b"$%d\r\n%d\r\n" % (len(str(value)), value)
+                else:
+                    reply = b"+OK\r\n"
+            time.sleep(server.reply_delay)
+            try:
+                self.wfile.write(reply)
+                self.wfile.flush()
+            except OSError:
+                return
+
+
+@pytest.fixture
+def counter_server():
+    server = StandInCounterServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestInMemoryUsageStore:
+    def test_counters_expire_after_window(self):
+        """Test that a counter resets once its window has elapsed."""
+        now = [0.0]
+        store = InMemoryUsageStore(window_seconds=60, clock=lambda: now[0])
+
+        assert store.increment("1.2.3.4") == 1
+        assert store.increment("1.2.3.4") == 2
+        now[0] += 61
+
+        assert store.get("1.2.3.4") == 0
+        assert store.increment("1.2.3.4") == 1
+
+    def test_memory_stays_bounded_under_many_clients(self):
+        """Test that distinct clients beyond max_keys evict the least recently used counters."""
+        store = InMemoryUsageStore(max_keys=100)
+        for client in range(10000):
+            store.increment(f"10.0.{client // 256}.{client % 256}")
+
+        assert store.stats()["size"] == 100
+        assert store.stats()["evictions"] == 9900
+
+    def test_refund_never_goes_negative(self):
+        """Test that decrementing an unknown or exhausted counter stays at zero without storing it."""
+        store = InMemoryUsageStore()
+
+        assert store.increment("1.2.3.4", -1) == 0
+        assert store.stats()["size"] == 0
+        store.increment("5.6.7.8")
+        assert store.increment("5.6.7.8", -2) == 0
+
+
+class TestRespUsageStore:
+    def test_instances_share_counters_with_expiry(self, counter_server):
+        """Test that two instances increment the same counter and set its window once."""
+        first = RespUsageStore(RespConnection.from_url(counter_server.url), InMemoryUsageStore(window_seconds=600))
+        second = RespUsageStore(RespConnection.from_url(counter_server.url), InMemoryUsageStore(window_seconds=600))
+
+        assert first.increment("1.2.3.4") == 1
+        assert second.increment("1.2.3.4") == 2
+        assert first.get("1.2.3.4") == 2
+        assert counter_server.ttls == {b"equityalchemy:usage:1.2.3.4": 600}
+
+    def test_refunds_keep_the_window_and_never_go_negative(self, counter_server):
+        """Test that a refund on a missing counter leaves it at zero with its window set."""
+        store = RespUsageStore(RespConnection.from_url(counter_server.url), InMemoryUsageStore(window_seconds=600))
+
+        assert store.increment("1.2.3.4", -1) == 0
+        assert counter_server.counters == {b"equityalchemy:usage:1.2.3.4": 0}
+        assert counter_server.ttls == {b"equityalchemy:usage:1.2.3.4": 600}
+        assert store.increment("1.2.3.4") == 1
+
+    def test_slow_replies_are_not_resent(self, counter_server):
+        """Test that a reply timing out after the increment was sent falls back locally instead of charging twice."""
+        counter_server.reply_delay = 0.2
+        store = RespUsageStore(RespConnection.from_url(counter_server.url, timeout=0.1), InMemoryUsageStore())
+
+        assert store.increment("1.2.3.4") == 1
+        time.sleep(0.6)
+        assert counter_server.counters == {b"equityalchemy:usage:1.2.3.4": 1}
+        assert store.stats()["errors"] == 1
+
+    def test_connections_closed_by_the_server_are_reopened(self, counter_server):
+        """Test that an idle connection the server has closed is replaced before the next command is sent."""
+        store = RespUsageStore(RespConnection.from_url(counter_server.url), InMemoryUsageStore())
+        assert store.increment("1.2.3.4") == 1
+
+        for connection in counter_server.connections:
+            connection.shutdown(socket.SHUT_RDWR)
+        time.sleep(0.05)
+
+        assert store.increment("1.2.3.4") == 2
+        assert store.stats()["errors"] == 0
+
+    def test_unreachable_server_counts_locally(self):
+        """Test that a missing usage server falls back to the bounded local store."""
+        store = RespUsageStore(RespConnection("127.0.0.1", 1, timeout=0.1), InMemoryUsageStore())
+
+        assert store.increment("1.2.3.4") == 1
+        assert store.increment("1.2.3.4") == 2
+        assert store.stats()["errors"] == 1
+
+
+class TestFreeQueryMiddleware:
+    def test_anonymous_clients_get_one_successful_query(self, monkeypatch, make_statements, call_app):
+        """Test that only successful responses use up the free query and later ones are rejected."""
+        monkeypatch.setattr(usage_store, "_usage_store", InMemoryUsageStore())
+        monkeypatch.setattr(service, "validate_company_exists", lambda ticker: ticker != "NOPE")
+        monkeypatch.setattr(service, "get_ticker_from_name_or_ticker", lambda ticker: ticker)
+        monkeypatch.setattr(service, "record_company_lookup", lambda ticker: None)
+        monkeypatch.setattr(backend.uow, "SqlAlchemyUnitOfWork", lambda: None)
+
+        def build(ticker, uow, **kwargs):
+            if ticker == "FAIL":
+                raise RuntimeError("SEC API unavailable")
+            if ticker == "EMPTY":
+                return None
+            return make_statements(ticker)
+
+        monkeypatch.setattr(service, "get_consolidated_income_statements", build)
+
+        async def scenario(client):
+            unknown = await client.get("/api/financial/income/NOPE/stream")
+            failed = await client.get("/api/financial/income/FAIL/stream")
+            empty = await client.get("/api/financial/income/EMPTY/stream")
+            served = await client.get("/api/financial/income/FREE/stream")
+            rejected = await client.get("/api/financial/income/FREE/stream")
+            signed_in = await client.get("/api/financial/income/NOPE/stream", headers={"Authorization": "Bearer token"})
+            status = await client.get("/api/free-query-status")
+            return unknown, failed, empty, served, rejected, signed_in, status
+
+        unknown, failed, empty, served, rejected, signed_in, status = call_app(scenario)
+
+        assert unknown.status_code == 422
+        assert json.loads(failed.text.splitlines()[-1])["event"] == "error"
+        assert json.loads(empty.text.splitlines()[-1])["event"] == "error"
+        assert served.status_code == 200
+        assert json.loads(served.text.splitlines()[-1])["event"] == "result"
+        assert served.headers["X-Remaining-Free-Queries"] == "0"
+        assert rejected.status_code == 401
+        assert rejected.headers["X-Free-Limit-Exceeded"] == "true"
+        assert signed_in.status_code == 422
+        assert status.json() == {"free_queries_used": 1, "free_queries_remaining": 0, "has_free_queries": False}
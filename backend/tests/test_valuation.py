@@ -51,3 +51,30 @@ class TestParseNumericFromDfValue:
         value = "-"
         result = service._parse_numeric_from_df_value(value)
         assert result is None
+
+
+class TestComputeValuations:
+    def test_matches_scalar_valuation_per_row(self):
+        """Test that the vectorized valuation agrees with compute_valuation for every ticker."""
+        import pandas as pd
+        from domain.valuation import ValuationInputs, compute_valuation, compute_valuations
+
+        rows = {
+            "AAA": dict(price=10.0, shares_outstanding=1000, cash_and_cash_equivalents=500.0, short_term_investments=50.0,
+                        short_term_debt_and_current_maturities=100.0, long_term_debt=2000.0, lease_liabilities_current=10.0,
+                        lease_liabilities_noncurrent=40.0, preferred_stock=5.0, noncontrolling_interest=7.0),
+            "BBB": dict(price=None, shares_outstanding=200, cash_and_cash_equivalents=1.0, short_term_investments=0.0,
+                        short_term_debt_and_current_maturities=0.0, long_term_debt=3.0, lease_liabilities_current=0.0,
+                        lease_liabilities_noncurrent=0.0, preferred_stock=0.0, noncontrolling_interest=0.0),
+        }
+
+        results = compute_valuations(pd.DataFrame.from_dict(rows, orient="index"))
+
+        for ticker, inputs in rows.items():
+            expected = compute_valuation(ValuationInputs(**inputs))
+            assert results.loc[ticker, "total_debt"] == expected.total_debt
+            assert results.loc[ticker, "net_debt"] == expected.net_debt
+            if expected.enterprise_value is None:
+                assert pd.isna(results.loc[ticker, "enterprise_value"])
+            else:
+                assert results.loc[ticker, "enterprise_value"] == expected.enterprise_value
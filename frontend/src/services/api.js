@@ -32,12 +32,55 @@ export const getFreeQueryStatus = async () => {
   return api.get('/api/free-query-status');
 };
 
+const BUILD_JOB_POLL_INTERVAL_MS = 2000;
+const BUILD_JOB_TIMEOUT_MS = 10 * 60 * 1000;
+
+const waitForBuildJob = async (statusUrl) => {
+  const deadline = Date.now() + BUILD_JOB_TIMEOUT_MS;
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, BUILD_JOB_POLL_INTERVAL_MS));
+    const { data: job } = await api.get(statusUrl);
+    if (job.status === 'succeeded' || job.status === 'failed') {
+      return job;
+    }
+  }
+  return { status: 'failed', error: 'Timed out waiting for financial statements to be built' };
+};
+
+const fromColumnar = (response) => {
+  const { ticker, form_type, periods, metrics, values } = response.data;
+  response.data = {
+    ticker,
+    form_type,
+    periods,
+    metrics: metrics.map((name, row) => ({
+      name,
+      values: Object.fromEntries(
+        periods
+          .map((period, column) => [period, values[row][column]])
+          .filter(([, value]) => value !== null)
+      ),
+    })),
+  };
+  return response;
+};
+
 export const getIncomeStatements = async (ticker, formType = null) => {
-  let url = `/api/financial/income/${ticker}`;
+  const params = { format: 'columnar' };
   if (formType) {
-    url += `?form_type=${formType}`;
+    params.form_type = formType;
   }
-  return api.get(url);
+  const url = `/api/financial/income/${ticker}`;
+  const response = await api.get(url, { params });
+  if (response.status !== 202) {
+    return fromColumnar(response);
+  }
+
+  const job = await waitForBuildJob(response.data.status_url);
+  if (job.status === 'failed') {
+    throw new Error(job.error || `Could not build financial statements for ${ticker}`);
+  }
+  return fromColumnar(await api.get(url, { params }));
 };
 
 export const forecastFinancialData = async (ticker, formType = null, forecastYears = 10) => {
@@ -81,3 +124,12 @@ export const getValuation = (ticker, formType = "10-K") => {
 };
 
 export default api;
+
+export const getFinancialBatch = (tickers, resources = ['income', 'prices', 'valuation'], formType = null, days = 30) => {
+  return api.post('/api/financial/batch', {
+    tickers,
+    resources,
+    form_type: formType,
+    days,
+  });
+};